@@ -0,0 +1,11 @@
+"""
+Benchmarks de rendimiento de Block Maze (sin ventana ni audio).
+
+    python -m benchmarks run -o benchmarks/baseline.json     # medir y guardar
+    python -m benchmarks run --compare benchmarks/baseline.json
+    python -m benchmarks compare baseline.json actual.json --threshold 0.15
+
+Cada caso se mide con calentamiento y varias rondas; el JSON guarda la
+mediana, el mínimo y la media por operación. ``compare`` marca como
+regresión los casos cuya mediana empeora más que el umbral.
+"""
@@ -0,0 +1,122 @@
+"""
+Línea de comandos de los benchmarks (ver ``benchmarks/__init__.py``).
+
+Cada resolución se mide en un subproceso propio: WIDTH/HEIGHT se resuelven
+una sola vez por proceso al importar la configuración del juego.
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import asdict
+
+from benchmarks import harness
+
+RESULT_MARKER = 'BENCH-RESULT '
+
+
+def _resolution(text: str):
+    width, height = text.lower().split('x')
+    return int(width), int(height)
+
+
+def _run_worker(args) -> int:
+    """Mide en este proceso los casos de una resolución e imprime cada resultado."""
+    width, height = _resolution(args.worker)
+    os.environ['ISAC_WINDOW_SIZE'] = f'{width}x{height}'
+    os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+    from isac.core.headless import enable_headless
+    enable_headless()
+    import benchmarks.cases  # noqa: F401  (registra los casos)
+    for case in harness.select(args.filter, (width, height)):
+        result = harness.measure(case, rounds=args.rounds, warmup=args.warmup)
+        print(RESULT_MARKER + json.dumps(asdict(result)), flush=True)
+    return 0
+
+
+def _resolutions_for(pattern):
+    """Resoluciones de los casos seleccionados, sin importar el juego en este proceso."""
+    os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+    import benchmarks.cases  # noqa: F401
+    seen = []
+    for case in harness.select(pattern):
+        if case.resolution not in seen:
+            seen.append(case.resolution)
+    return seen
+
+
+def _run(args) -> int:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    results = []
+    print(f"{'caso':<44} {'mediana ms':>11} {'mín ms':>10} {'rondas':>7}")
+    for width, height in _resolutions_for(args.filter):
+        cmd = [sys.executable, '-m', 'benchmarks', 'run', '--worker', f'{width}x{height}',
+               '--rounds', str(args.rounds), '--warmup', str(args.warmup)]
+        if args.filter:
+            cmd += ['-k', args.filter]
+        proc = subprocess.Popen(cmd, cwd=root, stdout=subprocess.PIPE, text=True)
+        for line in proc.stdout:
+            if not line.startswith(RESULT_MARKER):
+                continue
+            result = harness.Result(**json.loads(line[len(RESULT_MARKER):]))
+            results.append(result)
+            print(f"{result.name:<44} {result.median_ms:>11.3f} {result.min_ms:>10.3f} {result.rounds:>7}",
+                  flush=True)
+        if proc.wait() != 0:
+            print(f"El proceso de {width}x{height} terminó con código {proc.returncode}")
+            return proc.returncode
+
+    if args.output:
+        harness.write_results(args.output, results)
+        print(f"Resultados guardados en {args.output}")
+    if args.compare:
+        current = {r.name: asdict(r) for r in results}
+        baseline = harness.read_results(args.compare)
+        if args.filter:
+            baseline = {name: r for name, r in baseline.items() if args.filter in name}
+        return _report(baseline, current, args.threshold)
+    return 0
+
+
+def _report(baseline, current, threshold) -> int:
+    lines, regressions = harness.compare(baseline, current, threshold)
+    print()
+    print('\n'.join(lines))
+    if regressions:
+        print(f"\n{len(regressions)} regresiones por encima del {threshold:.0%}")
+        return 1
+    print(f"\nSin regresiones por encima del {threshold:.0%}")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description="Benchmarks de Block Maze")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    run = sub.add_parser('run', help='ejecutar los benchmarks')
+    run.add_argument('-k', '--filter', help='solo casos cuyo nombre contenga este texto')
+    run.add_argument('--rounds', type=int, default=harness.DEFAULT_ROUNDS)
+    run.add_argument('--warmup', type=int, default=harness.DEFAULT_WARMUP)
+    run.add_argument('-o', '--output', help='guardar los resultados en este JSON')
+    run.add_argument('--compare', metavar='BASELINE', help='comparar con un JSON de referencia')
+    run.add_argument('--threshold', type=float, default=harness.DEFAULT_THRESHOLD,
+                     help='empeoramiento relativo que cuenta como regresión (0.10 = 10%%)')
+    run.add_argument('--worker', help=argparse.SUPPRESS)
+
+    cmp_ = sub.add_parser('compare', help='comparar dos JSON de resultados')
+    cmp_.add_argument('baseline')
+    cmp_.add_argument('current')
+    cmp_.add_argument('--threshold', type=float, default=harness.DEFAULT_THRESHOLD)
+
+    args = parser.parse_args(argv)
+    if args.command == 'compare':
+        return _report(harness.read_results(args.baseline), harness.read_results(args.current), args.threshold)
+    if args.worker:
+        return _run_worker(args)
+    return _run(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
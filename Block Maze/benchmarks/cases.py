@@ -0,0 +1,351 @@
+"""
+Casos de benchmark. Los módulos del juego se importan dentro de cada
+preparación: el proceso que mide ya fijó el modo headless y la resolución.
+"""
+from __future__ import annotations
+import atexit
+import os
+import random
+import tempfile
+from typing import List, Tuple
+
+from benchmarks.harness import bench
+
+# Misma semilla en todas las mediciones: mismo calabozo y mismas salas
+BENCH_SEED = 20240601
+ENEMY_COUNTS = (5, 50, 500)
+ENEMY_KINDS = ('grunt', 'runner', 'brute', 'sniper', 'statue', 'monster', 'ghost')
+RESOLUTIONS = {'720p': (1280, 720), '1080p': (1920, 1080), '4k': (3840, 2160)}
+DRAW_ENEMIES = 50
+# Vida sobrada para que ningún enemigo muera durante la medición
+IMMORTAL_HP = 10 ** 9
+
+
+def _play_scene(render: bool = False):
+    from isac.core.game import HeadlessGame
+    from isac.scenes.play import PlayScene
+    game = HeadlessGame(PlayScene, render=render, seed=BENCH_SEED)
+    # Que el piso siguiente y las salas vecinas terminen de generarse antes de medir
+    game.scene.dungeon.wait_for_background()
+    return game, game.scene
+
+
+def _free_positions(room, count: int) -> List[Tuple[int, int]]:
+    """``count`` centros de celdas libres de la sala, repartidos y repetidos si hace falta."""
+    grid = room.collision_grid()
+    free = [grid.cell_center(col, row)
+            for row in range(grid.rows) for col in range(grid.cols)
+            if not grid.is_solid(col, row)]
+    rng = random.Random(BENCH_SEED)
+    rng.shuffle(free)
+    return [free[i % len(free)] for i in range(count)]
+
+
+def _populate(scene, kind: str, count: int) -> None:
+    """Sustituye los enemigos de la sala actual por ``count`` enemigos de tipo ``kind``."""
+    from isac.entities.enemy import Enemy
+    from isac.settings import ENEMY_TYPES
+    cfg = ENEMY_TYPES[kind]
+    room = scene.dungeon.get_room()
+    enemies = [Enemy(x, y, hp=IMMORTAL_HP, speed_scale=float(cfg.get('speed_scale', 1.0)),
+                     color=cfg['color'], kind=kind)
+               for x, y in _free_positions(room, count)]
+    room.enemies = enemies
+    room.spawned = True
+    room.cleared = False
+    scene.enemies = list(enemies)
+    scene.enemy_hash.clear()
+    scene.enemy_hash.sync(scene.enemies)
+
+
+def _keep_alive(scene) -> None:
+    # Curar en cada tick: tras un golpe hay invulnerabilidad, así que nunca llega a 0.
+    # (No subir max_hp: el HUD dibuja un corazón por punto de vida.)
+    scene.player.hp = scene.player.max_hp
+
+
+# ---------------- Generación ----------------
+
+@bench('generation/base_pattern', iterations=200)
+def _base_pattern():
+    from isac.core.room import _generate_random_base_pattern, ROOM_SIZE
+    rng = random.Random(BENCH_SEED)
+    return lambda: _generate_random_base_pattern(ROOM_SIZE, rng)
+
+
+def _dungeon_case(size: int, num_rooms: int):
+    from isac.core.dungeon import Dungeon
+    dungeon = Dungeon(seed=BENCH_SEED, prefetch=False)
+    return lambda: dungeon.generate_dungeon(size=size, num_rooms=num_rooms)
+
+
+@bench('generation/dungeon_5x5_10_rooms', iterations=10)
+def _dungeon_small():
+    return _dungeon_case(5, 10)
+
+
+@bench('generation/dungeon_8x8_20_rooms', iterations=5)
+def _dungeon_large():
+    return _dungeon_case(8, 20)
+
+
+# Calabozo enorme: el tiempo por sala debe mantenerse casi constante de 1k a 100k salas
+def _huge_dungeon_case(num_rooms: int):
+    from isac.core.dungeon import Dungeon, huge_dungeon_size
+    dungeon = Dungeon(seed=BENCH_SEED, prefetch=False, huge=True)
+    size = huge_dungeon_size(num_rooms)
+    return lambda: dungeon.generate_dungeon(size=size, num_rooms=num_rooms)
+
+
+@bench('generation/huge_dungeon_1k_rooms', iterations=3)
+def _huge_dungeon_1k():
+    return _huge_dungeon_case(1_000)
+
+
+@bench('generation/huge_dungeon_10k_rooms')
+def _huge_dungeon_10k():
+    return _huge_dungeon_case(10_000)
+
+
+@bench('generation/huge_dungeon_100k_rooms')
+def _huge_dungeon_100k():
+    return _huge_dungeon_case(100_000)
+
+
+# ---------------- Colisión ----------------
+
+def _bench_room():
+    from isac.core.room import Room
+    return Room((1, 0), seed=BENCH_SEED)
+
+
+@bench('collision/obstacles_build', iterations=500)
+def _obstacles_build():
+    room = _bench_room()
+
+    def op():
+        room._geometry_source = None  # forzar la reconstrucción desde el patrón
+        room.obstacles()
+    return op
+
+
+@bench('collision/obstacles_cached', iterations=10000)
+def _obstacles_cached():
+    room = _bench_room()
+    return room.obstacles
+
+
+def _query_rects(count: int = 1000):
+    import pygame
+    from isac.settings import WIDTH, HEIGHT, PLAYER_SIZE
+    rng = random.Random(BENCH_SEED)
+    return [pygame.Rect(rng.randrange(WIDTH), rng.randrange(HEIGHT), PLAYER_SIZE, PLAYER_SIZE)
+            for _ in range(count)]
+
+
+@bench('collision/grid_collides_x1000', iterations=20)
+def _grid_collides():
+    room = _bench_room()
+    grid = room.collision_grid()
+    rects = _query_rects()
+
+    def op():
+        for r in rects:
+            grid.collides(r)
+    return op
+
+
+@bench('collision/rect_collidelist_x1000', iterations=20)
+def _rect_collidelist():
+    room = _bench_room()
+    solids = list(room.walls()) + list(room.obstacles())
+    rects = _query_rects()
+
+    def op():
+        for r in rects:
+            r.collidelist(solids)
+    return op
+
+
+@bench('collision/flow_field_rebuild', iterations=50)
+def _flow_field_rebuild():
+    room = _bench_room()
+    flow = room.flow_field()
+    grid = flow.grid
+    free = [grid.cell_center(col, row) for row in range(grid.rows) for col in range(grid.cols)
+            if not grid.is_solid(col, row)]
+    targets = iter(free * 1000)
+
+    def op():
+        flow.update(*next(targets))  # cada llamada cambia de celda: BFS completa
+    return op
+
+
+# ---------------- PlayScene.update ----------------
+
+def _update_case(kind: str, count: int):
+    def setup():
+        game, scene = _play_scene(render=False)
+        _populate(scene, kind, count)
+
+        def op():
+            _keep_alive(scene)
+            scene.update(game.sim_dt)
+        return op
+    return setup
+
+
+for _kind in ENEMY_KINDS:
+    for _count in ENEMY_COUNTS:
+        bench(f'update/{_kind}/{_count}', iterations=max(2, 200 // _count))(_update_case(_kind, _count))
+
+
+# ---------------- PlayScene.draw ----------------
+
+def _draw_case(full: bool):
+    def setup():
+        game, scene = _play_scene(render=True)
+        _populate(scene, 'grunt', DRAW_ENEMIES)
+        scene.update(game.sim_dt)
+
+        def op():
+            _keep_alive(scene)
+            if full:
+                scene.dirty.invalidate()  # sin rects sucios: pantalla completa
+            else:
+                scene.update(game.sim_dt)
+            scene.draw(game.screen)
+        return op
+    return setup
+
+
+for _label, _size in RESOLUTIONS.items():
+    bench(f'draw/{_label}/full', iterations=10, resolution=_size)(_draw_case(True))
+    bench(f'draw/{_label}/update+dirty', iterations=10, resolution=_size)(_draw_case(False))
+
+
+def _flash_case():
+    """DRAW_ENEMIES enemigos con el destello de daño activo y el jugador invulnerable."""
+    def setup():
+        game, scene = _play_scene(render=True)
+        _populate(scene, 'grunt', DRAW_ENEMIES)
+
+        def op():
+            for enemy in scene.enemies:
+                enemy.hurt_timer = 0.12
+                enemy.draw(game.screen)
+            scene.player.invuln = 0.5
+            scene.player.draw(game.screen)
+        return op
+    return setup
+
+
+bench('draw/hurt_flash', iterations=50)(_flash_case())
+
+
+# ---------------- Mapa ----------------
+
+def _map_case(full: bool, move: bool):
+    """
+    Mapa de un calabozo de 10.000 salas: frame sin cambios o entrando en una sala
+    nueva. Como en PlayScene, ``damaged`` vacío: nada se pintó encima del mapa.
+    """
+    def setup():
+        from isac.core.dungeon import Dungeon
+        from isac.core.map import MapViewer
+        game, _ = _play_scene(render=True)
+        dungeon = Dungeon.huge_dungeon(10_000, seed=BENCH_SEED, prefetch=False)
+        viewer = MapViewer(dungeon, cell_size=20, margin=3, corner=True)
+        viewer.visible = full
+        viewer.draw(game.screen)
+        rng = random.Random(BENCH_SEED)
+
+        def op():
+            if move:
+                room = dungeon.get_room()
+                direction = rng.choice([d for d, door in room.doors.items() if door.exists])
+                room.doors[direction].open = True
+                dungeon.move_through(direction)
+            viewer.draw(game.screen, damaged=[])
+        return op
+    return setup
+
+
+bench('map/corner_frame', iterations=1000)(_map_case(False, False))
+bench('map/corner_room_entry', iterations=200)(_map_case(False, True))
+bench('map/full_frame', iterations=200)(_map_case(True, False))
+bench('map/full_room_entry', iterations=100)(_map_case(True, True))
+
+
+# ---------------- HUD ----------------
+
+def _hud_case(changing: bool):
+    """HUD (vida, magia, puntos e inventario): frame sin cambios o con la magia cambiando cada frame."""
+    def setup():
+        from isac.settings import MAGIC_MAX
+        game, scene = _play_scene(render=True)
+        scene.draw_hud(game.screen)
+        scene.draw_inventory_slots(game.screen)
+
+        def op():
+            if changing:
+                scene.player.magic = (scene.player.magic + 1) % (MAGIC_MAX + 1)
+            scene.draw_hud(game.screen)
+            scene.draw_inventory_slots(game.screen)
+        return op
+    return setup
+
+
+bench('hud/steady_frame', iterations=1000)(_hud_case(False))
+bench('hud/changing_frame', iterations=200)(_hud_case(True))
+
+
+# ---------------- Precarga ----------------
+
+PRELOAD_TIMEOUT = 10.0
+
+
+@bench('preload/with_failures', iterations=5)
+def _preload_failures():
+    """
+    Precarga con rutas que fallan (inexistente, archivo corrupto y una que hace
+    fallar al hilo con un error inesperado): la carga tiene que terminar igual.
+    """
+    import time
+    from isac.core.preload import AssetPreloader, build_manifest
+    fd, corrupt = tempfile.mkstemp(suffix='.png', prefix='isac-bench-')
+    os.write(fd, b'no es un png')
+    os.close(fd)
+    atexit.register(os.remove, corrupt)
+    bad = ['assets/no-existe.png', corrupt, None]
+    paths = build_manifest()[:8] + bad
+
+    def op():
+        preloader = AssetPreloader(paths)
+        preloader.start()
+        deadline = time.perf_counter() + PRELOAD_TIMEOUT
+        while not preloader.done:
+            if time.perf_counter() > deadline:
+                raise RuntimeError(f"la precarga no terminó: {preloader.loaded}/{preloader.total}")
+            preloader.drain()
+            time.sleep(0.001)
+        missing = set(bad) - set(preloader.failed)
+        if missing:
+            raise RuntimeError(f"rutas fallidas sin resultado de error: {missing}")
+    return op
+
+
+# ---------------- Persistencia ----------------
+
+@bench('persistence/save_load_roundtrip', iterations=50)
+def _save_load():
+    from isac.core.persistence import save_game, load_game
+    game, scene = _play_scene(render=False)
+    fd, path = tempfile.mkstemp(suffix='.json', prefix='isac-bench-')
+    os.close(fd)
+    atexit.register(os.remove, path)
+
+    def op():
+        save_game(path, scene.player, scene.inventory, scene.dungeon)
+        load_game(path, scene.player, scene.inventory, scene.dungeon)
+    return op
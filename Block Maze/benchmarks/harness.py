@@ -0,0 +1,143 @@
+"""
+Registro de casos, medición y comparación de resultados.
+
+Un caso es una función de preparación decorada con ``@bench`` que devuelve
+la operación a medir (un callable sin argumentos). La preparación no cuenta
+en el tiempo; la operación se ejecuta ``iterations`` veces por ronda.
+"""
+from __future__ import annotations
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Resolución por defecto de los casos que no fijan una (ver ISAC_WINDOW_SIZE)
+DEFAULT_RESOLUTION = (1280, 720)
+DEFAULT_ROUNDS = 5
+DEFAULT_WARMUP = 1
+DEFAULT_THRESHOLD = 0.10
+# Diferencias absolutas menores que esto son ruido del reloj, no regresiones
+NOISE_FLOOR_MS = 0.005
+
+
+@dataclass
+class Case:
+    name: str
+    setup: Callable[[], Callable[[], None]]
+    iterations: int = 1
+    resolution: Tuple[int, int] = DEFAULT_RESOLUTION
+
+
+@dataclass
+class Result:
+    """Tiempos por operación, en milisegundos."""
+    name: str
+    rounds: int
+    iterations: int
+    median_ms: float
+    min_ms: float
+    mean_ms: float
+    stdev_ms: float
+
+
+CASES: List[Case] = []
+
+
+def bench(name: str, iterations: int = 1, resolution: Tuple[int, int] = DEFAULT_RESOLUTION):
+    """Registra la función decorada como preparación del caso ``name``."""
+    def register(setup: Callable[[], Callable[[], None]]):
+        CASES.append(Case(name, setup, iterations, resolution))
+        return setup
+    return register
+
+
+def select(pattern: Optional[str] = None, resolution: Optional[Tuple[int, int]] = None) -> List[Case]:
+    cases = CASES
+    if pattern:
+        cases = [c for c in cases if pattern in c.name]
+    if resolution is not None:
+        cases = [c for c in cases if c.resolution == resolution]
+    return cases
+
+
+def measure(case: Case, rounds: int = DEFAULT_ROUNDS, warmup: int = DEFAULT_WARMUP) -> Result:
+    op = case.setup()
+    for _ in range(warmup * case.iterations):
+        op()
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(case.iterations):
+            op()
+        samples.append((time.perf_counter() - start) * 1000.0 / case.iterations)
+    return Result(
+        name=case.name,
+        rounds=rounds,
+        iterations=case.iterations,
+        median_ms=statistics.median(samples),
+        min_ms=min(samples),
+        mean_ms=statistics.fmean(samples),
+        stdev_ms=statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    )
+
+
+def environment() -> dict:
+    try:
+        import pygame
+        pygame_version = pygame.version.ver
+    except Exception:
+        pygame_version = None
+    return {
+        'python': sys.version.split()[0],
+        'pygame': pygame_version,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'date': time.strftime('%Y-%m-%d %H:%M:%S'),
+    }
+
+
+def write_results(path: str, results: List[Result]) -> None:
+    data = {
+        'environment': environment(),
+        'results': {r.name: asdict(r) for r in results},
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def read_results(path: str) -> Dict[str, dict]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f).get('results', {})
+
+
+def compare(baseline: Dict[str, dict], current: Dict[str, dict],
+            threshold: float = DEFAULT_THRESHOLD) -> Tuple[List[str], List[str]]:
+    """
+    Compara medianas caso a caso. Devuelve (líneas del informe, casos con
+    regresión): un caso regresa si su mediana supera la base en más de ``threshold``.
+    """
+    lines = [f"{'caso':<44} {'base ms':>10} {'actual ms':>10} {'cambio':>8}"]
+    regressions = []
+    for name in sorted(set(baseline) | set(current)):
+        if name not in current:
+            lines.append(f"{name:<44} {'':>10} {'':>10}  (falta en actual)")
+            continue
+        if name not in baseline:
+            lines.append(f"{name:<44} {'':>10} {current[name]['median_ms']:>10.3f}  (nuevo)")
+            continue
+        base = baseline[name]['median_ms']
+        now = current[name]['median_ms']
+        change = (now - base) / base if base > 0 else 0.0
+        mark = ''
+        if abs(now - base) < NOISE_FLOOR_MS:
+            pass
+        elif change > threshold:
+            mark = '  REGRESIÓN'
+            regressions.append(name)
+        elif change < -threshold:
+            mark = '  mejora'
+        lines.append(f"{name:<44} {base:>10.3f} {now:>10.3f} {change:>+7.1%}{mark}")
+    return lines, regressions
@@ -5,6 +5,8 @@ Cada personaje tiene sus propios sprites y atributos únicos.
 import pygame
 from typing import Dict, Any, List
 
+from isac.core.assets import load_image
+
 # Configuración de personajes
 class CharacterData:
     """Clase base para los datos de los personajes."""
@@ -109,9 +111,7 @@ def load_character_sprites(character_data: CharacterData, size: tuple) -> Dict[s
     for direction in ['up', 'down', 'left', 'right']:
         if direction in character_data.sprite_paths:
             try:
-                img = pygame.image.load(character_data.sprite_paths[direction]).convert_alpha()
-                scaled_img = pygame.transform.scale(img, size)
-                sprites[direction].append(scaled_img)
+                sprites[direction].append(load_image(character_data.sprite_paths[direction], size))
             except pygame.error as e:
                 print(f"Error cargando sprite {direction} para {character_data.name}: {e}")
     
@@ -119,8 +119,7 @@ def load_character_sprites(character_data: CharacterData, size: tuple) -> Dict[s
     for special in ['happy', 'default']:
         if special in character_data.sprite_paths:
             try:
-                img = pygame.image.load(character_data.sprite_paths[special]).convert_alpha()
-                sprites[special] = pygame.transform.scale(img, size)
+                sprites[special] = load_image(character_data.sprite_paths[special], size)
             except pygame.error as e:
                 print(f"Error cargando sprite {special} para {character_data.name}: {e}")
     
@@ -0,0 +1,229 @@
+"""
+Caché central de texturas del juego.
+
+Todas las entidades y escenas piden sus imágenes a través de este módulo en
+lugar de llamar a ``pygame.image.load`` directamente. Cada superficie se
+decodifica, convierte y escala una sola vez por proceso y se reutiliza desde
+ese momento. La caché se indexa por (ruta, tamaño, modo de conversión) y
+expulsa las entradas menos usadas cuando se supera el presupuesto de memoria.
+
+``tinted`` y ``with_alpha`` dan variantes ya compuestas de un sprite (el
+destello de daño, el tinte de carga, la transparencia del fantasma...): se
+crean la primera vez que se piden y luego dibujarlas es un único blit.
+"""
+from __future__ import annotations
+import os
+import weakref
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+from isac.settings import ASSET_CACHE_BUDGET_MB
+
+# Modos de conversión admitidos
+CONVERT_ALPHA = 'alpha'  # convert_alpha(): sprites con transparencia
+CONVERT_OPAQUE = 'opaque'  # convert(): fondos sin canal alfa
+CONVERT_NONE = 'none'  # superficie tal cual sale del decodificador
+
+CacheKey = Tuple[str, Optional[Tuple[int, int]], str]
+
+
+def _surface_bytes(surface: pygame.Surface) -> int:
+    """Tamaño aproximado en memoria de una superficie."""
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+class AssetCache:
+    """Caché LRU de superficies limitada por memoria."""
+
+    def __init__(self, budget_bytes: int) -> None:
+        self.budget_bytes = budget_bytes
+        self._entries: "OrderedDict[CacheKey, pygame.Surface]" = OrderedDict()
+        self._used_bytes = 0
+        # Rutas que no se pudieron cargar (evita volver a tocar el disco)
+        self._missing: Dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _normalize(path: str) -> str:
+        # normcase: en Windows 'Pale_Oni.png' y 'pale_oni.png' son el mismo archivo
+        return os.path.normcase(os.path.normpath(path))
+
+    def get(self, path: str, size: Optional[Tuple[int, int]] = None,
+            convert: str = CONVERT_ALPHA) -> pygame.Surface:
+        """
+        Devuelve la superficie para (path, size, convert), cargándola si hace falta.
+
+        La superficie devuelta es compartida: quien necesite modificarla
+        (set_alpha, fill, blit encima...) debe trabajar sobre una copia.
+
+        Raises:
+            pygame.error: si el archivo no existe o no se puede decodificar.
+        """
+        path = self._normalize(path)
+        key: CacheKey = (path, tuple(size) if size else None, convert)
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        if path in self._missing:
+            raise pygame.error(self._missing[path])
+
+        base = self._entries.get((path, None, convert))
+        if base is not None:
+            # Ya tenemos la versión convertida a tamaño original: solo escalar
+            surface = pygame.transform.scale(base, key[1]) if key[1] else base
+        else:
+            surface = self._finish(self._raw(path), key[1], convert)
+        if convert != CONVERT_NONE and pygame.display.get_surface() is None:
+            # Sin ventana no hay formato de píxel al que convertir; no
+            # guardamos la versión sin convertir para no servirla después.
+            return surface
+        self._store(key, surface)
+        return surface
+
+    def _raw(self, path: str) -> pygame.Surface:
+        """Superficie decodificada a tamaño original, compartida entre tamaños."""
+        raw_key: CacheKey = (path, None, CONVERT_NONE)
+        raw = self._entries.get(raw_key)
+        if raw is not None:
+            return raw
+        try:
+            raw = pygame.image.load(path)
+        except (pygame.error, FileNotFoundError) as e:
+            self._missing[path] = str(e)
+            raise pygame.error(str(e))
+        # Se guarda (dentro del presupuesto) para que otros tamaños no vuelvan a leer el disco
+        self._store(raw_key, raw)
+        return raw
+
+    @staticmethod
+    def _finish(raw: pygame.Surface, size: Optional[Tuple[int, int]], convert: str) -> pygame.Surface:
+        surface = raw
+        if pygame.display.get_surface() is not None:
+            if convert == CONVERT_ALPHA:
+                surface = surface.convert_alpha()
+            elif convert == CONVERT_OPAQUE:
+                surface = surface.convert()
+        if size and surface.get_size() != tuple(size):
+            surface = pygame.transform.scale(surface, size)
+        return surface
+
+    def adopt(self, path: str, raw: Optional[pygame.Surface], error: str = "") -> None:
+        """
+        Registra una superficie decodificada fuera del hilo principal.
+
+        Debe llamarse desde el hilo principal: aquí se hace la conversión al
+        formato de la ventana. ``raw`` es None si la carga falló; en ese caso
+        la ruta queda marcada como ausente.
+        """
+        path = self._normalize(path)
+        if raw is None:
+            self._missing[path] = error or f"No file '{path}' found"
+            return
+        self._missing.pop(path, None)
+        convert = CONVERT_ALPHA if pygame.display.get_surface() is not None else CONVERT_NONE
+        self._store((path, None, convert), self._finish(raw, None, convert))
+
+    def __contains__(self, path: str) -> bool:
+        path = self._normalize(path)
+        return any((path, None, mode) in self._entries
+                   for mode in (CONVERT_ALPHA, CONVERT_OPAQUE, CONVERT_NONE))
+
+    def _store(self, key: CacheKey, surface: pygame.Surface) -> None:
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._used_bytes -= _surface_bytes(old)
+        self._entries[key] = surface
+        self._used_bytes += _surface_bytes(surface)
+        # Expulsar las entradas menos recientes hasta entrar en el presupuesto,
+        # sin tocar nunca la que acabamos de insertar.
+        while self._used_bytes > self.budget_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self._used_bytes -= _surface_bytes(evicted)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._missing.clear()
+        self._used_bytes = 0
+
+    @property
+    def used_bytes(self) -> int:
+        return self._used_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Instancia única compartida por todo el juego
+cache = AssetCache(ASSET_CACHE_BUDGET_MB * 1024 * 1024)
+
+
+def load_image(path: str, size: Optional[Tuple[int, int]] = None,
+               convert: str = CONVERT_ALPHA) -> pygame.Surface:
+    """Atajo para ``cache.get``: carga (una sola vez) y devuelve una superficie."""
+    return cache.get(path, size, convert)
+
+
+def decode_image(path: str) -> pygame.Surface:
+    """
+    Decodifica un archivo sin convertirlo ni tocar la caché.
+
+    Es seguro llamarla desde hilos de trabajo; el resultado se entrega luego
+    a ``cache.adopt`` en el hilo principal.
+    """
+    return pygame.image.load(path)
+
+
+# ---- Variantes de sprites ----
+# Por sprite: (efecto, alpha del sprite) -> superficie. Las variantes desaparecen
+# junto con su sprite (p. ej. si la caché de texturas lo expulsa).
+_variants: "weakref.WeakKeyDictionary[pygame.Surface, Dict[tuple, pygame.Surface]]" = weakref.WeakKeyDictionary()
+
+
+def _variant(sprite: pygame.Surface, key: tuple, build, *args) -> pygame.Surface:
+    # El alpha del sprite forma parte de la clave: hay sprites a los que se les
+    # cambia después de cargarlos (Glass, fantasmas)
+    key = (key, sprite.get_alpha())
+    per_sprite = _variants.get(sprite)
+    if per_sprite is None:
+        per_sprite = _variants[sprite] = {}
+    surface = per_sprite.get(key)
+    if surface is None:
+        surface = per_sprite[key] = build(sprite, *args)
+    return surface
+
+
+def _build_tint(sprite: pygame.Surface, color: Tuple[int, int, int], alpha: int) -> pygame.Surface:
+    surface = sprite.copy()
+    overlay = pygame.Surface(surface.get_size())
+    overlay.fill(color)
+    overlay.set_alpha(alpha)
+    surface.blit(overlay, (0, 0), special_flags=pygame.BLEND_ADD)
+    return surface
+
+
+def _build_alpha(sprite: pygame.Surface, alpha: int) -> pygame.Surface:
+    surface = sprite.copy()
+    surface.set_alpha(alpha)
+    return surface
+
+
+def tinted(sprite: pygame.Surface, color: Tuple[int, int, int], alpha: int) -> pygame.Surface:
+    """
+    ``sprite`` con ``color`` sumado (BLEND_ADD) a intensidad ``alpha``: lo mismo
+    que copiarlo y volcarle encima una superficie de ese color en cada frame.
+
+    La superficie es compartida: no modificarla.
+    """
+    return _variant(sprite, ('tint', color, alpha), _build_tint, color, alpha)
+
+
+def with_alpha(sprite: pygame.Surface, alpha: int) -> pygame.Surface:
+    """Copia de ``sprite`` con transparencia global ``alpha`` (compartida: no modificarla)."""
+    return _variant(sprite, ('alpha', alpha), _build_alpha, alpha)
@@ -0,0 +1,24 @@
+"""
+Inicialización perezosa del mixer.
+
+Abrir el dispositivo de audio es de lo más lento del arranque y el menú no
+suena, así que el mixer se inicia la primera vez que una escena necesita
+sonidos. En modo headless o sin dispositivo de audio el juego sigue mudo.
+"""
+import pygame
+
+from isac.settings import HEADLESS
+
+
+def ensure_mixer() -> bool:
+    """Inicializa el mixer si hace falta; devuelve False si no hay audio disponible."""
+    if pygame.mixer.get_init():
+        return True
+    if HEADLESS:
+        return False
+    try:
+        pygame.mixer.init()
+    except pygame.error as e:
+        print(f"Audio no disponible: {e}")
+        return False
+    return True
@@ -0,0 +1,179 @@
+"""
+Índice espacial de colisiones estáticas de una sala.
+
+``CollisionGrid`` se construye a partir del mapa de caracteres de ``Room``
+(WALL_SYMBOL sólido; FLOOR_SYMBOL y 'D' libres) y responde "¿este rect toca
+algo sólido?" con una máscara de bits (``pygame.mask``) de celdas y paredes:
+cada consulta es un único ``Mask.overlap`` en C, más barato que
+``Rect.collidelist`` sobre todos los obstáculos, y su coste no depende de
+cuántos tenga la sala. Con NumPy, ``collides_many`` responde para muchos
+rects a la vez.
+"""
+from __future__ import annotations
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional (solo para collides_many)
+    np = None
+
+# Máscaras llenas por tamaño de rect consultado (hay pocos tamaños distintos)
+_PROBES: Dict[Tuple[int, int], pygame.mask.Mask] = {}
+
+
+class CollisionGrid:
+    """Rejilla de celdas sólidas alineada con los obstáculos de la sala."""
+
+    def __init__(self, room_map: Sequence[str], origin: Tuple[int, int],
+                 cell_size: Tuple[int, int], walls: Sequence[pygame.Rect] = (),
+                 solid_symbols: Iterable[str] = ('#',)) -> None:
+        self.rows = len(room_map)
+        self.cols = len(room_map[0]) if room_map else 0
+        self.origin_x, self.origin_y = origin
+        self.cell_w, self.cell_h = cell_size
+        # Paredes exteriores (4 rects fijos, fuera de la rejilla)
+        self.walls = tuple(walls)
+        # 1 = celda sólida; índice = fila * cols + columna
+        self.solid = bytearray(self.rows * self.cols)
+        # Tabla de sumas acumuladas de celdas sólidas (collides_many), se crea al primer uso
+        self._solid_sums = None
+        solid_symbols = set(solid_symbols)
+        for row_idx, row in enumerate(room_map):
+            base = row_idx * self.cols
+            for col_idx, cell in enumerate(row):
+                if cell in solid_symbols:
+                    self.solid[base + col_idx] = 1
+        self._build_masks()
+
+    # ---- Consultas por celda ----
+    def in_bounds(self, col: int, row: int) -> bool:
+        return 0 <= col < self.cols and 0 <= row < self.rows
+
+    def is_solid(self, col: int, row: int) -> bool:
+        """Las celdas fuera de la rejilla no son sólidas (las cubren las paredes)."""
+        return self.in_bounds(col, row) and self.solid[row * self.cols + col] == 1
+
+    def cell_at(self, x: float, y: float) -> Tuple[int, int]:
+        """Celda (col, fila) que contiene el punto de pantalla dado (puede quedar fuera)."""
+        return (int((x - self.origin_x) // self.cell_w), int((y - self.origin_y) // self.cell_h))
+
+    def cell_center(self, col: int, row: int) -> Tuple[int, int]:
+        return (self.origin_x + col * self.cell_w + self.cell_w // 2,
+                self.origin_y + row * self.cell_h + self.cell_h // 2)
+
+    def cell_rect(self, col: int, row: int) -> pygame.Rect:
+        return pygame.Rect(self.origin_x + col * self.cell_w, self.origin_y + row * self.cell_h,
+                           self.cell_w, self.cell_h)
+
+    def _cell_span(self, rect: pygame.Rect) -> Optional[Tuple[int, int, int, int]]:
+        """Rango de celdas [c0..c1] x [r0..r1] que solapa el rect, recortado a la rejilla."""
+        if rect.width <= 0 or rect.height <= 0 or self.cols == 0:
+            return None
+        c0 = (rect.left - self.origin_x) // self.cell_w
+        c1 = (rect.right - 1 - self.origin_x) // self.cell_w
+        r0 = (rect.top - self.origin_y) // self.cell_h
+        r1 = (rect.bottom - 1 - self.origin_y) // self.cell_h
+        if c1 < 0 or r1 < 0 or c0 >= self.cols or r0 >= self.rows:
+            return None
+        return max(0, c0), min(self.cols - 1, c1), max(0, r0), min(self.rows - 1, r1)
+
+    def cells_overlapping(self, rect: pygame.Rect) -> Iterator[Tuple[int, int]]:
+        span = self._cell_span(rect)
+        if span is None:
+            return
+        c0, c1, r0, r1 = span
+        for row in range(r0, r1 + 1):
+            for col in range(c0, c1 + 1):
+                yield col, row
+
+    # ---- Consultas por rect ----
+    def _build_masks(self) -> None:
+        """
+        Máscaras de bits a resolución de píxel en coordenadas de pantalla:
+        ``_obstacle_mask`` con las celdas sólidas y ``_solid_mask`` con celdas y
+        paredes. Consultar un rect es un único ``Mask.overlap`` (en C).
+        """
+        cw, ch = self.cell_w, self.cell_h
+        walls = [w for w in self.walls if w.width > 0 and w.height > 0]
+        area = pygame.Rect(self.origin_x, self.origin_y, self.cols * cw, self.rows * ch)
+        bounds = area.unionall(walls) if walls else area
+        # Lo que quede en coordenadas negativas no cabe en la máscara (las salas empiezan en 0, 0)
+        obstacles = pygame.mask.Mask((max(0, area.right), max(0, area.bottom)))
+        cell = pygame.mask.Mask((cw, ch), fill=True)
+        cols = self.cols
+        for i, v in enumerate(self.solid):
+            if v:
+                obstacles.draw(cell, (self.origin_x + (i % cols) * cw, self.origin_y + (i // cols) * ch))
+        solid = pygame.mask.Mask((max(0, bounds.right), max(0, bounds.bottom)))
+        solid.draw(obstacles, (0, 0))
+        for w in walls:
+            solid.draw(pygame.mask.Mask(w.size, fill=True), w.topleft)
+        self._obstacle_mask = obstacles
+        self._solid_mask = solid
+
+    @staticmethod
+    def _probe(rect: pygame.Rect) -> Optional[pygame.mask.Mask]:
+        """Máscara llena del tamaño del rect (None si está vacío)."""
+        if rect.width <= 0 or rect.height <= 0:
+            return None
+        probe = _PROBES[rect.size] = pygame.mask.Mask(rect.size, fill=True)
+        return probe
+
+    def hits_obstacle(self, rect: pygame.Rect) -> bool:
+        """True si el rect solapa alguna celda sólida de la rejilla."""
+        probe = _PROBES.get(rect.size) or self._probe(rect)
+        return probe is not None and self._obstacle_mask.overlap(probe, rect.topleft) is not None
+
+    def hits_wall(self, rect: pygame.Rect) -> bool:
+        """True si el rect toca alguna de las paredes exteriores."""
+        return rect.collidelist(self.walls) != -1
+
+    def collides(self, rect: pygame.Rect) -> bool:
+        """True si el rect toca una pared exterior o un obstáculo."""
+        probe = _PROBES.get(rect.size) or self._probe(rect)
+        return probe is not None and self._solid_mask.overlap(probe, rect.topleft) is not None
+
+    def collides_many(self, x, y, width: int, height: int):
+        """
+        ``collides`` para muchos rects del mismo tamaño a la vez (requiere NumPy).
+        ``x`` e ``y`` son arrays de enteros con la esquina superior izquierda;
+        devuelve un array de bool con el mismo resultado que ``collides`` para cada uno.
+        """
+        x = np.asarray(x, dtype=np.int64)
+        y = np.asarray(y, dtype=np.int64)
+        hit = np.zeros(x.shape, dtype=bool)
+        if width <= 0 or height <= 0:
+            return hit
+        right = x + width
+        bottom = y + height
+        # Paredes exteriores: misma prueba que Rect.colliderect
+        for w in self.walls:
+            if w.width > 0 and w.height > 0:
+                hit |= (x < w.right) & (right > w.left) & (y < w.bottom) & (bottom > w.top)
+        if self.cols == 0:
+            return hit
+        # Obstáculos: suma de celdas sólidas del rango que cubre cada rect
+        sums = self._solid_sums
+        if sums is None:
+            grid = np.frombuffer(bytes(self.solid), dtype=np.uint8).reshape(self.rows, self.cols)
+            sums = np.zeros((self.rows + 1, self.cols + 1), dtype=np.int32)
+            sums[1:, 1:] = grid.cumsum(axis=0).cumsum(axis=1)
+            self._solid_sums = sums
+        c0 = (x - self.origin_x) // self.cell_w
+        c1 = (right - 1 - self.origin_x) // self.cell_w
+        r0 = (y - self.origin_y) // self.cell_h
+        r1 = (bottom - 1 - self.origin_y) // self.cell_h
+        inside = (c1 >= 0) & (r1 >= 0) & (c0 < self.cols) & (r0 < self.rows)
+        c0 = np.clip(c0, 0, self.cols - 1)
+        c1 = np.clip(c1, 0, self.cols - 1) + 1
+        r0 = np.clip(r0, 0, self.rows - 1)
+        r1 = np.clip(r1, 0, self.rows - 1) + 1
+        count = sums[r1, c1] - sums[r0, c1] - sums[r1, c0] + sums[r0, c0]
+        return hit | (inside & (count > 0))
+
+    def solid_rects(self) -> List[pygame.Rect]:
+        """Rects de todas las celdas sólidas (para dibujar o depurar)."""
+        return [self.cell_rect(i % self.cols, i // self.cols)
+                for i, v in enumerate(self.solid) if v]
@@ -1,16 +1,176 @@
 from __future__ import annotations
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, Tuple, Set, List
+from typing import Dict, Iterator, Tuple, Set, List, Optional
+import math
+import queue
 import random
+import threading
+import time
 
 from .room import Room, Door
+from .rng import derive_seed, new_seed
+from isac.settings import DUNGEON_PREFETCH, DUNGEON_PREFETCH_REMAINING, HUGE_DUNGEON_ROOMS, HUGE_DUNGEON_DENSITY
 
+# Límites del crecimiento del calabozo entre pisos
+MAX_DUNGEON_SIZE = 8
+MAX_NUM_ROOMS = 20
 
-@dataclass
-class Door:
-    open: bool = False
-    locked: bool = False
-    exists: bool = True  # Indica si la puerta existe (si hay una habitación del otro lado)
+# Desplazamiento de cada dirección (mismo orden que Room.neighbors) y su opuesta
+_OFFSETS = {'up': (0, -1), 'down': (0, 1), 'left': (-1, 0), 'right': (1, 0)}
+_OPPOSITE = {'up': 'down', 'down': 'up', 'left': 'right', 'right': 'left'}
+
+
+# Pausa del hilo de generación entre pasos. sleep(0) no basta: el hilo vuelve a
+# tomar el GIL antes de que despierte el principal, que esperaría hasta 5 ms.
+BACKGROUND_YIELD_S = 0.001
+# Tiempo máximo de trabajo seguido del hilo de generación mientras se juega: el
+# hilo principal nunca espera el GIL más que esto
+BACKGROUND_SLICE_S = 0.0005
+# Con la pantalla de carga o un cambio de piso esperando, el juego no compite por la CPU
+URGENT_SLICE_S = 0.02
+
+
+def huge_dungeon_size(num_rooms: int) -> int:
+    """Lado del mapa para que ``num_rooms`` salas ocupen HUGE_DUNGEON_DENSITY de sus celdas."""
+    return math.isqrt(math.ceil(num_rooms / HUGE_DUNGEON_DENSITY)) + 1
+
+
+def _yield_gil() -> None:
+    """Suelta el GIL para que el hilo principal no espere al hilo de generación."""
+    time.sleep(BACKGROUND_YIELD_S)
+
+
+class _Pacer:
+    """Reparte el trabajo de un hilo de fondo en rodajas de ``slice_s`` con una pausa entre ellas."""
+
+    __slots__ = ('slice_s', '_start')
+
+    def __init__(self, slice_s: float = BACKGROUND_SLICE_S) -> None:
+        self.slice_s = slice_s
+        self._start = time.perf_counter()
+
+    def tick(self) -> None:
+        if time.perf_counter() - self._start >= self.slice_s:
+            _yield_gil()
+            self._start = time.perf_counter()
+
+
+def _warm_room(room: Room) -> None:
+    """Construye lo perezoso de la sala, soltando el GIL entre paso y paso."""
+    for step in (room.get_room_map, room.obstacles, room.collision_grid, room.flow_field):
+        step()
+        _yield_gil()
+
+
+class _RoomPrefetcher:
+    """Hilo que prepara en segundo plano las salas que se le encolan."""
+
+    def __init__(self) -> None:
+        self._queue: "queue.SimpleQueue[Room]" = queue.SimpleQueue()
+        self._pending = 0
+        self._idle = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, rooms: List[Room]) -> None:
+        rooms = [r for r in rooms if not r.materialized or r._flow is None]
+        if not rooms:
+            return
+        with self._idle:
+            self._pending += len(rooms)
+        for room in rooms:
+            self._queue.put(room)
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="room-prefetch", daemon=True)
+            self._thread.start()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def _run(self) -> None:
+        while True:
+            room = self._queue.get()
+            try:
+                _warm_room(room)
+            except Exception as e:
+                print(f"WARNING: no se pudo preparar la sala {room.pos} en segundo plano: {e}")
+            with self._idle:
+                self._pending -= 1
+                if self._pending == 0:
+                    self._idle.notify_all()
+
+
+class _Frontier:
+    """
+    Posiciones candidatas a sala nueva. Lista + índice por posición: alta, baja
+    y elección al azar en O(1) (la baja mueve el último elemento al hueco).
+    """
+
+    __slots__ = ('items', 'index')
+
+    def __init__(self) -> None:
+        self.items: List[Tuple[int, int]] = []
+        self.index: Dict[Tuple[int, int], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return iter(self.items)
+
+    def add(self, pos: Tuple[int, int]) -> None:
+        if pos not in self.index:
+            self.index[pos] = len(self.items)
+            self.items.append(pos)
+
+    def discard(self, pos: Tuple[int, int]) -> None:
+        i = self.index.pop(pos, None)
+        if i is None:
+            return
+        last = self.items.pop()
+        if last != pos:
+            self.items[i] = last
+            self.index[last] = i
+
+    def pop_random(self, rng: random.Random) -> Tuple[int, int]:
+        pos = self.items[rng.randrange(len(self.items))]
+        self.discard(pos)
+        return pos
+
+
+class _FloorBuild:
+    """Piso siguiente construyéndose en un hilo aparte."""
+
+    def __init__(self, key: Tuple[int, int, int, int], huge: bool = False,
+                 slice_s: float = BACKGROUND_SLICE_S) -> None:
+        # (seed, floor, dungeon_size, num_rooms) del piso que se construye
+        self.key = key
+        self.huge = huge
+        # Ritmo del hilo; ``hurry`` lo acelera cuando alguien espera el resultado
+        self.pacer = _Pacer(slice_s)
+        self.result: Optional["Dungeon"] = None
+        self.error: Optional[BaseException] = None
+        self.done = threading.Event()
+        self.thread = threading.Thread(target=self._run, name=f"dungeon-floor-{key[1]}", daemon=True)
+
+    def _run(self) -> None:
+        seed, floor, size, num_rooms = self.key
+        try:
+            nxt = Dungeon(seed=seed, floor=floor, dungeon_size=size, num_rooms=num_rooms,
+                          huge=self.huge, background=True, pacer=self.pacer)
+            # Dejar preparada la sala inicial y sus vecinas; el resto se genera al acercarse
+            for room in nxt.rooms_around(nxt.current):
+                _warm_room(room)
+            self.result = nxt
+        except BaseException as e:  # se informa en el hilo principal
+            self.error = e
+        finally:
+            self.done.set()
+
+    def hurry(self) -> None:
+        """Rodajas largas: el hilo principal está esperando este piso."""
+        self.pacer.slice_s = URGENT_SLICE_S
 
 
 @dataclass
@@ -20,9 +180,32 @@ class Dungeon:
     visited_rooms: Set[Tuple[int, int]] = field(default_factory=set)
     dungeon_size: int = 5
     num_rooms: int = 10
+    # Semilla de la partida; cada piso (floor) deriva de ella la suya propia
+    seed: Optional[int] = None
+    floor: int = 0
+    # Construir el piso siguiente en segundo plano mientras se explora este
+    prefetch: bool = DUNGEON_PREFETCH
+    # Calabozo enorme (ver huge_dungeon): frontera indexada y mismo tamaño en todos los pisos
+    huge: bool = False
+    # True en los pisos que construye _FloorBuild: ceden el GIL entre sala y sala y no encadenan otro prefetch
+    background: bool = field(default=False, repr=False, compare=False)
+    # Ritmo de la generación en segundo plano (solo con background)
+    pacer: Optional[_Pacer] = field(default=None, repr=False, compare=False)
+    # Con True, al visitar la última sala sin el piso siguiente listo no se espera:
+    # queda floor_pending y el juego llama a poll_floor_change (ver PlayScene)
+    defer_floor_change: bool = field(default=False, repr=False, compare=False)
+    floor_pending: bool = field(init=False, default=False, repr=False, compare=False)
+    _next: Optional[_FloorBuild] = field(init=False, default=None, repr=False, compare=False)
+    _prefetcher: Optional[_RoomPrefetcher] = field(init=False, default=None, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        if not self.rooms:
+        if self.seed is None:
+            self.seed = new_seed()
+        if self.background and self.pacer is None:
+            self.pacer = _Pacer()
+        if self.rooms:
+            self._link_doors()
+        else:
             # Generate a random connected dungeon if no rooms are provided
             self.generate_dungeon(size=self.dungeon_size, num_rooms=self.num_rooms)
             # Set the starting room to the first room in the dictionary
@@ -32,36 +215,48 @@ class Dungeon:
                 self.visited_rooms.add(self.current)
                 # Open all unlocked doors in the starting room
                 self.open_all_unlocked_in_current()
+        self.prefetch_next_floor()
+        self.prefetch_neighbours()
+
+    @classmethod
+    def huge_dungeon(cls, num_rooms: int = HUGE_DUNGEON_ROOMS, **kwargs) -> "Dungeon":
+        """Calabozo de miles de salas para partidas largas (1.000-100.000 salas por piso)."""
+        return cls(dungeon_size=huge_dungeon_size(num_rooms), num_rooms=num_rooms, huge=True, **kwargs)
 
-    def _sync_doors(self) -> None:
-        # Primero, actualizar el estado de las puertas basado en las habitaciones vecinas
-        for (gx, gy), room in self.rooms.items():
-            for direction in list(room.doors.keys()):
-                nx, ny = room.neighbors()[direction]
-                # Si no hay habitación vecina, marcar la puerta como inexistente
-                if (nx, ny) not in self.rooms:
+    @staticmethod
+    def build_huge(num_rooms: int, seed: int) -> _FloorBuild:
+        """
+        Primer piso de ``huge_dungeon`` construido en un hilo, para generarlo detrás
+        de la pantalla de carga. Al terminar, ``build.result.activate()`` da el calabozo.
+        """
+        build = _FloorBuild((seed, 0, huge_dungeon_size(num_rooms), num_rooms), huge=True,
+                            slice_s=URGENT_SLICE_S)
+        build.thread.start()
+        return build
+
+    def door_between(self, a: Tuple[int, int], b: Tuple[int, int]) -> Optional[Door]:
+        """La puerta (compartida) que une las salas ``a`` y ``b``; None si no son vecinas."""
+        delta = (b[0] - a[0], b[1] - a[1])
+        for direction, offset in _OFFSETS.items():
+            if offset == delta:
+                room = self.rooms.get(a)
+                return room.doors[direction] if room is not None and b in self.rooms else None
+        return None
+
+    def _link_doors(self) -> None:
+        """
+        Con salas ya hechas: cada par de puertas enfrentadas pasa a ser una sola
+        Door compartida (la de la sala de la izquierda/arriba).
+        """
+        for (x, y), room in self.rooms.items():
+            for direction, (dx, dy) in _OFFSETS.items():
+                other = self.rooms.get((x + dx, y + dy))
+                if other is None:
                     room.doors[direction].exists = False
-                else:
-                    room.doors[direction].exists = True
-        
-        # Luego, sincronizar el estado de las puertas entre habitaciones conectadas
-        for (gx, gy), room in self.rooms.items():
-            for d, door in room.doors.items():
-                if not door.exists:
-                    continue
-                    
-                nx, ny = room.neighbors()[d]
-                if (nx, ny) in self.rooms:
-                    back = {'up': 'down', 'down': 'up', 'left': 'right', 'right': 'left'}[d]
-                    other = self.rooms[(nx, ny)].doors[back]
-                    # Sincronizar solo si la puerta existe en ambos lados
-                    if other.exists:
-                        other.open = door.open
-                        other.locked = door.locked
-                        
-        # Forzar actualización de los patrones de las habitaciones
-        for room in self.rooms.values():
-            room._room_pattern = None  # Forzar regeneración del patrón
+                elif direction in ('right', 'down'):
+                    door = room.doors[direction]
+                    door.exists = True
+                    other.doors[_OPPOSITE[direction]] = door
 
     def get_room(self) -> Room:
         return self.rooms[self.current]
@@ -79,44 +274,80 @@ class Dungeon:
         self.visited_rooms.add((nx, ny))
         self.current = (nx, ny)
         
+        # Quedan pocas salas: empezar (si no se empezó ya) el piso siguiente
+        self.prefetch_next_floor()
         # Check if all rooms have been visited
         if len(self.visited_rooms) >= len(self.rooms):
+            build = self._next
+            if self.defer_floor_change and build is not None and not build.done.is_set():
+                # No bloquear: el juego muestra que se está generando y llama a poll_floor_change
+                self.floor_pending = True
+                build.hurry()
+                return True
             self._regenerate_dungeon()
-            
+
+        self.prefetch_neighbours()
+        return True
+
+    def poll_floor_change(self) -> bool:
+        """Completa el cambio de piso pendiente si el piso siguiente ya está listo. True si cambió."""
+        if not self.floor_pending:
+            return False
+        build = self._next
+        if build is not None and not build.done.is_set():
+            return False
+        self.floor_pending = False
+        self._regenerate_dungeon()
+        self.prefetch_neighbours()
         return True
 
+    def activate(self) -> "Dungeon":
+        """
+        Convierte un piso construido en segundo plano (``build_huge``) en el
+        calabozo de la partida: deja de ceder el GIL y empieza sus precargas.
+        """
+        self.background = False
+        self.pacer = None
+        self.prefetch_next_floor()
+        self.prefetch_neighbours()
+        return self
+
     def unlock(self, direction: str) -> bool:
         room = self.get_room()
         door = room.doors[direction]
         if not door.locked:
             return True
-        # Desbloquear y abrir
+        # Desbloquear y abrir: la sala vecina comparte la misma Door, no hay nada que sincronizar
         door.locked = False
         door.open = True
-        # Sincronizar contraparte
-        self._sync_doors()
         return True
 
     # Helpers para manejar puertas de la sala actual
     def set_current_doors_open(self, open_bool: bool, only_unlocked: bool = True) -> None:
         room = self.get_room()
-        for d, door in room.doors.items():
+        for door in room.doors.values():
             if only_unlocked and door.locked:
                 continue
+            # Door compartida: la sala vecina ve el cambio sin sincronizar nada
             door.open = open_bool
-            # sincronizar contraparte
-            nx, ny = room.neighbors()[d]
-            if (nx, ny) in self.rooms:
-                back = {'up': 'down', 'down': 'up', 'left': 'right', 'right': 'left'}[d]
-                other = self.rooms[(nx, ny)].doors[back]
-                other.open = open_bool if not other.locked else other.open
 
     def open_all_unlocked_in_current(self) -> None:
         self.set_current_doors_open(True, only_unlocked=True)
 
+    def floor_seed(self) -> int:
+        """Semilla del piso actual: las salas regeneran patrón y colores desde (floor_seed, pos)."""
+        return derive_seed(self.seed, 'floor', self.floor)
+
     def generate_dungeon(self, size: int, num_rooms: int) -> None:
         """
         Genera un mapa de cuartos aleatorio y conectado.
+
+        Cada sala nueva se elige de la frontera (posiciones libres junto a una
+        sala) y se conecta con una vecina al azar; sus puertas y las de sus
+        vecinas quedan sincronizadas al añadirla, así que generar es casi
+        lineal en el número de salas. En modo ``huge`` la frontera se sortea
+        por índice en O(1); en los pisos normales se sortea sobre la frontera
+        ordenada para que cada semilla siga dando el mismo mapa.
         
         Args:
             size: Tamaño del mapa (el área será de size x size)
@@ -127,109 +358,111 @@ class Dungeon:
 
         # Limpiar habitaciones existentes
         self.rooms.clear()
+        rooms = self.rooms
+        # Mismo (seed, floor) -> mismo mapa
+        floor_seed = self.floor_seed()
+        rng = random.Random(derive_seed(floor_seed, 'dungeon'))
         
         # Limitar el número de cuartos al máximo posible
         max_rooms = size * size
         num_rooms = min(num_rooms, max_rooms)
-        
-        # Conjuntos para el algoritmo
-        created_rooms: Set[Tuple[int, int]] = set()
-        potential_rooms: Set[Tuple[int, int]] = set()
+        low, high = -size//2, size//2
+        frontier = _Frontier()
         
         # 1. Inicializar con una habitación aleatoria
-        start_x = random.randint(-size//2, size//2)
-        start_y = random.randint(-size//2, size//2)
-        start_pos = (start_x, start_y)
-        
-        self.rooms[start_pos] = Room(start_pos)
-        created_rooms.add(start_pos)
-        
-        # Añadir vecinos iniciales
-        for direction, coords in self.rooms[start_pos].neighbors().items():
-            x, y = coords
-            if -size//2 <= x <= size//2 and -size//2 <= y <= size//2:
-                potential_rooms.add(coords)
-                # Inicializar puertas cerradas
-                self.rooms[start_pos].doors[direction] = Door(open=False, locked=False)
+        start_x = rng.randint(low, high)
+        start_y = rng.randint(low, high)
+        new_room_pos = (start_x, start_y)
 
         # 2. Añadir habitaciones hasta alcanzar el número deseado
-        while len(created_rooms) < num_rooms and potential_rooms:
-            # Elegir una habitación potencial al azar
-            new_room_pos = random.choice(list(potential_rooms))
-            potential_rooms.remove(new_room_pos)
-            
-            # Obtener vecinos existentes
-            temp_room = Room(new_room_pos)
+        while True:
+            # Vecinos existentes; los libres dentro del mapa pasan a la frontera
+            x, y = new_room_pos
             existing_neighbors = []
-            
-            for direction, coords in temp_room.neighbors().items():
-                if coords in self.rooms:
-                    existing_neighbors.append((coords, direction))
-                elif -size//2 <= coords[0] <= size//2 and -size//2 <= coords[1] <= size//2:
-                    potential_rooms.add(coords)
-            
-            # Conectar con al menos un vecino existente
-            if existing_neighbors:
-                # Añadir la habitación
-                self.rooms[new_room_pos] = temp_room
-                created_rooms.add(new_room_pos)
-                
-                # Conectar con un vecino aleatorio
-                connected_pos, back_direction = random.choice(existing_neighbors)
-                direction_to_neighbor = {
-                    'up': 'down', 'down': 'up', 
-                    'left': 'right', 'right': 'left'
-                }[back_direction]
-                
-                # Establecer puertas abiertas
-                self.rooms[new_room_pos].doors[direction_to_neighbor] = Door(open=True, locked=False)
-                self.rooms[connected_pos].doors[back_direction] = Door(open=True, locked=False)
-                
-                # Añadir puertas cerradas a los demás vecinos
-                for direction, coords in temp_room.neighbors().items():
-                    if direction != direction_to_neighbor and coords in self.rooms:
-                        if direction not in self.rooms[new_room_pos].doors:
-                            self.rooms[new_room_pos].doors[direction] = Door(open=False, locked=False)
+            for direction, (dx, dy) in _OFFSETS.items():
+                coords = (x + dx, y + dy)
+                if coords in rooms:
+                    existing_neighbors.append(direction)
+                elif low <= coords[0] <= high and low <= coords[1] <= high:
+                    frontier.add(coords)
+
+            # Conectar con un vecino aleatorio (la sala inicial no tiene ninguno)
+            connect = rng.choice(existing_neighbors) if existing_neighbors else None
+            self._add_room(new_room_pos, floor_seed, connect)
+            if self.pacer is not None:
+                self.pacer.tick()
+
+            if len(rooms) >= num_rooms or not frontier:
+                break
+            # Elegir una habitación potencial al azar
+            if self.huge:
+                new_room_pos = frontier.pop_random(rng)
+            else:
+                # sorted: mismo orden de sorteo que el generador original
+                new_room_pos = rng.choice(sorted(frontier))
+                frontier.discard(new_room_pos)
         
         # 3. Asegurar que todas las habitaciones estén conectadas
-        self._ensure_fully_connected(size)
-        
-        # Sincronizar todas las puertas
-        self._sync_all_doors()
+        self._ensure_fully_connected(size, rng)
 
-    def _ensure_fully_connected(self, size: int) -> None:
+    def _add_room(self, pos: Tuple[int, int], seed: int, connect: Optional[str]) -> Room:
+        """
+        Añade la sala ``pos`` al grafo: hacia cada vecina existente reutiliza la
+        Door del lado de la vecina (una sola por conexión) y solo abre la que
+        da a ``connect``; hacia las posiciones vacías la puerta no existe.
+        """
+        room = Room(pos, seed=seed)
+        x, y = pos
+        for direction, (dx, dy) in _OFFSETS.items():
+            other = self.rooms.get((x + dx, y + dy))
+            if other is None:
+                room.doors[direction].exists = False
+                continue
+            door = other.doors[_OPPOSITE[direction]]
+            if not door.exists and other.materialized:
+                # Aparece un hueco en la pared de la vecina: su patrón cambia
+                other.invalidate_layout()
+            door.exists = True
+            door.open = direction == connect
+            room.doors[direction] = door
+        self.rooms[pos] = room
+        return room
+
+    def _ensure_fully_connected(self, size: int, rng: Optional[random.Random] = None) -> None:
         """
         Asegura que todas las habitaciones estén conectadas.
         """
         if not self.rooms:
             return
+        if rng is None:
+            rng = random
+        rooms = self.rooms
         
         # Usar BFS para encontrar componentes conectados
         visited: Set[Tuple[int, int]] = set()
         components: List[Set[Tuple[int, int]]] = []
         
-        for room_pos in self.rooms:
-            if room_pos not in visited:
-                # BFS para encontrar el componente conectado
-                queue = [room_pos]
-                component = set()
-                
-                while queue:
-                    current = queue.pop(0)
-                    if current in visited:
-                        continue
-                        
-                    visited.add(current)
-                    component.add(current)
-                    
-                    # Añadir vecinos conectados
-                    for direction, door in self.rooms[current].doors.items():
-                        if door.open:  # Solo puertas abiertas
-                            neighbor = self.rooms[current].neighbors()[direction]
-                            if neighbor in self.rooms and neighbor not in visited:
-                                queue.append(neighbor)
-                
-                components.append(component)
+        for room_pos in rooms:
+            if room_pos in visited:
+                continue
+            # BFS para encontrar el componente conectado
+            visited.add(room_pos)
+            component = {room_pos}
+            pending = deque([room_pos])
+            while pending:
+                x, y = pending.popleft()
+                # Añadir vecinos conectados (solo puertas abiertas)
+                for direction, door in rooms[(x, y)].doors.items():
+                    if door.open:
+                        dx, dy = _OFFSETS[direction]
+                        neighbor = (x + dx, y + dy)
+                        if neighbor in rooms and neighbor not in visited:
+                            visited.add(neighbor)
+                            component.add(neighbor)
+                            pending.append(neighbor)
+                if self.pacer is not None:
+                    self.pacer.tick()
+            components.append(component)
         
         # Si solo hay un componente, ya está todo conectado
         if len(components) <= 1:
@@ -238,8 +471,8 @@ class Dungeon:
         # Conectar componentes desconectados
         for i in range(1, len(components)):
             # Encontrar el camino más corto entre componentes
-            start = random.choice(list(components[i-1]))
-            end = random.choice(list(components[i]))
+            start = rng.choice(sorted(components[i-1]))
+            end = rng.choice(sorted(components[i]))
             
             # Conectar directamente (puedes implementar un mejor algoritmo de conexión)
             dx = end[0] - start[0]
@@ -252,49 +485,104 @@ class Dungeon:
                 direction = 'up' if dy > 0 else 'down'
                 back_direction = 'down' if dy > 0 else 'up'
             
-            # Establecer puertas abiertas
+            # Abrir puertas (sin sustituirlas: pueden estar compartidas con la sala vecina)
             if start in self.rooms and direction in self.rooms[start].doors:
-                self.rooms[start].doors[direction] = Door(open=True, locked=False)
+                self.rooms[start].doors[direction].open = True
             if end in self.rooms and back_direction in self.rooms[end].doors:
-                self.rooms[end].doors[back_direction] = Door(open=True, locked=False)
+                self.rooms[end].doors[back_direction].open = True
 
-    def _sync_all_doors(self) -> None:
+    def _next_floor_key(self) -> Tuple[int, int, int, int]:
+        """(seed, floor, dungeon_size, num_rooms) del piso siguiente."""
+        if self.huge:
+            # El calabozo enorme no crece: ya es grande
+            return self.seed, self.floor + 1, self.dungeon_size, self.num_rooms
+        return (self.seed, self.floor + 1,
+                min(self.dungeon_size + 1, MAX_DUNGEON_SIZE),  # Tamaño máximo de 8x8
+                min(self.num_rooms + 2, MAX_NUM_ROOMS))  # Máximo 20 habitaciones
+
+    def prefetch_next_floor(self) -> None:
         """
-        Sincroniza todas las puertas del calabozo.
+        Empieza a construir el piso siguiente en un hilo (si no se está construyendo ya)
+        cuando quedan DUNGEON_PREFETCH_REMAINING salas o menos por visitar.
         """
-        # Primero, asegurarse de que todas las puertas tengan su contraparte
-        for pos, room in list(self.rooms.items()):
-            for direction, coords in room.neighbors().items():
-                if coords in self.rooms and direction not in room.doors:
-                    room.doors[direction] = Door(open=False, locked=False)
-        
-        # Luego, sincronizar todas las puertas
-        self._sync_doors()
+        if not self.prefetch or self.background:
+            return
+        if len(self.rooms) - len(self.visited_rooms) > DUNGEON_PREFETCH_REMAINING:
+            return
+        key = self._next_floor_key()
+        if self._next is not None and self._next.key == key:
+            return
+        self._next = _FloorBuild(key, self.huge)
+        self._next.thread.start()
+
+    def rooms_around(self, pos: Tuple[int, int]) -> List[Room]:
+        """La sala ``pos`` y sus vecinas existentes."""
+        room = self.rooms.get(pos)
+        if room is None:
+            return []
+        return [room] + [self.rooms[n] for n in room.neighbors().values() if n in self.rooms]
+
+    def prefetch_neighbours(self) -> None:
+        """Prepara en segundo plano la sala actual y sus 4 vecinas (patrón, geometría, campo de flujo)."""
+        if not self.prefetch or self.background:
+            return
+        if self._prefetcher is None:
+            self._prefetcher = _RoomPrefetcher()
+        self._prefetcher.submit(self.rooms_around(self.current)[1:])
+
+    def wait_for_background(self, timeout: Optional[float] = None) -> bool:
+        """Espera al piso siguiente y a las salas en precarga. True si no queda nada pendiente."""
+        build = self._next
+        if build is not None and not build.done.wait(timeout):
+            return False
+        return self._prefetcher is None or self._prefetcher.wait(timeout)
+
+    def _take_prefetched(self) -> Optional["Dungeon"]:
+        """Piso siguiente ya construido; espera (y avisa) si el hilo aún no terminó."""
+        build, self._next = self._next, None
+        if build is None or build.key != self._next_floor_key():
+            return None
+        if not build.done.is_set():
+            # Solo sin defer_floor_change (simulación headless, benchmarks): se espera aquí
+            start = time.perf_counter()
+            build.hurry()
+            build.done.wait()
+            print(f"WARNING: el piso {build.key[1]} no estaba listo al cambiar de piso; "
+                  f"espera de {(time.perf_counter() - start) * 1000:.1f} ms")
+        if build.error is not None:
+            print(f"WARNING: falló la generación en segundo plano del piso {build.key[1]}: {build.error}")
+            return None
+        return build.result
 
     def _regenerate_dungeon(self) -> None:
         """
         Regenera el calabozo con nuevas habitaciones y enemigos.
+
+        Si el piso siguiente ya se construyó en segundo plano solo se
+        intercambia; si no, se genera aquí mismo.
         """
-        # Guardar la posición actual para referencia
-        old_pos = self.current
-        
-        # Limpiar el estado actual
-        self.rooms.clear()
-        self.visited_rooms.clear()
-        
-        # Aumentar la dificultad (opcional)
-        self.dungeon_size = min(self.dungeon_size + 1, 8)  # Tamaño máximo de 8x8
-        self.num_rooms = min(self.num_rooms + 2, 20)  # Máximo 20 habitaciones
-        
-        # Generar un nuevo calabozo
-        self.generate_dungeon(size=self.dungeon_size, num_rooms=self.num_rooms)
-        
-        # Establecer la nueva posición actual (la primera habitación)
-        if self.rooms:
-            self.current = next(iter(self.rooms))
-            self.visited_rooms.add(self.current)
-            self.open_all_unlocked_in_current()
-            
+        nxt = self._take_prefetched()
+        if nxt is not None:
+            # Intercambio completo en el hilo principal: nadie ve un piso a medias
+            self.rooms, self.current, self.visited_rooms = nxt.rooms, nxt.current, nxt.visited_rooms
+            self.dungeon_size, self.num_rooms, self.floor = nxt.dungeon_size, nxt.num_rooms, nxt.floor
+        else:
+            # Limpiar el estado actual
+            self.rooms.clear()
+            self.visited_rooms.clear()
+
+            # Aumentar la dificultad
+            _, self.floor, self.dungeon_size, self.num_rooms = self._next_floor_key()
+
+            # Generar un nuevo calabozo
+            self.generate_dungeon(size=self.dungeon_size, num_rooms=self.num_rooms)
+
+            # Establecer la nueva posición actual (la primera habitación)
+            if self.rooms:
+                self.current = next(iter(self.rooms))
+                self.visited_rooms.add(self.current)
+                self.open_all_unlocked_in_current()
+
         # Notificar al jugador (esto debería manejarse en la UI del juego)
         print("¡Has explorado todas las habitaciones! El calabozo se ha regenerado con nuevas salas y enemigos.")
-        self._sync_doors()
+        self.prefetch_next_floor()
@@ -0,0 +1,268 @@
+"""
+Campo de flujo hacia el jugador sobre la rejilla de la sala.
+
+En lugar de que cada enemigo camine en línea recta y, al chocar, pruebe
+direcciones a ciegas, ``FlowField`` hace una única búsqueda en anchura
+(BFS) desde la celda del jugador sobre ``CollisionGrid`` y guarda, para cada
+celda, la celda vecina por la que se llega antes. Un enemigo solo tiene que
+mirar su celda para saber hacia qué punto caminar (O(1)). La búsqueda se
+repite únicamente cuando el jugador cambia de celda.
+
+Las celdas transitables se calculan una vez por rejilla y tienen en cuenta
+el tamaño de los enemigos: una celda es transitable si un rect de ese tamaño
+centrado en ella no toca paredes ni obstáculos, así el camino no pasa por
+huecos donde el enemigo no cabe.
+"""
+from __future__ import annotations
+from array import array
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional (solo para waypoints_many)
+    np = None
+
+from isac.core.collision import CollisionGrid
+
+UNREACHED = -1
+# Vecinos (dcol, dfila): primero los ortogonales para que los empates sean estables
+_NEIGHBOURS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (-1, 1), (1, -1), (-1, -1))
+
+
+_NEIGHBOUR_TABLES: Dict[Tuple[int, int], List[Tuple[Tuple[int, int, int], ...]]] = {}
+
+
+def _grid_neighbours(cols: int, rows: int) -> List[Tuple[Tuple[int, int, int], ...]]:
+    """
+    Para cada celda, sus vecinas (j, a, b) dentro de la rejilla; en las
+    diagonales a y b son las dos celdas ortogonales que no deben estar
+    bloqueadas (-1 en las ortogonales). Se comparte entre rejillas del mismo tamaño.
+    """
+    table = _NEIGHBOUR_TABLES.get((cols, rows))
+    if table is None:
+        table = []
+        for i in range(cols * rows):
+            col, row = i % cols, i // cols
+            cells = []
+            for dc, dr in _NEIGHBOURS:
+                nc, nr = col + dc, row + dr
+                if 0 <= nc < cols and 0 <= nr < rows:
+                    if dc and dr:
+                        cells.append((nr * cols + nc, row * cols + nc, nr * cols + col))
+                    else:
+                        cells.append((nr * cols + nc, -1, -1))
+            table.append(tuple(cells))
+        _NEIGHBOUR_TABLES[(cols, rows)] = table
+    return table
+
+
+class FlowField:
+    """Distancias (en pasos) y siguiente celda hacia el jugador para cada celda de la rejilla."""
+
+    def __init__(self, grid: CollisionGrid, agent_size: Tuple[int, int]) -> None:
+        self.grid = grid
+        self.cols = grid.cols
+        self.rows = grid.rows
+        n = self.cols * self.rows
+        agent_w, agent_h = agent_size
+        cols, rows = self.cols, self.rows
+        self._centers = [grid.cell_center(i % cols, i // cols) for i in range(n)]
+        # 1 = un agente centrado en la celda no toca nada sólido
+        self.passable = self._passable(agent_w, agent_h)
+        # Vecinos de cada celda transitable que la BFS puede expandir
+        # (las diagonales no cortan esquinas no transitables)
+        passable = self.passable
+        neighbours = _grid_neighbours(cols, rows)
+        self._open_links = [
+            tuple(j for j, a, b in neighbours[i] if passable[j] and (a < 0 or (passable[a] and passable[b])))
+            if passable[i] else ()
+            for i in range(n)
+        ]
+        self.dist = array('i', [UNREACHED]) * n
+        # Punto (píxeles) hacia el que caminar desde cada celda; la celda objetivo apunta a sí misma
+        self.next_x = array('i', [0]) * n
+        self.next_y = array('i', [0]) * n
+        self.has_next = bytearray(n)
+        self.target: Optional[Tuple[int, int]] = None
+        self.builds = 0
+        self._np_cache = None
+
+    def _passable(self, agent_w: int, agent_h: int) -> bytearray:
+        """
+        Celdas donde cabe un agente centrado. Como todos los centros están alineados
+        con la rejilla, el rect del agente cubre siempre el mismo rango relativo de
+        celdas: basta con "engordar" las celdas sólidas ese rango (con máscaras de
+        bits por fila) y marcar las filas/columnas que tocan las paredes.
+        """
+        grid = self.grid
+        cols, rows = self.cols, self.rows
+        cw, ch = grid.cell_w, grid.cell_h
+        left = cw // 2 - agent_w // 2
+        top = ch // 2 - agent_h // 2
+        c0, c1 = left // cw, (left + agent_w - 1) // cw
+        r0, r1 = top // ch, (top + agent_h - 1) // ch
+        full = (1 << cols) - 1
+        solid = grid.solid
+        # Bit c de wide[row]: el agente centrado en (c, row) solapa un sólido de esa fila
+        wide = []
+        for row in range(rows):
+            bits = 0
+            base = row * cols
+            for col in range(cols):
+                if solid[base + col]:
+                    bits |= 1 << col
+            grown = 0
+            for k in range(c0, c1 + 1):
+                grown |= (bits >> k) if k >= 0 else (bits << -k)
+            wide.append(grown & full)
+        blocked = [0] * rows
+        for row in range(rows):
+            acc = 0
+            for r in range(max(0, row + r0), min(rows - 1, row + r1) + 1):
+                acc |= wide[r]
+            blocked[row] = acc
+        # Paredes exteriores: el solape en x solo depende de la columna y en y de la fila
+        for wall in grid.walls:
+            if wall.width <= 0 or wall.height <= 0:
+                continue
+            col_bits = 0
+            for col in range(cols):
+                x = self._centers[col][0] - agent_w // 2
+                if x < wall.right and x + agent_w > wall.left:
+                    col_bits |= 1 << col
+            if not col_bits:
+                continue
+            for row in range(rows):
+                y = self._centers[row * cols][1] - agent_h // 2
+                if y < wall.bottom and y + agent_h > wall.top:
+                    blocked[row] |= col_bits
+        passable = bytearray(cols * rows)
+        for row in range(rows):
+            free = ~blocked[row] & full
+            base = row * cols
+            while free:
+                low = free & -free
+                passable[base + low.bit_length() - 1] = 1
+                free ^= low
+        return passable
+
+    # ---- Construcción ----
+    def update(self, x: float, y: float) -> bool:
+        """Apunta el campo al punto (x, y). Solo rehace la búsqueda si cambió de celda."""
+        if self.cols == 0 or self.rows == 0:
+            return False
+        col, row = self.grid.cell_at(x, y)
+        cell = (min(max(col, 0), self.cols - 1), min(max(row, 0), self.rows - 1))
+        if cell == self.target:
+            return False
+        self.target = cell
+        self._build(cell[1] * self.cols + cell[0])
+        return True
+
+    def _build(self, start: int) -> None:
+        n = self.cols * self.rows
+        dist = array('i', [UNREACHED]) * n
+        parent = [-1] * n
+        open_links = self._open_links
+        dist[start] = 0
+        parent[start] = start
+        queue = deque([start])
+        if not self.passable[start]:
+            # El jugador puede estar donde no cabe un enemigo: se sale hacia sus vecinas transitables
+            passable = self.passable
+            open_links = list(open_links)
+            open_links[start] = tuple(
+                j for j, a, b in _grid_neighbours(self.cols, self.rows)[start]
+                if passable[j] and (a < 0 or (passable[a] and passable[b])))
+        # BFS en 8 direcciones; el padre de cada celda es su siguiente paso hacia el objetivo
+        while queue:
+            i = queue.popleft()
+            d = dist[i] + 1
+            for j in open_links[i]:
+                if dist[j] == UNREACHED:
+                    dist[j] = d
+                    parent[j] = i
+                    queue.append(j)
+
+        # Las celdas no transitables (un enemigo pegado a un obstáculo) apuntan a su
+        # vecina alcanzada más cercana al objetivo
+        passable = self.passable
+        neighbours = _grid_neighbours(self.cols, self.rows)
+        for i in range(n):
+            if parent[i] >= 0:
+                continue
+            best = None
+            for j, a, b in neighbours[i]:
+                dj = dist[j]
+                if dj == UNREACHED or (best is not None and dj >= dist[best]):
+                    continue
+                if a >= 0 and not (passable[a] and passable[b]):
+                    continue
+                best = j
+            if best is not None:
+                parent[i] = best
+
+        centers = self._centers
+        next_x, next_y, has_next = self.next_x, self.next_y, self.has_next
+        for i in range(n):
+            j = parent[i]
+            if j < 0:
+                has_next[i] = 0
+            else:
+                has_next[i] = 1
+                next_x[i], next_y[i] = centers[j]
+        self.dist = dist
+        self.builds += 1
+        self._np_cache = None
+
+    # ---- Consultas ----
+    def cell_index(self, x: float, y: float) -> int:
+        col, row = self.grid.cell_at(x, y)
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return row * self.cols + col
+        return -1
+
+    def distance(self, x: float, y: float) -> int:
+        """Pasos hasta la celda del jugador, o UNREACHED."""
+        i = self.cell_index(x, y)
+        return self.dist[i] if i >= 0 and self.target is not None else UNREACHED
+
+    def waypoint(self, x: float, y: float) -> Optional[Tuple[int, int]]:
+        """
+        Punto hacia el que debe caminar un agente con centro en (x, y), o None
+        si el campo no sirve ahí (fuera de la rejilla, celda aislada, o ya en la
+        celda del jugador o al lado): en ese caso se persigue en línea recta.
+        """
+        i = self.cell_index(x, y)
+        if i < 0 or self.target is None or not self.has_next[i] or 0 <= self.dist[i] <= 1:
+            return None
+        return self.next_x[i], self.next_y[i]
+
+    def waypoints_many(self, x, y):
+        """
+        ``waypoint`` para arrays de centros (requiere NumPy). Devuelve
+        (tx, ty, valid); donde ``valid`` es False se persigue en línea recta.
+        """
+        x = np.asarray(x, dtype=np.int64)
+        y = np.asarray(y, dtype=np.int64)
+        if self.target is None:
+            zeros = np.zeros(x.shape, dtype=np.int64)
+            return zeros, zeros, np.zeros(x.shape, dtype=bool)
+        cache = self._np_cache
+        if cache is None:
+            cache = self._np_cache = (
+                np.frombuffer(self.next_x, dtype=np.int32).astype(np.int64),
+                np.frombuffer(self.next_y, dtype=np.int32).astype(np.int64),
+                np.frombuffer(bytes(self.has_next), dtype=np.uint8).astype(bool),
+                np.frombuffer(self.dist, dtype=np.int32),
+            )
+        nx, ny, has, dist = cache
+        grid = self.grid
+        col = (x - grid.origin_x) // grid.cell_w
+        row = (y - grid.origin_y) // grid.cell_h
+        inside = (col >= 0) & (col < self.cols) & (row >= 0) & (row < self.rows)
+        idx = np.where(inside, row * self.cols + col, 0)
+        d = dist[idx]
+        valid = inside & has[idx] & ~((d >= 0) & (d <= 1))
+        return nx[idx], ny[idx], valid
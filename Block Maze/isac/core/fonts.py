@@ -0,0 +1,56 @@
+"""
+Caché de fuentes y de textos renderizados.
+
+Cada escena pedía sus fuentes con ``pygame.font.SysFont``, que la primera vez
+recorre todas las fuentes del sistema (fc-list o el registro de Windows) y
+además crea un objeto nuevo en cada llamada. Con ``name=None`` la fuente es
+la de pygame, así que se carga directamente con ``pygame.font.Font``.
+
+``render_text`` guarda los textos ya rasterizados por (fuente, texto, color):
+el HUD y los menús repiten los mismos textos frame tras frame.
+"""
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+from isac.settings import TEXT_CACHE_SIZE
+
+_fonts: Dict[Tuple[Optional[str], int, bool], pygame.font.Font] = {}
+_texts: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+
+
+def get_font(size: int, name: Optional[str] = None, bold: bool = False) -> pygame.font.Font:
+    """Fuente compartida para (name, size, bold); se crea una sola vez."""
+    key = (name, size, bold)
+    font = _fonts.get(key)
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        if name is None:
+            font = pygame.font.Font(None, size)
+            font.set_bold(bold)
+        else:
+            font = pygame.font.SysFont(name, size, bold=bold)
+        _fonts[key] = font
+    return font
+
+
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int],
+                antialias: bool = True) -> pygame.Surface:
+    """
+    ``font.render`` con caché LRU de TEXT_CACHE_SIZE entradas.
+
+    La superficie es compartida: no modificarla (hacer una copia si hace falta).
+    """
+    key = (font, text, color, antialias)
+    surface = _texts.get(key)
+    if surface is not None:
+        _texts.move_to_end(key)
+        return surface
+    surface = font.render(text, antialias, color)
+    _texts[key] = surface
+    if len(_texts) > TEXT_CACHE_SIZE:
+        _texts.popitem(last=False)
+    return surface
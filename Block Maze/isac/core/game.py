@@ -1,51 +1,128 @@
+import os
+import time
 import pygame
 from typing import Type
 
-from isac.settings import WIDTH, HEIGHT, FPS, TITLE, GRAY
+from isac.settings import (
+    WIDTH, HEIGHT, TITLE, GRAY, SIM_HZ, MAX_SIM_STEPS, RENDER_FPS,
+    PROFILER_OVERLAY_KEY, PROFILER_EXPORT_KEY,
+)
 from .scene import Scene
+from .assets import cache as asset_cache
+from .profiler import profiler, ProfilerOverlay
 
 
 class Game:
-    def __init__(self, initial_scene: Type[Scene]) -> None:
-        pygame.init()
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
-        pygame.display.set_caption(TITLE)
+    def __init__(self, initial_scene: Type[Scene], **scene_kwargs) -> None:
+        self._init_pygame()
+        self.screen = self._create_screen()
         self.clock = pygame.time.Clock()
         self.running = True
+        # Bucle de paso fijo: la simulación siempre avanza en pasos de sim_dt
+        self.sim_dt = 1.0 / SIM_HZ
+        self._accumulator = 0.0
+        # Tiempos por fase (F3 panel, F4 CSV)
+        self.profiler = profiler
+        self.profiler_overlay = ProfilerOverlay(profiler)
 
-        self.scene: Scene = initial_scene(self)
+        self.scene: Scene = initial_scene(self, **scene_kwargs)
         self.scene.start()
 
+    def _init_pygame(self) -> None:
+        # Solo vídeo y fuentes: el mixer se inicia al primer sonido (isac.core.audio)
+        pygame.display.init()
+        pygame.font.init()
+
+    def _create_screen(self) -> pygame.Surface:
+        screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        pygame.display.set_caption(TITLE)
+        return screen
+
     def change_scene(self, scene_type: Type[Scene], **kwargs) -> None:
         self.scene.stop()
         self.scene = scene_type(self, **kwargs)
         self.scene.start()
 
+    def adopt_assets(self, decoded) -> None:
+        """Convierte en el hilo principal las superficies decodificadas por el precargador."""
+        for path, surface, error in decoded:
+            asset_cache.adopt(path, surface, error)
+
+    def advance(self, steps: int = 1) -> None:
+        """Simula ``steps`` pasos fijos sin dibujar (para tests y simulación acelerada)."""
+        for _ in range(steps):
+            self.scene.update(self.sim_dt)
+
+    def _handle_profiler_key(self, event: pygame.event.Event) -> bool:
+        """F3 muestra/oculta el panel de tiempos y F4 exporta el buffer a CSV."""
+        if event.type != pygame.KEYDOWN:
+            return False
+        if event.key == PROFILER_OVERLAY_KEY:
+            self.profiler_overlay.toggle()
+            # El panel tapa parte de la escena: que la repinte entera
+            self.scene.invalidate_screen()
+            return True
+        if event.key == PROFILER_EXPORT_KEY:
+            path = time.strftime('profile_%Y%m%d_%H%M%S.csv')
+            try:
+                self.profiler.export_csv(path)
+                print(f"Tiempos por fase exportados a {path}")
+            except OSError as e:
+                print(f"No se pudo exportar {path}: {e}")
+            return True
+        return False
+
+    def _simulate(self, frame_dt: float) -> None:
+        """Consume el tiempo real del frame en pasos fijos de sim_dt."""
+        self._accumulator += frame_dt
+        steps = 0
+        while self._accumulator >= self.sim_dt and steps < MAX_SIM_STEPS:
+            self.scene.update(self.sim_dt)
+            self._accumulator -= self.sim_dt
+            steps += 1
+        if steps == MAX_SIM_STEPS and self._accumulator >= self.sim_dt:
+            # Demasiado atraso (p. ej. tras arrastrar la ventana): descartarlo
+            self._accumulator = 0.0
+        self.scene.interpolation = self._accumulator / self.sim_dt
+
     def run(self) -> None:
         try:
             while self.running:
                 try:
-                    # Limit the frame rate and calculate delta time
-                    dt = self.clock.tick(FPS) / 1000.0
+                    # Limit the frame rate (0 = uncapped) and measure real frame time
+                    frame_dt = self.clock.tick(RENDER_FPS) / 1000.0
+                    prof = self.profiler
+                    prof.begin_frame()
 
                     # Handle events
-                    for event in pygame.event.get():
-                        if event.type == pygame.QUIT:
-                            self.running = False
-                        else:
-                            self.scene.handle_event(event)
+                    with prof.phase('events'):
+                        for event in pygame.event.get():
+                            if event.type == pygame.QUIT:
+                                self.running = False
+                            elif not self._handle_profiler_key(event):
+                                self.scene.handle_event(event)
 
-                    # Update game state
-                    self.scene.update(dt)
+                    # Update game state in fixed steps
+                    with prof.phase('update'):
+                        self._simulate(frame_dt)
 
-                    # Clear the screen
-                    self.screen.fill(GRAY)
+                    with prof.phase('draw'):
+                        # Clear the screen (unless the scene repaints it itself)
+                        if not self.scene.clears_screen:
+                            self.screen.fill(GRAY)
 
-                    # Draw the current scene
-                    self.scene.draw(self.screen)
+                        # Draw the current scene
+                        self.scene.draw(self.screen)
+                    overlay = self.profiler_overlay.draw(self.screen)
 
-                    # Update the display
-                    pygame.display.flip()
+                    # Update the display: only the changed rects when the scene reports them
+                    with prof.phase('flip'):
+                        rects = self.scene.dirty_rects()
+                        if rects is None:
+                            pygame.display.flip()
+                        elif rects or overlay:
+                            pygame.display.update(rects + [overlay] if overlay else rects)
+                    prof.end_frame()
 
                 except KeyboardInterrupt:
                     print("\nGame interrupted by user. Exiting...")
@@ -63,3 +140,53 @@ class Game:
             pygame.quit()
             print("Game closed successfully.")
 
+
+class HeadlessGame(Game):
+    """
+    Game sin ventana ni audio para simulaciones y benchmarks.
+
+    Usa los drivers ``dummy`` de SDL: la pantalla es una superficie fuera de
+    pantalla y ``run_ticks`` avanza la escena tan rápido como dé la CPU, sin
+    esperar al reloj. Ver ``isac.core.headless`` para activarlo antes de
+    importar ``isac.settings``.
+    """
+
+    def __init__(self, initial_scene: Type[Scene], render: bool = True, **scene_kwargs) -> None:
+        self.render = render
+        super().__init__(initial_scene, **scene_kwargs)
+
+    def _create_screen(self) -> pygame.Surface:
+        if os.environ.get('SDL_VIDEODRIVER') == 'dummy':
+            # Con el driver dummy la "ventana" es una superficie en memoria
+            return pygame.display.set_mode((WIDTH, HEIGHT))
+        # Con un driver real no abrir ventana: dibujar en una superficie suelta
+        return pygame.Surface((WIDTH, HEIGHT))
+
+    def run_ticks(self, ticks: int, render_every: int = 1) -> dict:
+        """Simula ``ticks`` pasos fijos (dibujando cada ``render_every``) y devuelve tiempos."""
+        frames = 0
+        start = time.perf_counter()
+        prof = self.profiler
+        for tick in range(ticks):
+            prof.begin_frame()
+            # Vaciar la cola de eventos de SDL para que no se llene
+            with prof.phase('events'):
+                pygame.event.pump()
+            with prof.phase('update'):
+                self.scene.update(self.sim_dt)
+            if self.render and render_every > 0 and tick % render_every == 0:
+                with prof.phase('draw'):
+                    if not self.scene.clears_screen:
+                        self.screen.fill(GRAY)
+                    self.scene.interpolation = 1.0
+                    self.scene.draw(self.screen)
+                frames += 1
+            prof.end_frame()
+        elapsed = time.perf_counter() - start
+        return {
+            'ticks': ticks,
+            'frames': frames,
+            'seconds': elapsed,
+            'ticks_per_second': ticks / elapsed if elapsed > 0 else float('inf'),
+            'simulated_seconds': ticks * self.sim_dt,
+        }
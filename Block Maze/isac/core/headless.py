@@ -0,0 +1,33 @@
+"""
+Modo headless: simular ``PlayScene`` sin ventana ni audio.
+
+``enable_headless()`` debe llamarse antes de importar ``isac.settings`` (que
+lee ``ISAC_HEADLESS`` al importarse), por eso este módulo no importa nada del
+juego a nivel de módulo. Con ``seed`` la simulación es reproducible::
+
+    from isac.core.headless import enable_headless, run_headless
+    enable_headless()
+    stats = run_headless(10000, seed=1234)
+"""
+from __future__ import annotations
+import os
+from typing import Optional
+
+
+def enable_headless() -> None:
+    """Selecciona los drivers dummy de SDL y marca el modo headless para isac.settings."""
+    os.environ['ISAC_HEADLESS'] = '1'
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+
+def run_headless(ticks: int, render: bool = True, render_every: int = 1,
+                 scene_type: Optional[type] = None, **scene_kwargs) -> dict:
+    """Crea un HeadlessGame con ``scene_type`` (PlayScene por defecto) y avanza ``ticks`` pasos."""
+    enable_headless()
+    from isac.core.game import HeadlessGame
+    if scene_type is None:
+        from isac.scenes.play import PlayScene
+        scene_type = PlayScene
+    game = HeadlessGame(scene_type, render=render, **scene_kwargs)
+    return game.run_ticks(ticks, render_every=render_every)
@@ -0,0 +1,204 @@
+"""
+HUD de la partida: vida, magia, puntuación e inventario.
+
+Cada widget guarda su superficie ya compuesta junto con los valores con los
+que se dibujó (vida, magia, puntos, bombas, llaves). En cada frame solo se
+calcula esa clave y se vuelca la superficie; se vuelve a dibujar únicamente
+cuando la clave cambia, que ocurre unas pocas veces por segundo. Los textos
+salen de ``render_text`` (caché LRU por fuente, texto y color).
+
+La vida se dibuja con el arte de ``HUD_HP_SPRITES`` si sus archivos existen
+(``HUD_HP_SPRITES_ENABLED``) y con corazones si no. Que falte el arte es normal
+(es opcional) y no se avisa; solo se avisa si existe pero no se puede cargar.
+"""
+from __future__ import annotations
+import functools
+import math
+import os
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pygame
+
+from isac.core.assets import load_image
+from isac.core.fonts import render_text
+from isac.settings import (
+    HUD_HEART_SIZE,
+    HUD_HP_SPRITES,
+    HUD_HP_SPRITES_ENABLED,
+    MAGIC_MAX,
+    WHITE,
+    RED,
+    CYAN,
+)
+
+# Posición y medidas (las mismas que dibujaba PlayScene)
+HUD_MARGIN = 10
+HEART_GAP = 4
+MAGIC_BAR_W = 160
+MAGIC_BAR_H = 10
+SLOT_W = 64
+SLOT_H = 40
+SLOT_GAP = 12
+INVENTORY_W = 240
+INVENTORY_H = 58
+
+_UNSET = object()
+
+
+class _Widget:
+    """Superficie de un trozo del HUD; se redibuja solo si cambia su clave."""
+
+    __slots__ = ('render', 'key', 'surface', 'renders')
+
+    def __init__(self, render: Callable[[tuple], pygame.Surface]) -> None:
+        self.render = render
+        self.key = _UNSET
+        self.surface: Optional[pygame.Surface] = None
+        self.renders = 0
+
+    def get(self, key) -> pygame.Surface:
+        if key != self.key:
+            self.surface = self.render(key)
+            self.key = key
+            self.renders += 1
+        return self.surface
+
+
+@functools.lru_cache(maxsize=None)
+def _hp_art_present() -> bool:
+    """True si están todos los archivos de HUD_HP_SPRITES (se mira una sola vez)."""
+    return all(os.path.isfile(path) for path in HUD_HP_SPRITES.values())
+
+
+class Hud:
+    """Widgets cacheados del HUD. ``draw_status`` y ``draw_inventory`` se llaman cada frame."""
+
+    def __init__(self, font: pygame.font.Font, heart_img: Optional[pygame.Surface] = None,
+                 heart_empty_img: Optional[pygame.Surface] = None,
+                 key_img: Optional[pygame.Surface] = None,
+                 hp_sprites: bool = HUD_HP_SPRITES_ENABLED) -> None:
+        self.font = font
+        self.heart_img = heart_img
+        self.heart_empty_img = heart_empty_img
+        self.key_img = key_img
+        # Arte de barra de vida por HP (None: corazones)
+        self.hp_art: Optional[Dict[int, pygame.Surface]] = self._load_hp_art() if hp_sprites else None
+        self.status = _Widget(self._render_status)
+        self.score = _Widget(self._render_score)
+        self.inventory = _Widget(self._render_inventory)
+
+    @staticmethod
+    def _load_hp_art() -> Optional[Dict[int, pygame.Surface]]:
+        """Sprites de HUD_HP_SPRITES escalados a la altura de los corazones; None si falta alguno."""
+        if not _hp_art_present():
+            return None
+        art = {}
+        try:
+            for hp, path in HUD_HP_SPRITES.items():
+                raw = load_image(path)
+                w, h = raw.get_size()
+                size = (max(1, round(w * HUD_HEART_SIZE / h)), HUD_HEART_SIZE)
+                art[hp] = load_image(path, size)
+        except (pygame.error, OSError, ZeroDivisionError) as e:
+            print(f"WARNING: sin arte de barra de vida ({e}); se usan corazones")
+            return None
+        return art or None
+
+    def _hp_art_key(self, hp: int, max_hp: int) -> int:
+        """Sprite de HUD_HP_SPRITES para ``hp`` de ``max_hp`` (escala si max_hp no es el máximo del arte)."""
+        top = max(self.hp_art)
+        if hp <= 0:
+            return min(self.hp_art)
+        level = hp if max_hp == top else math.ceil(hp * top / max(1, max_hp))
+        level = min(top, level)
+        # Si falta algún nivel intermedio, el inmediatamente inferior
+        while level not in self.hp_art and level > 0:
+            level -= 1
+        return level if level in self.hp_art else top
+
+    # ---- Dibujo por frame ----
+    def draw_status(self, surface: pygame.Surface, player, score: int) -> List[pygame.Rect]:
+        """Vida, barra de magia y puntuación. Devuelve los rects dibujados."""
+        magic = player.magic
+        fill_w = int(MAGIC_BAR_W * (magic / MAGIC_MAX))
+        if self.hp_art is not None:
+            life = ('art', self._hp_art_key(player.hp, player.max_hp))
+        else:
+            life = ('hearts', player.hp, player.max_hp)
+        status_rect = surface.blit(self.status.get((life, fill_w, int(magic))), (HUD_MARGIN, HUD_MARGIN))
+        score_img = self.score.get(score)
+        score_rect = surface.blit(score_img, (surface.get_width() - score_img.get_width() - HUD_MARGIN, HUD_MARGIN))
+        return [status_rect, score_rect]
+
+    def draw_inventory(self, surface: pygame.Surface, inventory) -> pygame.Rect:
+        """Slots de bombas y llaves en la esquina inferior derecha. Devuelve el rect dibujado."""
+        x = surface.get_width() - INVENTORY_W
+        y = surface.get_height() - INVENTORY_H
+        return surface.blit(self.inventory.get((inventory.bombs, inventory.keys)), (x, y))
+
+    # ---- Render de cada widget ----
+    def _render_status(self, key: tuple) -> pygame.Surface:
+        life, fill_w, magic = key
+        mp_text = render_text(self.font, f"MP {magic}/{int(MAGIC_MAX)}", WHITE)
+        if life[0] == 'art':
+            life_img = self.hp_art[life[1]]
+            life_w = life_img.get_width()
+        else:
+            _, hp, max_hp = life
+            life_img = None
+            life_w = max_hp * (HUD_HEART_SIZE + HEART_GAP)
+        bar_y = HUD_HEART_SIZE + 6
+        text_y = bar_y - 2
+        width = max(life_w, MAGIC_BAR_W + 8 + mp_text.get_width())
+        height = max(bar_y + MAGIC_BAR_H, text_y + mp_text.get_height())
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+
+        if life_img is not None:
+            panel.blit(life_img, (0, 0))
+        else:
+            # Corazones (enteros)
+            for i in range(max_hp):
+                x = i * (HUD_HEART_SIZE + HEART_GAP)
+                if self.heart_img is not None:
+                    panel.blit(self.heart_img if i < hp else self.heart_empty_img, (x, 0))
+                else:
+                    # Fallback a rectángulos si no hay sprite
+                    color = RED if i < hp else (60, 60, 60)
+                    pygame.draw.rect(panel, color, (x, 0, HUD_HEART_SIZE, HUD_HEART_SIZE), border_radius=4)
+        # Barra de magia
+        pygame.draw.rect(panel, (60, 60, 60), (0, bar_y, MAGIC_BAR_W, MAGIC_BAR_H), border_radius=3)
+        pygame.draw.rect(panel, CYAN, (0, bar_y, fill_w, MAGIC_BAR_H), border_radius=3)
+        panel.blit(mp_text, (MAGIC_BAR_W + 8, text_y))
+        return panel
+
+    def _render_score(self, score: int) -> pygame.Surface:
+        return render_text(self.font, f"Puntos: {score}", WHITE)
+
+    def _render_inventory(self, key: Tuple[int, int]) -> pygame.Surface:
+        bombs, keys = key
+        txt_b = render_text(self.font, f"x{bombs}", WHITE)
+        txt_k = render_text(self.font, f"x{keys}", WHITE)
+        # Con 10 o más el texto de las llaves se sale del slot: que no se recorte
+        width = max(2 * SLOT_W + SLOT_GAP, SLOT_W + SLOT_GAP + 40 + txt_k.get_width())
+        panel = pygame.Surface((width, SLOT_H), pygame.SRCALPHA)
+
+        # Slot Bombas: ícono simple de bomba (círculo y mecha)
+        rect_b = pygame.Rect(0, 0, SLOT_W, SLOT_H)
+        pygame.draw.rect(panel, (40, 40, 40), rect_b, border_radius=6)
+        pygame.draw.rect(panel, (120, 120, 120), rect_b, 2, border_radius=6)
+        pygame.draw.circle(panel, (200, 200, 200), (rect_b.x + 14, rect_b.y + 20), 8)
+        pygame.draw.line(panel, (220, 180, 80), (rect_b.x + 20, rect_b.y + 12), (rect_b.x + 28, rect_b.y + 8), 2)
+        panel.blit(txt_b, (rect_b.x + 34, rect_b.y + 10))
+
+        # Slot Llaves: sprite de llave o ícono simple como respaldo
+        rect_k = pygame.Rect(SLOT_W + SLOT_GAP, 0, SLOT_W, SLOT_H)
+        pygame.draw.rect(panel, (40, 40, 40), rect_k, border_radius=6)
+        pygame.draw.rect(panel, (120, 120, 120), rect_k, 2, border_radius=6)
+        if self.key_img is not None:
+            panel.blit(self.key_img, (rect_k.x + 12, rect_k.y + (SLOT_H - self.key_img.get_height()) // 2))
+        else:
+            pygame.draw.circle(panel, (255, 215, 0), (rect_k.x + 14, rect_k.y + 20), 6)
+            pygame.draw.rect(panel, (255, 215, 0), (rect_k.x + 20, rect_k.y + 18, 14, 4))
+            pygame.draw.rect(panel, (255, 215, 0), (rect_k.x + 30, rect_k.y + 16, 3, 8))
+        panel.blit(txt_k, (rect_k.x + 40, rect_k.y + 10))
+        return panel
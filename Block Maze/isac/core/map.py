@@ -1,79 +1,339 @@
+"""
+Mapa del calabozo: el grande (M) y el minimapa de la esquina (N).
+
+Cada vista guarda su superficie entre frames y solo repinta las celdas que
+cambian: al entrar en una sala (la anterior, la nueva y sus vecinas), al
+cambiar una puerta de la sala actual o al visitar una sala. La niebla de
+guerra sale de ``Dungeon.visited_rooms``: las salas visitadas se ven, sus
+vecinas con puerta se intuyen (más oscuras) y el resto no se dibuja.
+
+Si el calabozo no cabe en la vista, esta es una ventana de celdas centrada
+en la sala actual: al moverse se desplaza con ``Surface.scroll`` y solo se
+pintan las filas/columnas que entran. Las vistas ya construidas se mantienen
+así aunque estén ocultas, de modo que mostrarlas no obliga a repintarlas.
+
+Mientras la vista no cambia, ``draw`` con ``damaged`` solo vuelve a volcar
+las partes del mapa sobre las que se pintó o restauró algo en el frame.
+"""
+from __future__ import annotations
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
 import pygame
-from typing import Dict, Tuple
+
+from isac.settings import (
+    MINIMAP_CORNER_ENABLED,
+    MINIMAP_CORNER_CELLS,
+    MINIMAP_CORNER_CELL_SIZE,
+    MINIMAP_VIEW_CELLS,
+    MAP_KEY,
+    MINIMAP_CORNER_KEY,
+)
+
+# (dirección, dx, dy) en el orden de Room.doors
+_DOOR_OFFSETS = (('up', 0, -1), ('down', 0, 1), ('left', -1, 0), ('right', 1, 0))
+
+# Fondo gris oscuro opaco: con transparencia por píxel volcar el mapa grande costaba 3 veces más
+BACKGROUND = (40, 40, 40)
+CURRENT_COLOR = (255, 255, 255)  # Blanco para habitación actual
+VISITED_COLOR = (150, 150, 150)
+SEEN_COLOR = (80, 80, 80)  # Vecina de una visitada: se sabe que existe
+DOOR_OPEN_COLOR = (90, 200, 120)
+DOOR_CLOSED_COLOR = (60, 60, 60)
+DOOR_LOCKED_COLOR = (220, 170, 40)
+
+
+class _MapView:
+    """Superficie persistente con una ventana de ``cols`` x ``rows`` salas del calabozo."""
+
+    def __init__(self, dungeon, cell_size: int, margin: int, max_cells: int) -> None:
+        self.dungeon = dungeon
+        self.cell_size = cell_size
+        self.margin = margin
+        self.step = cell_size + margin
+        self.max_cells = max(1, max_cells)
+        self.surface: Optional[pygame.Surface] = None
+        # Sala del calabozo que cae en la esquina superior izquierda de la vista
+        self.origin = (0, 0)
+        self.cols = self.rows = 0
+        # True: la ventana sigue a la sala actual; False: se ve todo el calabozo
+        self.scrolling = False
+        # Hay que repintarla entera antes de mostrarla
+        self.stale = True
+        self.cells_painted = 0
+        # Aumenta con cada cambio de la superficie (para saber si hay que volcarla entera)
+        self.version = 0
+        # Celdas ya pintadas por (color, colores de sus puertas); pocas combinaciones
+        self._sprites: Dict[tuple, pygame.Surface] = {}
+
+    # ---- Construcción ----
+    def rebuild(self) -> None:
+        """Ajusta la ventana al calabozo actual y repinta todas las celdas."""
+        dungeon = self.dungeon
+        rooms = dungeon.rooms
+        size = dungeon.dungeon_size
+        span = size // 2 - (-size // 2) + 1
+        if rooms and span <= self.max_cells:
+            # Calabozo pequeño: la vista son los límites reales de las salas
+            min_x = min(x for x, y in rooms)
+            max_x = max(x for x, y in rooms)
+            min_y = min(y for x, y in rooms)
+            max_y = max(y for x, y in rooms)
+            self.scrolling = False
+            self.origin = (min_x, min_y)
+            cols, rows = max_x - min_x + 1, max_y - min_y + 1
+        else:
+            self.scrolling = True
+            cols = rows = self.max_cells
+            self.origin = self._centered_origin(dungeon.current, cols, rows)
+        width = cols * self.step + self.margin
+        height = rows * self.step + self.margin
+        if self.surface is None or self.surface.get_size() != (width, height):
+            self.surface = pygame.Surface((width, height))
+            if pygame.display.get_surface() is not None:
+                # Mismo formato que la pantalla: blit sin conversión
+                self.surface = self.surface.convert()
+        self.cols, self.rows = cols, rows
+        self.surface.fill(BACKGROUND)
+        if self.scrolling:
+            ox, oy = self.origin
+            self.paint_cells(((ox + c, oy + r) for r in range(rows) for c in range(cols)), clear=False)
+        else:
+            self.paint_cells(rooms, clear=False)
+        self.stale = False
+        self.version += 1
+
+    @staticmethod
+    def _centered_origin(center: Tuple[int, int], cols: int, rows: int) -> Tuple[int, int]:
+        return center[0] - cols // 2, center[1] - rows // 2
+
+    def follow(self, center: Tuple[int, int]) -> None:
+        """Centra la ventana en ``center`` desplazando lo ya pintado; solo pinta lo que entra."""
+        if not self.scrolling:
+            return
+        ox, oy = self.origin
+        nx, ny = self._centered_origin(center, self.cols, self.rows)
+        dx, dy = nx - ox, ny - oy
+        if not dx and not dy:
+            return
+        self.version += 1
+        if abs(dx) >= self.cols or abs(dy) >= self.rows:
+            self.origin = (nx, ny)
+            self.surface.fill(BACKGROUND)
+            self.paint_cells(((nx + c, ny + r) for r in range(self.rows) for c in range(self.cols)), clear=False)
+            return
+        self.surface.scroll(-dx * self.step, -dy * self.step)
+        self.origin = (nx, ny)
+        # Franjas que entran: limpiarlas (el scroll deja ahí lo que había) y pintarlas
+        w, h = self.surface.get_size()
+        cols = range(self.cols - dx, self.cols) if dx > 0 else range(0, -dx)
+        rows = range(self.rows - dy, self.rows) if dy > 0 else range(0, -dy)
+        entering: Set[Tuple[int, int]] = set()
+        if dx:
+            x0 = cols[0] * self.step
+            self.surface.fill(BACKGROUND, (x0, 0, len(cols) * self.step + self.margin, h))
+            entering.update((nx + c, ny + r) for c in cols for r in range(self.rows))
+        if dy:
+            y0 = rows[0] * self.step
+            self.surface.fill(BACKGROUND, (0, y0, w, len(rows) * self.step + self.margin))
+            entering.update((nx + c, ny + r) for r in rows for c in range(self.cols))
+        # Las franjas ya están limpias: solo se pinta lo que sale de la niebla
+        self.paint_cells(entering, clear=False)
+
+    # ---- Pintado por celdas ----
+    def paint_cells(self, cells: Iterable[Tuple[int, int]], clear: bool = True) -> None:
+        for pos in cells:
+            self.paint(pos, clear)
+
+    def paint(self, pos: Tuple[int, int], clear: bool = True) -> None:
+        """
+        Repinta la celda de la sala ``pos`` según su estado (actual, visitada,
+        intuida u oculta). Con ``clear=False`` la celda ya tiene el fondo y las
+        ocultas no se tocan.
+        """
+        col, row = pos[0] - self.origin[0], pos[1] - self.origin[1]
+        if not (0 <= col < self.cols and 0 <= row < self.rows):
+            return
+        self.cells_painted += 1
+        self.version += 1
+        dungeon = self.dungeon
+        room = dungeon.rooms.get(pos)
+        color = None
+        if room is not None:
+            visited = dungeon.visited_rooms
+            x, y = pos
+            if pos == dungeon.current:
+                color = CURRENT_COLOR
+            elif pos in visited:
+                color = VISITED_COLOR
+            elif any(room.doors[d].exists and (x + dx, y + dy) in visited for d, dx, dy in _DOOR_OFFSETS):
+                color = SEEN_COLOR
+        cs = self.cell_size
+        cell = pygame.Rect(self.margin + col * self.step, self.margin + row * self.step, cs, cs)
+        surface = self.surface
+        if color is None:
+            # Niebla de guerra (o no hay sala)
+            if clear:
+                surface.fill(BACKGROUND, cell)
+            return
+        if color is SEEN_COLOR:
+            surface.fill(color, cell)
+            return
+        # Puertas de las salas conocidas: una muesca en el borde, del color de su estado
+        doors = tuple(
+            None if not door.exists else
+            DOOR_LOCKED_COLOR if door.locked else (DOOR_OPEN_COLOR if door.open else DOOR_CLOSED_COLOR)
+            for door in (room.doors[d] for d, _, _ in _DOOR_OFFSETS)
+        )
+        surface.blit(self._cell_sprite(color, doors), cell)
+
+    def _cell_sprite(self, color: Tuple[int, int, int], doors: tuple) -> pygame.Surface:
+        """Celda con sus muescas de puerta ya pintadas: un solo blit en vez de hasta 5 fills."""
+        key = (color, doors)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            cs = self.cell_size
+            sprite = pygame.Surface((cs, cs))
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert()
+            sprite.fill(color)
+            notch = max(2, cs // 3)
+            depth = max(1, cs // 6)
+            for (_, dx, dy), door_color in zip(_DOOR_OFFSETS, doors):
+                if door_color is None:
+                    continue
+                if dx:
+                    nx = cs - depth if dx > 0 else 0
+                    sprite.fill(door_color, (nx, cs // 2 - notch // 2, depth, notch))
+                else:
+                    ny = cs - depth if dy > 0 else 0
+                    sprite.fill(door_color, (cs // 2 - notch // 2, ny, notch, depth))
+            self._sprites[key] = sprite
+        return sprite
+
 
 class MapViewer:
-    def __init__(self, dungeon, cell_size=20, margin=5):
+    """
+    Mapa grande (``visible``, tecla M) y minimapa siempre visible en la
+    esquina (``corner``, tecla N). ``draw`` lo llama la escena cada frame:
+    comprueba en O(1) si cambió la sala actual, las visitadas o las puertas
+    de la sala actual y repinta solo esas celdas.
+    """
+
+    def __init__(self, dungeon, cell_size=20, margin=5, corner: bool = MINIMAP_CORNER_ENABLED):
         self.dungeon = dungeon
         self.cell_size = cell_size
         self.margin = margin
         self.visible = False
-        self.surface = None
-        self.rect = None
-        
+        self.corner = corner
+        self.full_view = _MapView(dungeon, cell_size, margin, MINIMAP_VIEW_CELLS)
+        self.corner_view = _MapView(dungeon, MINIMAP_CORNER_CELL_SIZE, 2, MINIMAP_CORNER_CELLS)
+        # Rect (pantalla) de lo dibujado en el último frame; None si no se dibujó nada
+        self.rect: Optional[pygame.Rect] = None
+        # Vista y versión que quedaron volcadas enteras en pantalla
+        self._blitted: Optional[Tuple[_MapView, int]] = None
+        # Estado con el que se pintaron las vistas
+        self._floor_key = None
+        self._current: Optional[Tuple[int, int]] = None
+        self._visited = 0
+        self._doors: Optional[tuple] = None
+
+    @property
+    def surface(self) -> Optional[pygame.Surface]:
+        view = self._shown_view()
+        return view.surface if view is not None else None
+
     def toggle(self):
         self.visible = not self.visible
+
+    def toggle_corner(self) -> None:
+        self.corner = not self.corner
+
+    def _shown_view(self) -> Optional[_MapView]:
         if self.visible:
-            self._update_surface()
-    
-    def _update_surface(self):
-        rooms = self.dungeon.rooms
-        current = self.dungeon.current
-        
-        if not rooms:
-            return
-            
-        # Calcular límites del mapa
-        min_x = min(x for x, y in rooms)
-        max_x = max(x for x, y in rooms)
-        min_y = min(y for x, y in rooms)
-        max_y = max(y for x, y in rooms)
-        
-        # Tamaño del mapa
-        width = (max_x - min_x + 1) * (self.cell_size + self.margin) + self.margin
-        height = (max_y - min_y + 1) * (self.cell_size + self.margin) + self.margin
-        
-        # Crear superficie con transparencia
-        self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        self.surface.fill((40, 40, 40, 200))  # Fondo gris oscuro semitransparente
-        
-        # Dibujar habitaciones
-        for (gx, gy), room in rooms.items():
-            # Calcular posición en pantalla
-            x = (gx - min_x) * (self.cell_size + self.margin) + self.margin
-            y = (gy - min_y) * (self.cell_size + self.margin) + self.margin
-            
-            # Color según si es la habitación actual o adyacente
-            if (gx, gy) == current:
-                color = (255, 255, 255)  # Blanco para habitación actual
-            else:
-                # Verificar si es adyacente a la habitación actual
-                is_adjacent = any(
-                    (gx + dx, gy + dy) == current
-                    for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]
-                )
-                color = (150, 150, 150) if is_adjacent else (80, 80, 80)
-            
-            # Dibujar habitación
-            pygame.draw.rect(
-                self.surface, 
-                color, 
-                (x, y, self.cell_size, self.cell_size)
-            )
-        
-        # Posicionar en la esquina superior derecha
-        screen = pygame.display.get_surface()
-        if screen:
-            self.rect = self.surface.get_rect(
-                top=20,
-                right=screen.get_width() - 20
-            )
-    
-    def draw(self, surface):
-        if self.visible and self.surface and self.rect:
-            surface.blit(self.surface, self.rect)
-    
+            return self.full_view
+        return self.corner_view if self.corner else None
+
+    def _door_state(self) -> tuple:
+        room = self.dungeon.rooms.get(self.dungeon.current)
+        if room is None:
+            return ()
+        return tuple((door.exists, door.open, door.locked) for door in room.doors.values())
+
+    def update(self) -> None:
+        """Anota lo que cambió desde el último frame y repinta esas celdas en la vista visible."""
+        dungeon = self.dungeon
+        views = (self.full_view, self.corner_view)
+        shown = self._shown_view()
+        floor_key = (dungeon.floor, id(dungeon.rooms))
+        if floor_key != self._floor_key:
+            # Piso nuevo: todo se repinta al mostrarse
+            self._floor_key = floor_key
+            self._current = dungeon.current
+            self._visited = len(dungeon.visited_rooms)
+            self._doors = self._door_state()
+            for view in views:
+                view.stale = True
+        else:
+            current = dungeon.current
+            doors = self._door_state()
+            visited = len(dungeon.visited_rooms)
+            if current != self._current or visited != self._visited or doors != self._doors:
+                # La sala anterior, la actual y sus vecinas (pueden salir de la niebla).
+                # También en la vista oculta, si ya se construyó: al mostrarla no hay que rehacerla.
+                x, y = current
+                cells = [self._current, current] + [(x + dx, y + dy) for _, dx, dy in _DOOR_OFFSETS]
+                for view in views:
+                    if not view.stale:
+                        view.follow(current)
+                        view.paint_cells(cells)
+                self._current, self._visited, self._doors = current, visited, doors
+        if shown is not None and shown.stale:
+            shown.rebuild()
+
+    def placement(self, surface: pygame.Surface) -> Optional[pygame.Rect]:
+        """Rect de pantalla donde irá la vista activa este frame (None si no hay ninguna)."""
+        self.update()
+        view = self._shown_view()
+        if view is None or view.surface is None:
+            return None
+        if view is self.full_view:
+            # Mapa grande en la esquina superior derecha
+            return view.surface.get_rect(top=20, right=surface.get_width() - 20)
+        # Minimapa bajo el indicador de escudo
+        return view.surface.get_rect(top=40, right=surface.get_width() - 10)
+
+    def draw(self, surface: pygame.Surface,
+             damaged: Optional[Sequence[pygame.Rect]] = None) -> List[pygame.Rect]:
+        """
+        Dibuja la vista activa y devuelve los rects volcados. Con ``damaged``
+        (rects pintados o restaurados encima del mapa del frame anterior), si
+        la vista no cambió ni se movió solo se vuelcan esas partes.
+        """
+        rect = self.placement(surface)
+        view = self._shown_view()
+        if rect is None:
+            self.rect = None
+            self._blitted = None
+            return []
+        state = (view, view.version)
+        if damaged is None or rect != self.rect or state != self._blitted:
+            self.rect = rect
+            self._blitted = state
+            surface.blit(view.surface, rect)
+            return [rect]
+        blits = []
+        for r in damaged:
+            part = r.clip(rect)
+            if part.width and part.height:
+                surface.blit(view.surface, part, part.move(-rect.x, -rect.y))
+                blits.append(part)
+        return blits
+
     def handle_event(self, event):
-        if event.type == pygame.KEYDOWN and event.key == pygame.K_m:
+        if event.type == pygame.KEYDOWN and event.key == MAP_KEY:
             self.toggle()
             return True
+        if event.type == pygame.KEYDOWN and event.key == MINIMAP_CORNER_KEY:
+            self.toggle_corner()
+            return True
         return False
@@ -0,0 +1,17 @@
+"""
+Movimiento sub-píxel para entidades con ``pygame.Rect``.
+
+Los rects solo guardan enteros: ``rect.x += int(vx * dt)`` pierde la parte
+decimal en cada paso, y con pasos de simulación pequeños una entidad lenta
+puede no moverse nunca. ``subpixel_step`` devuelve los píxeles enteros a
+mover y arrastra el resto al siguiente paso.
+"""
+from __future__ import annotations
+from typing import Tuple
+
+
+def subpixel_step(amount: float, carry: float) -> Tuple[int, float]:
+    """Devuelve (píxeles enteros a mover, resto para el próximo paso)."""
+    total = amount + carry
+    step = int(total)
+    return step, total - step
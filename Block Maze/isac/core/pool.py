@@ -0,0 +1,56 @@
+"""
+Reciclaje de objetos de vida corta (flechas, pinchos, flashes de muerte).
+
+Con disparo infinito o BIG SHOT se crean decenas de objetos por segundo. En
+lugar de construir uno nuevo en cada disparo, ``ObjectPool`` guarda los que
+ya murieron y los reinicia en sitio con su método ``reset``, que debe
+aceptar los mismos argumentos que el constructor.
+"""
+from __future__ import annotations
+from typing import Callable, Generic, List, TypeVar
+
+T = TypeVar('T')
+
+
+class ObjectPool(Generic[T]):
+    """Pool de objetos reutilizables con ``reset(*args)`` y atributo ``alive``."""
+
+    def __init__(self, factory: Callable[..., T], max_free: int = 256) -> None:
+        self._factory = factory
+        self._free: List[T] = []
+        self.max_free = max_free
+        self.created = 0
+
+    def acquire(self, *args, **kwargs) -> T:
+        """Devuelve un objeto listo para usar, reciclado si hay alguno libre."""
+        if self._free:
+            obj = self._free.pop()
+            obj.reset(*args, **kwargs)
+            return obj
+        self.created += 1
+        return self._factory(*args, **kwargs)
+
+    def release(self, obj: T) -> None:
+        if len(self._free) < self.max_free:
+            self._free.append(obj)
+
+    def release_all(self, items: List[T]) -> None:
+        """Devuelve todos los objetos de ``items`` al pool y vacía la lista."""
+        for obj in items:
+            self.release(obj)
+        items.clear()
+
+    def collect(self, items: List[T]) -> None:
+        """Compacta ``items`` en sitio: conserva los vivos y recicla los muertos."""
+        keep = 0
+        for obj in items:
+            if obj.alive:
+                items[keep] = obj
+                keep += 1
+            else:
+                self.release(obj)
+        del items[keep:]
+
+    @property
+    def free(self) -> int:
+        return len(self._free)
@@ -0,0 +1,116 @@
+"""
+Manifiesto de assets y precargador en segundo plano.
+
+El precargador decodifica los PNG del manifiesto en un pool de hilos mientras
+la escena de carga muestra el progreso. La conversión al formato de la
+ventana (``convert_alpha``) necesita el hilo principal, así que los hilos
+solo decodifican y ``Game`` adopta las superficies en cada frame.
+"""
+from __future__ import annotations
+import os
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import List, Optional, Tuple
+
+import pygame
+
+from isac.settings import HUD_HP_SPRITES
+from isac.core.assets import decode_image
+
+ASSETS_ROOT = 'assets'
+# Subcarpetas de assets/ que se recorren completas
+MANIFEST_DIRS = ('enemies', 'boss', 'bullet', 'structure', 'player')
+IMAGE_EXTENSIONS = ('.png',)
+
+
+def build_manifest(root: str = ASSETS_ROOT) -> List[str]:
+    """
+    Devuelve la lista (sin duplicados y en orden estable) de imágenes a precargar.
+
+    Incluye todo lo que hay en ``MANIFEST_DIRS``, las rutas de los personajes
+    de ``isac.characters`` y los sprites de vida de ``HUD_HP_SPRITES``.
+    """
+    from isac.characters import GLASS, CRYSTAL, DIAMOND
+
+    paths: List[str] = []
+    for sub in MANIFEST_DIRS:
+        base = os.path.join(root, sub)
+        for dirpath, dirnames, filenames in os.walk(base):
+            dirnames.sort()
+            for name in sorted(filenames):
+                if name.lower().endswith(IMAGE_EXTENSIONS):
+                    paths.append(os.path.join(dirpath, name))
+
+    for character in (GLASS, CRYSTAL, DIAMOND):
+        paths.extend(character.sprite_paths.values())
+    paths.extend(HUD_HP_SPRITES.values())
+
+    seen = set()
+    manifest: List[str] = []
+    for path in paths:
+        key = os.path.normcase(os.path.normpath(path))
+        if key not in seen:
+            seen.add(key)
+            manifest.append(path)
+    return manifest
+
+
+def _decode(path: str) -> Tuple[str, Optional[pygame.Surface], str]:
+    try:
+        return path, decode_image(path), ""
+    except (pygame.error, OSError) as e:
+        return path, None, str(e)
+
+
+class AssetPreloader:
+    """Decodifica un manifiesto en segundo plano y entrega los resultados por cola."""
+
+    def __init__(self, paths: List[str], workers: int = 4) -> None:
+        self.paths = list(paths)
+        self.workers = max(1, workers)
+        self.total = len(self.paths)
+        self.loaded = 0
+        self.failed: List[str] = []
+        self._results: "queue.Queue[Tuple[str, Optional[pygame.Surface], str]]" = queue.Queue()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def start(self) -> None:
+        if self._executor is not None or not self.paths:
+            return
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='asset-preload')
+        for path in self.paths:
+            future = self._executor.submit(_decode, path)
+            future.add_done_callback(partial(self._finished, path))
+        # No bloquear: los hilos terminan solos cuando se vacía la cola
+        self._executor.shutdown(wait=False)
+
+    def _finished(self, path: str, future: Future) -> None:
+        """Encola el resultado de ``path``; siempre encola algo para que ``done`` llegue a cumplirse."""
+        try:
+            result = future.result()
+        except Exception as e:  # Error inesperado en el hilo: se trata como asset que no se pudo cargar
+            result = (path, None, f"{type(e).__name__}: {e}")
+        self._results.put(result)
+
+    def drain(self, max_items: int = 64) -> List[Tuple[str, Optional[pygame.Surface], str]]:
+        """Recoge hasta ``max_items`` resultados ya decodificados (no bloquea)."""
+        items = []
+        while len(items) < max_items:
+            try:
+                item = self._results.get_nowait()
+            except queue.Empty:
+                break
+            items.append(item)
+            self.loaded += 1
+            if item[1] is None:
+                self.failed.append(item[0])
+        return items
+
+    @property
+    def progress(self) -> float:
+        return 1.0 if self.total == 0 else self.loaded / self.total
+
+    @property
+    def done(self) -> bool:
+        return self.loaded >= self.total
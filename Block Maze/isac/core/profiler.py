@@ -0,0 +1,246 @@
+"""
+Tiempos por fase de cada frame.
+
+``Game.run`` mide eventos, update, draw y flip; ``PlayScene.update`` mide
+sus propias subfases (jugador, flechas, bombas, enemigos, ...). Las fases se
+anidan: una fase abierta dentro de ``update`` se guarda como
+``update/enemies``. Cada frame se vuelca en un buffer circular de tamaño
+fijo, así que medir no reserva memoria nueva durante la partida::
+
+    with profiler.phase('enemies'):
+        ...
+    profiler.end_frame()
+
+``ProfilerOverlay`` muestra media/p95/p99 por fase y la gráfica de los
+últimos frames (F3); ``export_csv`` guarda el buffer (F4).
+"""
+from __future__ import annotations
+import csv
+import time
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+from isac.settings import PROFILER_ENABLED, PROFILER_HISTORY, PROFILER_OVERLAY_REFRESH, FPS
+
+FRAME_KEY = 'frame'
+
+
+class _Section:
+    """Context manager reutilizable de una fase (uno por nombre)."""
+
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler: "FrameProfiler", name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> "_Section":
+        self.profiler._stack.append(self.name)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        elapsed = time.perf_counter() - self.start
+        p = self.profiler
+        key = '/'.join(p._stack)
+        p._stack.pop()
+        p._current[key] = p._current.get(key, 0.0) + elapsed
+
+
+class _NullSection:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSection":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+
+_NULL_SECTION = _NullSection()
+
+
+class FrameProfiler:
+    """Acumula el tiempo de cada fase durante el frame y lo guarda en un buffer circular."""
+
+    def __init__(self, capacity: int = PROFILER_HISTORY, enabled: bool = PROFILER_ENABLED) -> None:
+        self.capacity = max(1, int(capacity))
+        self.enabled = enabled
+        self._sections: Dict[str, _Section] = {}
+        self._stack: List[str] = []
+        self._current: Dict[str, float] = {}
+        self._frame_start: Optional[float] = None
+        # Segundos por frame y por fase; índice = nº de frame % capacity
+        self._frames = array('d', bytes(8 * self.capacity))
+        self._samples: Dict[str, array] = {}
+        self._cursor = 0
+        self.count = 0
+        self.frames_recorded = 0
+
+    def phase(self, name: str):
+        """Context manager que suma el tiempo del bloque a la fase ``name`` del frame actual."""
+        if not self.enabled:
+            return _NULL_SECTION
+        section = self._sections.get(name)
+        if section is None:
+            section = self._sections[name] = _Section(self, name)
+        return section
+
+    def begin_frame(self) -> None:
+        if self.enabled:
+            self._frame_start = time.perf_counter()
+
+    def end_frame(self, total: Optional[float] = None) -> None:
+        """Cierra el frame. ``total`` (segundos) por defecto es el tiempo desde begin_frame."""
+        if not self.enabled:
+            return
+        if total is None:
+            start = self._frame_start
+            total = time.perf_counter() - start if start is not None else sum(
+                v for k, v in self._current.items() if '/' not in k)
+        i = self._cursor
+        self._frames[i] = total
+        for key, series in self._samples.items():
+            series[i] = self._current.pop(key, 0.0)
+        for key, value in self._current.items():
+            # Fase nueva: los frames anteriores cuentan como 0
+            series = self._samples[key] = array('d', bytes(8 * self.capacity))
+            series[i] = value
+        self._current.clear()
+        self._stack.clear()
+        self._frame_start = None
+        self._cursor = (i + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        self.frames_recorded += 1
+
+    def reset(self) -> None:
+        self._current.clear()
+        self._stack.clear()
+        self._samples.clear()
+        self._cursor = 0
+        self.count = 0
+
+    # ---- Consultas ----
+    def keys(self) -> List[str]:
+        """Fases registradas; cada padre va antes que sus hijas."""
+        return sorted(self._samples)
+
+    def series(self, key: str = FRAME_KEY) -> List[float]:
+        """Valores (segundos) de los frames guardados, del más antiguo al más reciente."""
+        data = self._frames if key == FRAME_KEY else self._samples.get(key)
+        if data is None or self.count == 0:
+            return []
+        if self.count < self.capacity:
+            return list(data[:self.count])
+        i = self._cursor
+        return list(data[i:]) + list(data[:i])
+
+    def stats(self, key: str = FRAME_KEY) -> Tuple[float, float, float]:
+        """(media, p95, p99) en milisegundos."""
+        values = self.series(key)
+        if not values:
+            return 0.0, 0.0, 0.0
+        ordered = sorted(values)
+        n = len(ordered)
+
+        def pct(p: float) -> float:
+            return ordered[min(n - 1, int(round(p * (n - 1))))] * 1000.0
+        return sum(ordered) * 1000.0 / n, pct(0.95), pct(0.99)
+
+    def export_csv(self, path: str) -> str:
+        """Guarda un frame por fila (ms por fase) y devuelve la ruta."""
+        keys = self.keys()
+        columns = [self.series(FRAME_KEY)] + [self.series(k) for k in keys]
+        first = self.frames_recorded - self.count
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['frame', FRAME_KEY + '_ms'] + [k + '_ms' for k in keys])
+            for row in range(self.count):
+                writer.writerow([first + row] + [f'{col[row] * 1000.0:.4f}' for col in columns])
+        return path
+
+
+# Perfilador compartido por Game y las escenas
+profiler = FrameProfiler()
+
+
+class ProfilerOverlay:
+    """Panel opaco con media/p95/p99 por fase y la gráfica de tiempos de frame."""
+
+    WIDTH = 330
+    ROW_HEIGHT = 16
+    GRAPH_HEIGHT = 60
+    # Escala de la gráfica: 3 frames de presupuesto
+    GRAPH_MAX_MS = 3 * 1000.0 / FPS
+
+    def __init__(self, source: FrameProfiler = profiler) -> None:
+        self.source = source
+        self.visible = False
+        self._panel: Optional[pygame.Surface] = None
+        self._built_at = -1
+
+    def toggle(self) -> None:
+        self.visible = not self.visible
+        self._panel = None
+
+    def rect(self, surface: pygame.Surface) -> pygame.Rect:
+        height = self._panel.get_height() if self._panel else 0
+        return pygame.Rect(surface.get_width() - self.WIDTH - 8, 8, self.WIDTH, height)
+
+    def draw(self, surface: pygame.Surface) -> Optional[pygame.Rect]:
+        """Dibuja el panel (se rehace cada PROFILER_OVERLAY_REFRESH frames) y devuelve su rect."""
+        if not self.visible:
+            return None
+        frames = self.source.frames_recorded
+        if self._panel is None or frames - self._built_at >= PROFILER_OVERLAY_REFRESH:
+            self._panel = self._build()
+            self._built_at = frames
+        r = self.rect(surface)
+        surface.blit(self._panel, r)
+        return r
+
+    def _build(self) -> pygame.Surface:
+        from isac.core.fonts import get_font
+        font = get_font(18)
+        src = self.source
+        rows = [FRAME_KEY] + src.keys()
+        height = 8 + (len(rows) + 1) * self.ROW_HEIGHT + 8 + self.GRAPH_HEIGHT + 8
+        panel = pygame.Surface((self.WIDTH, height))
+        panel.fill((15, 15, 20))
+        pygame.draw.rect(panel, (90, 90, 110), panel.get_rect(), 1)
+
+        def text(s: str, x: int, y: int, color=(220, 220, 220), right: bool = False) -> None:
+            img = font.render(s, True, color)
+            panel.blit(img, (x - img.get_width(), y) if right else (x, y))
+
+        y = 8
+        text('fase (ms)', 8, y, (160, 160, 180))
+        for label, x in (('avg', 200), ('p95', 260), ('p99', 320)):
+            text(label, x, y, (160, 160, 180), right=True)
+        for key in rows:
+            y += self.ROW_HEIGHT
+            depth = key.count('/')
+            avg, p95, p99 = src.stats(key)
+            color = (255, 230, 120) if key == FRAME_KEY else (220, 220, 220)
+            text(key.rsplit('/', 1)[-1], 8 + 12 * depth, y, color)
+            for value, x in ((avg, 200), (p95, 260), (p99, 320)):
+                text(f'{value:.2f}', x, y, color, right=True)
+
+        # Gráfica: una columna por frame, los más recientes a la derecha
+        y += self.ROW_HEIGHT + 8
+        graph = pygame.Rect(8, y, self.WIDTH - 16, self.GRAPH_HEIGHT)
+        pygame.draw.rect(panel, (30, 30, 40), graph)
+        budget_y = graph.bottom - int(graph.height * (1000.0 / FPS) / self.GRAPH_MAX_MS)
+        pygame.draw.line(panel, (80, 160, 80), (graph.left, budget_y), (graph.right - 1, budget_y))
+        values = src.series(FRAME_KEY)[-graph.width:]
+        x0 = graph.right - len(values)
+        for i, seconds in enumerate(values):
+            ms = seconds * 1000.0
+            h = min(graph.height, int(graph.height * ms / self.GRAPH_MAX_MS))
+            color = (90, 200, 90) if ms <= 1000.0 / FPS else (230, 90, 70)
+            if h > 0:
+                pygame.draw.line(panel, color, (x0 + i, graph.bottom - 1), (x0 + i, graph.bottom - h))
+        return panel
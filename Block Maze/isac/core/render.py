@@ -0,0 +1,122 @@
+"""
+Piezas del renderizado por capas de ``PlayScene``.
+
+``StaticLayer`` guarda una superficie opaca pre-renderizada (suelo, paredes,
+obstáculos y puertas) que solo se reconstruye cuando cambia su clave.
+``DirtyRectTracker`` recuerda qué zonas de la pantalla se pintaron en el
+frame anterior para restaurarlas desde la capa estática y volcar a la
+ventana solo los rects que cambiaron con ``pygame.display.update(rects)``.
+"""
+from __future__ import annotations
+from typing import Callable, Hashable, Iterable, List, Optional, Tuple
+
+import pygame
+
+
+class StaticLayer:
+    """Superficie opaca que se reconstruye solo cuando cambia ``key``."""
+
+    def __init__(self, size: Tuple[int, int], fill: Tuple[int, int, int]) -> None:
+        self.size = size
+        self.fill = fill
+        self.surface: Optional[pygame.Surface] = None
+        self._key: Hashable = None
+        self.rebuilds = 0
+
+    def get(self, key: Hashable, build: Callable[[pygame.Surface], None]) -> Tuple[pygame.Surface, bool]:
+        """Devuelve (superficie, reconstruida). ``build`` pinta sobre el fondo ya relleno."""
+        if self.surface is not None and key == self._key:
+            return self.surface, False
+        if self.surface is None:
+            self.surface = pygame.Surface(self.size)
+            if pygame.display.get_surface() is not None:
+                self.surface = self.surface.convert()
+        self.surface.fill(self.fill)
+        build(self.surface)
+        self._key = key
+        self.rebuilds += 1
+        return self.surface, True
+
+    def invalidate(self) -> None:
+        self._key = None
+
+
+def merge_rects(rects: List[pygame.Rect]) -> List[pygame.Rect]:
+    """
+    Junta los rects que se solapan cuando la unión no cubre más que los dos
+    por separado (p. ej. la posición anterior y la actual de una entidad).
+    """
+    merged: List[pygame.Rect] = []
+    for r in rects:
+        r = pygame.Rect(r)
+        joined = True
+        while joined:
+            joined = False
+            for i, m in enumerate(merged):
+                if m.colliderect(r):
+                    u = m.union(r)
+                    if u.width * u.height <= m.width * m.height + r.width * r.height:
+                        r = u
+                        merged.pop(i)
+                        joined = True
+                        break
+        merged.append(r)
+    return merged
+
+
+class DirtyRectTracker:
+    """Rects pintados por frame para restaurar el fondo y volcar solo lo que cambió."""
+
+    def __init__(self, screen_rect: pygame.Rect, max_coverage: float = 0.5) -> None:
+        self.screen_rect = pygame.Rect(screen_rect)
+        # Por encima de esta fracción de pantalla sale más barato un flip completo
+        self.max_coverage = max_coverage
+        self._previous: List[pygame.Rect] = []
+        self._clean = False
+        self._update: Optional[List[pygame.Rect]] = None
+
+    def can_skip_full(self) -> bool:
+        """True si la pantalla quedó en el frame anterior igual a capa + entidades + UI."""
+        return self._clean
+
+    def invalidate(self) -> None:
+        self._clean = False
+
+    @property
+    def previous(self) -> List[pygame.Rect]:
+        """Rects que ``restore`` repinta este frame (los dibujados en el anterior)."""
+        return self._previous
+
+    def restore(self, surface: pygame.Surface, background: pygame.Surface) -> None:
+        """Repinta desde ``background`` las zonas que se dibujaron en el frame anterior."""
+        for r in self._previous:
+            surface.blit(background, r, r)
+
+    def end_frame(self, drawn: Iterable[pygame.Rect], full: bool, clean: bool,
+                  kept: Iterable[pygame.Rect] = ()) -> None:
+        """
+        Cierra el frame. ``drawn`` son los rects pintados encima de la capa
+        estática; ``full`` indica que se redibujó la pantalla entera y
+        ``clean`` que no quedó nada fuera de esos rects (sin shake ni overlays).
+        ``kept`` son rects que se vuelcan a la ventana pero que siguen siendo
+        válidos en el frame siguiente (no se restauran; p. ej. el mapa).
+        """
+        screen = self.screen_rect
+        current = [r.clip(screen) for r in drawn]
+        current = [r for r in current if r.width > 0 and r.height > 0]
+        if full:
+            self._update = None
+        else:
+            kept = [r.clip(screen) for r in kept]
+            rects = merge_rects(self._previous + current + [r for r in kept if r.width > 0 and r.height > 0])
+            area = sum(r.width * r.height for r in rects)
+            if area > self.max_coverage * screen.width * screen.height:
+                self._update = None
+            else:
+                self._update = rects
+        self._previous = current
+        self._clean = clean
+
+    def update_rects(self) -> Optional[List[pygame.Rect]]:
+        """Rects a volcar en la ventana, o None para hacer flip de la pantalla entera."""
+        return self._update
@@ -0,0 +1,63 @@
+"""
+Números aleatorios deterministas a partir de una semilla de partida.
+
+Cada subsistema (generación del mapa, patrón y colores de cada sala, spawns,
+botín, efectos) usa su propio ``random.Random`` derivado de la semilla de la
+partida, así que lo que consume uno no altera la secuencia de los demás y
+una misma semilla reproduce la misma partida::
+
+    rng = RNGService(1234)
+    layout = rng.for_room('layout', (2, -1))   # siempre igual para (1234, (2, -1))
+    loot = rng.stream('loot')                  # una única secuencia por partida
+
+Las salas pueden regenerar su patrón desde ``(seed, pos)`` en lugar de guardarlo.
+"""
+from __future__ import annotations
+import hashlib
+import random
+from typing import Dict, Hashable, Optional, Tuple
+
+SEED_BITS = 63
+
+
+def derive_seed(seed: int, *parts: Hashable) -> int:
+    """
+    Semilla estable para ``(seed, *parts)``. No usa ``hash()`` porque el de
+    las cadenas cambia entre ejecuciones (PYTHONHASHSEED).
+    """
+    key = repr((seed,) + parts).encode('utf-8')
+    digest = hashlib.blake2b(key, digest_size=8).digest()
+    return int.from_bytes(digest, 'little') >> (64 - SEED_BITS)
+
+
+def new_seed() -> int:
+    """Semilla nueva tomada del sistema operativo."""
+    return random.SystemRandom().getrandbits(SEED_BITS)
+
+
+def room_random(seed: int, name: str, pos: Tuple[int, int]) -> random.Random:
+    """Generador nuevo para el subsistema ``name`` de la sala en ``pos``."""
+    return random.Random(derive_seed(seed, name, tuple(pos)))
+
+
+class RNGService:
+    """Semilla de la partida y generadores independientes por subsistema."""
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        self.seed = new_seed() if seed is None else int(seed)
+        self._streams: Dict[str, random.Random] = {}
+
+    def stream(self, name: str) -> random.Random:
+        """Secuencia única del subsistema ``name`` durante toda la partida."""
+        rng = self._streams.get(name)
+        if rng is None:
+            rng = self._streams[name] = random.Random(derive_seed(self.seed, name))
+        return rng
+
+    def fresh(self, name: str) -> random.Random:
+        """Generador nuevo de ``name`` (empieza siempre en el mismo punto)."""
+        return random.Random(derive_seed(self.seed, name))
+
+    def for_room(self, name: str, pos: Tuple[int, int]) -> random.Random:
+        """Generador nuevo de ``name`` para la sala ``pos`` (independiente del orden de visita)."""
+        return room_random(self.seed, name, pos)
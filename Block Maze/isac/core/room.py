@@ -1,13 +1,18 @@
 import pygame
 import random
+import threading
 from dataclasses import dataclass, field
-from typing import Dict, Tuple, List, Set
+from typing import Dict, Tuple, List, Set, Optional
 
+from isac.core.collision import CollisionGrid
+from isac.core.flowfield import FlowField
+from isac.core.rng import new_seed, room_random
 # Supongamos que isac.settings está disponible
 from isac.settings import (
     WIDTH,
     HEIGHT,
     ROOM_PADDING,
+    ENEMY_SIZE,
     # ... otras configuraciones que no se muestran
 )
 
@@ -59,219 +64,202 @@ PATTERN_EMPTY = [
 ]
 
 # ----------------------------------------------------
-# --- FUNCIÓN NUEVA: Verificar Conectividad (Restricción 2) ---
+# --- Generación de Patrones Base sobre bitboards ---
 # ----------------------------------------------------
-
-def _is_map_connected(map_list: List[List[str]], size: int) -> bool:
+# El mapa es un entero: el bit (y * ROOM_SIZE + x) vale 1 si la celda es muro.
+# Las máscaras (bordes, celdas donde se permite dibujar, entradas de puerta y
+# cada forma en cada posición) se calculan una sola vez; generar una sala es
+# combinar máscaras con OR y comprobar la conectividad con un flood fill por
+# desplazamientos de bits.
+
+# Celdas de piso junto a cada puerta (fila, columna): deben quedar conectadas
+_DOOR_ENTRY_CELLS = (
+    [(1, x) for x in range(7, 11)] +
+    [(ROOM_SIZE - 2, x) for x in range(7, 11)] +
+    [(y, 1) for y in range(7, 11)] +
+    [(y, ROOM_SIZE - 2) for y in range(7, 11)]
+)
+# Zonas de puerta (fila, columna inicial, ancho) alrededor de las que no se dibujan obstáculos
+_DOOR_ZONES = (
+    (1, 7, 10),                # Arriba
+    (ROOM_SIZE - 2, 7, 10),    # Abajo
+    (7, 1, 1),                 # Izquierda (fila 7, col 1)
+    (10, 1, 1),                # Izquierda (fila 10, col 1)
+    (7, ROOM_SIZE - 2, 1),     # Derecha (fila 7, col size-2)
+    (10, ROOM_SIZE - 2, 1),    # Derecha (fila 10, col size-2)
+)
+_BIT_TO_CHAR = str.maketrans('01', FLOOR_SYMBOL + WALL_SYMBOL)
+# Intentos antes de quitar formas hasta que la sala quede conectada
+MAX_PATTERN_ATTEMPTS = 10
+
+_BORDER_MASK: Optional[int] = None
+_DRAWABLE_MASK = 0
+_DOOR_ENTRY_MASK = 0
+_SHAPE_MASKS: Dict[Tuple[str, int, int, int], int] = {}
+
+
+def _bit(y: int, x: int) -> int:
+    return 1 << (y * ROOM_SIZE + x)
+
+
+def _pattern_masks() -> None:
+    """Calcula una vez las máscaras fijas del generador."""
+    global _BORDER_MASK, _DRAWABLE_MASK, _DOOR_ENTRY_MASK
+    if _BORDER_MASK is not None:
+        return
+    size = ROOM_SIZE
+    border = drawable = 0
+    for y in range(size):
+        for x in range(size):
+            if y in (0, size - 1) or x in (0, size - 1):
+                border |= _bit(y, x)
+            elif 1 < y < size - 2 and 1 < x < size - 2 and y % CELL_SIZE == 0 and x % CELL_SIZE == 0:
+                near_door = any(abs(y - dy) <= DOOR_CLEARANCE_BUFFER * CELL_SIZE and dx <= x < dx + dw * CELL_SIZE
+                                for dy, dx, dw in _DOOR_ZONES)
+                if not near_door:
+                    drawable |= _bit(y, x)
+    entries = 0
+    for y, x in _DOOR_ENTRY_CELLS:
+        entries |= _bit(y, x)
+    _DRAWABLE_MASK = drawable
+    _DOOR_ENTRY_MASK = entries
+    _BORDER_MASK = border
+
+
+def _shape_mask(shape_type: str, s: int, start_x: int, start_y: int) -> int:
+    """Celdas de la forma, ya recortadas a las zonas donde se permite dibujar."""
+    key = (shape_type, s, start_x, start_y)
+    mask = _SHAPE_MASKS.get(key)
+    if mask is not None:
+        return mask
+    cells = []
+    if shape_type == 'line_h':
+        cells = [(start_y, x) for x in range(start_x, start_x + s)]
+    elif shape_type == 'line_v':
+        cells = [(y, start_x) for y in range(start_y, start_y + s)]
+    elif shape_type == 'square':
+        cells = [(y, x) for y in range(start_y, start_y + s) for x in range(start_x, start_x + s)]
+    elif shape_type == 'l_shape':
+        # Rama vertical y rama horizontal desde el extremo inferior
+        cells = [(y, start_x) for y in range(start_y, start_y + s)]
+        cells += [(start_y + s - 1, x) for x in range(start_x, start_x + s)]
+    elif shape_type == 'cross':
+        center_x = start_x + s // 2
+        center_y = start_y + s // 2
+        cells = [(center_y, x) for x in range(start_x, start_x + s)]
+        cells += [(y, center_x) for y in range(start_y, start_y + s)]
+    mask = 0
+    for y, x in cells:
+        for dy in range(CELL_SIZE):
+            for dx in range(CELL_SIZE):
+                if 0 <= y + dy < ROOM_SIZE and 0 <= x + dx < ROOM_SIZE:
+                    mask |= _bit(y + dy, x + dx)
+    mask &= _DRAWABLE_MASK
+    _SHAPE_MASKS[key] = mask
+    return mask
+
+
+def _flood(floor: int, seed: int) -> int:
+    """Celdas de ``floor`` alcanzables desde ``seed`` en 4 direcciones."""
+    # El borde es muro, así que los desplazamientos que dan la vuelta de fila caen fuera de ``floor``
+    size = ROOM_SIZE
+    reach = seed & floor
+    while True:
+        grown = (reach | (reach << 1) | (reach >> 1) | (reach << size) | (reach >> size)) & floor
+        if grown == reach:
+            return reach
+        reach = grown
+
+
+def _connected_walls(walls: int, full: int) -> Optional[int]:
     """
-    Verifica si todas las celdas de piso son accesibles desde el centro.
-    Más importante aún, verifica si los puntos de entrada/salida de las puertas 
-    (celdas de piso más cercanas a la 'D') están conectados.
-    Utiliza Breadth-First Search (BFS).
+    Si todas las entradas de puerta están en una misma zona de piso, devuelve
+    ``walls`` con los huecos cerrados (piso inalcanzable) convertidos en muro;
+    si no, None.
     """
-    
-    # Puntos de partida seguros cerca de cada puerta para la verificación de conectividad
-    # Coordenadas (y, x) de celdas de piso internas
-    start_points = set()
-
-    # Arriba (fila 1, cols 7-10)
-    for x in range(7, 11): start_points.add((1, x))
-    # Abajo (fila size-2, cols 7-10)
-    for x in range(7, 11): start_points.add((size - 2, x))
-    # Izquierda (col 1, filas 7-10)
-    for y in range(7, 11): start_points.add((y, 1))
-    # Derecha (col size-2, filas 7-10)
-    for y in range(7, 11): start_points.add((y, size - 2))
-    
-    # Filtra los puntos que son piso en el mapa
-    valid_starts = [p for p in start_points if map_list[p[0]][p[1]] == FLOOR_SYMBOL]
-
-    if not valid_starts:
-        # Esto no debería pasar si la generación es correcta, pero es un seguro
-        return False
-
-    start_node = valid_starts[0]
-    
-    # BFS
-    queue = [start_node]
-    visited = {start_node}
-    
-    while queue:
-        y, x = queue.pop(0)
-        
-        for dy, dx in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            ny, nx = y + dy, x + dx
-            
-            if 0 < ny < size - 1 and 0 < nx < size - 1 and \
-               map_list[ny][nx] == FLOOR_SYMBOL and (ny, nx) not in visited:
-                visited.add((ny, nx))
-                queue.append((ny, nx))
+    floor = full & ~walls
+    entries = _DOOR_ENTRY_MASK & floor
+    if not entries:
+        return None
+    reach = _flood(floor, entries & -entries)
+    if entries & ~reach:
+        return None
+    return full & ~reach
 
-    # Verificar que *todos* los puntos de inicio válidos se hayan visitado
-    # Esto asegura que todas las entradas/salidas de piso estén en el mismo componente
-    return all(p in visited for p in valid_starts)
 
+def _bits_to_rows(walls: int) -> List[str]:
+    size = ROOM_SIZE
+    row_mask = (1 << size) - 1
+    return [format((walls >> (y * size)) & row_mask, f'0{size}b')[::-1].translate(_BIT_TO_CHAR)
+            for y in range(size)]
 
-# ----------------------------------------------------
-# --- FUNCIÓN MODIFICADA: Generación de Patrones Base Aleatorios ---
-# ----------------------------------------------------
 
-def _generate_random_base_pattern(size: int = ROOM_SIZE) -> List[str]:
+def _generate_random_base_pattern(size: int = ROOM_SIZE, rng=None) -> List[str]:
     """
-    Genera un patrón base de sala (GRID_SIZE x GRID_SIZE) con formas geométricas 
+    Genera un patrón base de sala (GRID_SIZE x GRID_SIZE) con formas geométricas
     aleatorias, alineadas a la cuadrícula y con restricciones.
+
+    ``rng`` puede ser un ``random.Random`` o una semilla entera; con la misma
+    semilla devuelve siempre el mismo patrón. El resultado siempre está
+    conectado: todas las celdas de piso se alcanzan desde las puertas.
     """
-    # Asegurar que el tamaño de la habitación sea consistente con la cuadrícula
+    if rng is None:
+        rng = random
+    elif isinstance(rng, int):
+        rng = random.Random(rng)
+    _pattern_masks()
     size = ROOM_SIZE  # Forzar el tamaño definido
-    
+    full = (1 << (size * size)) - 1
+
     # Área útil para generar obstáculos (sin tocar los bordes)
-    BUFFER = DOOR_CLEARANCE_BUFFER
-    MIN_COORD = 1 + BUFFER
-    MAX_COORD = size - 2 - BUFFER  # -2 para dejar espacio para las paredes
-    
-    # Asegurar que las coordenadas sean múltiplos del tamaño de celda
+    min_coord = 1 + DOOR_CLEARANCE_BUFFER
+    max_coord = size - 2 - DOOR_CLEARANCE_BUFFER
+
     def align_to_grid(coord):
-        # Asegurarse de que las coordenadas sean múltiplos del tamaño de celda
         aligned = (coord // CELL_SIZE) * CELL_SIZE
-        return max(MIN_COORD, min(MAX_COORD, aligned))
-    
-    # -----------------------------------
-    # Lógica de Regeneración (Restricción 2: Conectividad)
-    # -----------------------------------
-    MAX_ATTEMPTS = 10
-    attempts = 0
-    
-    while attempts < MAX_ATTEMPTS:
-        attempts += 1
-        
-        # 1. Inicializar el mapa
-        initial_map = [[FLOOR_SYMBOL] * size for _ in range(size)]
-            
-        # 2. Asegurar bordes de muros
-        for i in range(size):
-            initial_map[0][i] = WALL_SYMBOL
-            initial_map[size - 1][i] = WALL_SYMBOL
-            initial_map[i][0] = WALL_SYMBOL
-            initial_map[i][size - 1] = WALL_SYMBOL
-            
-        # -----------------------------------
-        # 3. Generar Formas (Parámetros 1 y 4)
-        # -----------------------------------
-        
-        # Parámetro 1: Densidad (ajusta el num_shapes)
-        max_possible_shapes = int(MAX_SHAPES * ROOM_DENSITY_LEVEL)
-        num_shapes = random.randint(1, max(1, max_possible_shapes))
-        
+        return max(min_coord, min(max_coord, aligned))
+
+    max_possible_shapes = int(MAX_SHAPES * ROOM_DENSITY_LEVEL)
+    shapes: List[int] = []
+    for _ in range(MAX_PATTERN_ATTEMPTS):
+        shapes = []
+        num_shapes = rng.randint(1, max(1, max_possible_shapes))
         for _ in range(num_shapes):
-            shape_type = random.choice(SHAPE_TYPES) # Parámetro 4: Tipos de Formas más Variadas
-            
-            # Tamaño aleatorio (múltiplo del tamaño de celda)
-            s = random.randint(MIN_SHAPE_SIZE, MAX_SHAPE_SIZE) * CELL_SIZE
-            
-            # Posición de inicio alineada a la cuadrícula
-            # Asegurando que la forma no se salga de los límites
-            max_start_x = align_to_grid(MAX_COORD - s)
-            max_start_y = align_to_grid(MAX_COORD - s)
-            
-            start_x = align_to_grid(random.randint(MIN_COORD, max_start_x))
-            start_y = align_to_grid(random.randint(MIN_COORD, max_start_y))
-
-            # Función auxiliar para dibujar la forma
-            def draw_shape(y, x):
-                # Verificar límites y alineación con la cuadrícula
-                if (1 < y < size - 2 and 1 < x < size - 2 and 
-                    y % CELL_SIZE == 0 and x % CELL_SIZE == 0):
-                    
-                    # Verificar distancia a las puertas
-                    is_too_close_to_door = False
-                    
-                    # Zonas de puerta (ajustadas a la cuadrícula)
-                    door_zones = [
-                        (1, 7, 10),        # Arriba
-                        (size-2, 7, 10),   # Abajo
-                        (7, 1, 1),         # Izquierda (fila 7, col 1)
-                        (10, 1, 1),        # Izquierda (fila 10, col 1)
-                        (7, size-2, 1),    # Derecha (fila 7, col size-2)
-                        (10, size-2, 1)    # Derecha (fila 10, col size-2)
-                    ]
-                    
-                    for door_y, door_x, door_size in door_zones:
-                        if (abs(y - door_y) <= BUFFER * CELL_SIZE and 
-                            door_x <= x < door_x + door_size * CELL_SIZE):
-                            is_too_close_to_door = True
-                            break
-                    
-                    if not is_too_close_to_door:
-                        # Dibujar la celda en la cuadrícula
-                        for dy in range(CELL_SIZE):
-                            for dx in range(CELL_SIZE):
-                                if 0 <= y+dy < size and 0 <= x+dx < size:
-                                    initial_map[y+dy][x+dx] = WALL_SYMBOL
-
-            if shape_type == 'line_h':
-                for x in range(start_x, start_x + s):
-                    draw_shape(start_y, x)
-                    
-            elif shape_type == 'line_v':
-                for y in range(start_y, start_y + s):
-                    draw_shape(y, start_x)
-                    
-            elif shape_type == 'square':
-                for y in range(start_y, start_y + s):
-                    for x in range(start_x, start_x + s):
-                        draw_shape(y, x)
-            
-            elif shape_type == 'l_shape': # Nuevo: Forma de L
-                # Rama vertical
-                for y in range(start_y, start_y + s):
-                    draw_shape(y, start_x)
-                # Rama horizontal (desde el extremo inferior, asumiendo start_y es la esquina)
-                for x in range(start_x, start_x + s):
-                    draw_shape(start_y + s - 1, x)
-
-            elif shape_type == 'cross': # Nuevo: Forma de Cruz (+)
-                center_x = start_x + s // 2
-                center_y = start_y + s // 2
-                
-                # Barra horizontal
-                for x in range(start_x, start_x + s):
-                    draw_shape(center_y, x)
-                # Barra vertical
-                for y in range(start_y, start_y + s):
-                    draw_shape(y, center_x)
-                    
-        
-        # -----------------------------------
-        # 4. Verificar Conectividad (Restricción 2)
-        # -----------------------------------
-        if _is_map_connected(initial_map, size):
-            
-            # -----------------------------------
-            # 5. Asimetría Obligatoria (Restricción 5)
-            # -----------------------------------
-            # La asimetría ya se promueve al usar formas aleatorias y la Restricción 3.
-            # Sin embargo, se añade un pequeño cambio forzado si se detecta simetría.
-            # Simplificación: No se comprueba la simetría exhaustivamente, sino que se asegura 
-            # un patrón ligeramente impredecible en una esquina.
-            
-            if random.random() < 0.2: # 20% de probabilidad de añadir un toque asimétrico
-                # Elige un punto seguro para un obstáculo aleatorio (lejos de las puertas)
-                # Se elige una celda dentro del área generable y se invierte (floor -> wall)
-                asy_x = random.randint(MAX_COORD - 1, MAX_COORD)
-                asy_y = random.randint(MAX_COORD - 1, MAX_COORD)
-                
-                # Solo cambia si es piso y no invalida la conectividad (simplificación: se asume que no la invalida)
-                if initial_map[asy_y][asy_x] == FLOOR_SYMBOL:
-                     initial_map[asy_y][asy_x] = WALL_SYMBOL
-                
-            # Éxito: Convertir a lista de strings y retornar
-            final_pattern = ["".join(row) for row in initial_map]
-            return final_pattern
-
-    # Si se alcanzan los intentos máximos, se retorna un patrón simple para evitar bucles.
-    print("WARNING: Max attempts reached. Returning an empty pattern.")
-    final_pattern = ["".join(row) for row in initial_map]
-    return final_pattern
+            shape_type = rng.choice(SHAPE_TYPES)
+            s = rng.randint(MIN_SHAPE_SIZE, MAX_SHAPE_SIZE) * CELL_SIZE
+            max_start_x = align_to_grid(max_coord - s)
+            max_start_y = align_to_grid(max_coord - s)
+            start_x = align_to_grid(rng.randint(min_coord, max_start_x))
+            start_y = align_to_grid(rng.randint(min_coord, max_start_y))
+            shapes.append(_shape_mask(shape_type, s, start_x, start_y))
+
+        walls = _BORDER_MASK
+        for mask in shapes:
+            walls |= mask
+        connected = _connected_walls(walls, full)
+        if connected is None:
+            continue
+
+        # Toque asimétrico (20%): un muro suelto en la esquina inferior derecha,
+        # solo si no corta el paso
+        if rng.random() < 0.2:
+            asy_x = rng.randint(max_coord - 1, max_coord)
+            asy_y = rng.randint(max_coord - 1, max_coord)
+            with_asymmetry = _connected_walls(connected | _bit(asy_y, asy_x), full)
+            if with_asymmetry is not None:
+                connected = with_asymmetry
+        return _bits_to_rows(connected)
+
+    # Sin éxito: quitar formas del último intento hasta que quede conectada
+    # (sin formas la sala siempre lo está)
+    while True:
+        walls = _BORDER_MASK
+        for mask in shapes:
+            walls |= mask
+        connected = _connected_walls(walls, full)
+        if connected is not None:
+            return _bits_to_rows(connected)
+        shapes.pop()
 
 
 # ----------------------------------------------------
@@ -331,10 +319,67 @@ def _insert_doors(pattern: List[str], room: 'Room') -> List[str]:
 
     return modified_pattern
 
+# --- Geometría de colisión ---
+
+# Serializa la construcción perezosa de salas entre el hilo principal y el de precarga
+_BUILD_LOCK = threading.RLock()
+
+_WALLS: Optional[Tuple[pygame.Rect, ...]] = None
+
+
+def _room_walls() -> Tuple[pygame.Rect, ...]:
+    global _WALLS
+    if _WALLS is None:
+        p = ROOM_PADDING
+        _WALLS = (
+            pygame.Rect(p, p, WIDTH - 2 * p, 10),  # top
+            pygame.Rect(p, HEIGHT - p - 10, WIDTH - 2 * p, 10),  # bottom
+            pygame.Rect(p, p, 10, HEIGHT - 2 * p),  # left
+            pygame.Rect(WIDTH - p - 10, p, 10, HEIGHT - 2 * p),  # right
+        )
+    return _WALLS
+
+
+def _cell_layout(map_width: int, map_height: int) -> Tuple[int, int, int, int]:
+    """Origen (x, y) y tamaño (ancho, alto) en píxeles de las celdas del mapa."""
+    p = ROOM_PADDING
+    usable_width = WIDTH - 2 * p - 20
+    usable_height = HEIGHT - 2 * p - 20
+
+    cell_width = usable_width // map_width
+    cell_height = usable_height // map_height
+
+    offset_x = p + 10 + (usable_width - (cell_width * map_width)) // 2
+    offset_y = p + 10 + (usable_height - (cell_height * map_height)) // 2
+    return offset_x, offset_y, cell_width, cell_height
+
+
+def _build_obstacles(room_map: List[str]) -> Tuple[pygame.Rect, ...]:
+    """Convierte las celdas de muro del mapa de caracteres en rects de pantalla."""
+    map_height = len(room_map)
+    map_width = len(room_map[0]) if room_map else 0
+
+    if map_width == 0 or map_height == 0:
+        return ()
+
+    offset_x, offset_y, cell_width, cell_height = _cell_layout(map_width, map_height)
+
+    obstacles = []
+    for row_idx, row in enumerate(room_map):
+        for col_idx, cell in enumerate(row):
+            if cell == WALL_SYMBOL:
+                x = offset_x + col_idx * cell_width
+                y = offset_y + row_idx * cell_height
+                obstacles.append(pygame.Rect(x, y, cell_width, cell_height))
+    return tuple(obstacles)
+
+
 # --- Clase Door y Room (Sin Cambios en su estructura principal) ---
 
 @dataclass
 class Door:
+    """Puerta entre dos salas. Dungeon comparte una sola instancia por conexión:
+    abrirla o desbloquearla desde una sala se ve igual desde la otra."""
     open: bool = False
     locked: bool = False
     exists: bool = True  # Indica si la puerta existe (si hay una habitación del otro lado)
@@ -355,45 +400,68 @@ class Room:
     spawned: bool = False
     enemies: list = field(default_factory=list)  # Persistir enemigos por sala
     chests: list = field(default_factory=list)  # Persistir cofres por sala
+    # Semilla del piso: patrón, colores y punto de aparición salen de (seed, pos)
+    seed: Optional[int] = field(default=None, repr=False)
     _room_pattern: List[str] = field(init=False, default=None)
+    # Geometría de colisión precalculada y el patrón a partir del cual se construyó.
+    # Si _room_pattern cambia (invalidate_layout, que Dungeon._add_room llama cuando
+    # se abre un hueco en la pared de una sala ya generada), la identidad deja de
+    # coincidir y se reconstruye en el siguiente acceso.
+    _geometry_source: Optional[List[str]] = field(init=False, default=None, repr=False)
+    _obstacles: Tuple[pygame.Rect, ...] = field(init=False, default=(), repr=False)
+    _grid: Optional[CollisionGrid] = field(init=False, default=None, repr=False)
+    _grid_source: Optional[List[str]] = field(init=False, default=None, repr=False)
+    # Campo de flujo hacia el jugador, ligado a la rejilla de colisión actual
+    _flow: Optional[FlowField] = field(init=False, default=None, repr=False)
 
     def __post_init__(self):
-        self._room_pattern = self._generate_random_room_pattern()
-        # Ensure _room_pattern is always a valid list of strings
-        if not isinstance(self._room_pattern, list) or not all(isinstance(row, str) for row in self._room_pattern):
-            # Fallback to an empty room pattern if generation fails
-            self._room_pattern = ["#" * ROOM_SIZE] * ROOM_size
-            
+        if self.seed is None:
+            self.seed = new_seed()
+        # Hasta el primer acceso la sala es solo un nodo del grafo (posición, puertas y
+        # semilla): patrón, colores y geometría se generan en get_room_map/obstacles/...
+
+    @property
+    def materialized(self) -> bool:
+        """True si el patrón ya está generado."""
+        return self._room_pattern is not None
+
+    def materialize(self) -> None:
+        """Genera ya todo lo que la sala construye bajo demanda (patrón, geometría y campo de flujo)."""
+        self.get_room_map()
+        self.obstacles()
+        self.collision_grid()
+        self.flow_field()
+
+    def _generate_colors(self) -> None:
         # Generar colores aleatorios para paredes y obstáculos si no están definidos
+        colors = room_random(self.seed, 'colors', self.pos)
         if self.wall_color is None:
             # Color base aleatorio para paredes (tonos de gris a colores oscuros)
-            base = random.randint(50, 150)
-            variation = random.randint(-30, 30)
+            base = colors.randint(50, 150)
+            variation = colors.randint(-30, 30)
             self.wall_color = (
-                max(40, min(180, base + random.randint(-20, 20))),
-                max(40, min(180, base + variation + random.randint(-20, 20))),
-                max(40, min(180, base + random.randint(-20, 20)))
+                max(40, min(180, base + colors.randint(-20, 20))),
+                max(40, min(180, base + variation + colors.randint(-20, 20))),
+                max(40, min(180, base + colors.randint(-20, 20)))
             )
             
         if self.obstacle_color is None:
             # Color base aleatorio para obstáculos (un poco más claro que las paredes)
-            base = random.randint(80, 180)
-            variation = random.randint(-40, 40)
+            base = colors.randint(80, 180)
+            variation = colors.randint(-40, 40)
             self.obstacle_color = (
-                max(60, min(200, base + random.randint(-30, 30))),
-                max(60, min(200, base + variation + random.randint(-30, 30))),
-                max(60, min(200, base + random.randint(-30, 30)))
+                max(60, min(200, base + colors.randint(-30, 30))),
+                max(60, min(200, base + variation + colors.randint(-30, 30))),
+                max(60, min(200, base + colors.randint(-30, 30)))
             )
 
 
-    def walls(self) -> List[pygame.Rect]:
-        p = ROOM_PADDING
-        return [
-            pygame.Rect(p, p, WIDTH - 2 * p, 10),  # top
-            pygame.Rect(p, HEIGHT - p - 10, WIDTH - 2 * p, 10),  # bottom
-            pygame.Rect(p, p, 10, HEIGHT - 2 * p),  # left
-            pygame.Rect(WIDTH - p - 10, p, 10, HEIGHT - 2 * p),  # right
-        ]
+    def walls(self) -> Tuple[pygame.Rect, ...]:
+        """Paredes exteriores. Son iguales en todas las salas y se crean una sola vez.
+
+        La tupla y sus rects son compartidos: no modificarlos.
+        """
+        return _room_walls()
 
 
     def _generate_random_room_pattern(self) -> List[str]:
@@ -403,7 +471,8 @@ class Room:
             base_pattern = PATTERN_EMPTY
         else:
             # Ahora utiliza la generación geométrica restringida y regeneración
-            base_pattern = _generate_random_base_pattern(ROOM_SIZE)
+            # Mismo (seed, pos) -> mismo patrón, aunque se regenere tras invalidate_layout
+            base_pattern = _generate_random_base_pattern(ROOM_SIZE, room_random(self.seed, 'layout', self.pos))
             
         # Pasar la instancia de la habitación para verificar las puertas existentes
         final_pattern = _insert_doors(base_pattern, self)
@@ -412,41 +481,65 @@ class Room:
 
 
     def get_room_map(self) -> List[str]:
-        # Ensure we always return a valid list of strings
-        if not hasattr(self, '_room_pattern') or self._room_pattern is None:
-            self._room_pattern = self._generate_random_room_pattern()
-        return self._room_pattern
-
-    def obstacles(self) -> List[pygame.Rect]:
-        """Genera obstáculos basados en el mapa de caracteres de la sala."""
+        pattern = self._room_pattern
+        if pattern is None:
+            # Las salas vecinas se preparan en segundo plano: un solo hilo construye a la vez
+            with _BUILD_LOCK:
+                pattern = self._room_pattern
+                if pattern is None:
+                    pattern = self._generate_random_room_pattern()
+                    # Ensure we always return a valid list of strings
+                    if not isinstance(pattern, list) or not all(isinstance(row, str) for row in pattern):
+                        pattern = ["#" * ROOM_SIZE] * ROOM_SIZE
+                    if self.wall_color is None or self.obstacle_color is None:
+                        self._generate_colors()
+                    self._room_pattern = pattern
+        return pattern
+
+    def invalidate_layout(self) -> None:
+        """Descarta el patrón (y con él la geometría) para regenerarlo en el próximo acceso."""
+        self._room_pattern = None
+
+    def obstacles(self) -> Tuple[pygame.Rect, ...]:
+        """Obstáculos basados en el mapa de caracteres de la sala.
+
+        Se calculan una vez por patrón; la tupla y sus rects son compartidos
+        entre llamadas, así que no deben modificarse.
+        """
         room_map = self.get_room_map()
-        obstacles = []
-        
-        map_height = len(room_map)
-        map_width = len(room_map[0]) if room_map else 0
-        
-        if map_width == 0 or map_height == 0:
-            return obstacles
-        
-        p = ROOM_PADDING
-        usable_width = WIDTH - 2 * p - 20
-        usable_height = HEIGHT - 2 * p - 20
-        
-        cell_width = usable_width // map_width
-        cell_height = usable_height // map_height
-        
-        offset_x = p + 10 + (usable_width - (cell_width * map_width)) // 2
-        offset_y = p + 10 + (usable_height - (cell_height * map_height)) // 2
-        
-        for row_idx, row in enumerate(room_map):
-            for col_idx, cell in enumerate(row):
-                if cell == WALL_SYMBOL:
-                    x = offset_x + col_idx * cell_width
-                    y = offset_y + row_idx * cell_height
-                    obstacle_rect = pygame.Rect(x, y, cell_width, cell_height)
-                    obstacles.append(obstacle_rect)
-        
-        return obstacles
+        if self._geometry_source is not room_map:
+            with _BUILD_LOCK:
+                if self._geometry_source is not room_map:
+                    self._obstacles = _build_obstacles(room_map)
+                    self._geometry_source = room_map
+        return self._obstacles
+
+    def collision_grid(self) -> CollisionGrid:
+        """Índice de colisión estática (paredes + obstáculos), uno por patrón."""
+        room_map = self.get_room_map()
+        if self._grid is None or self._grid_source is not room_map:
+            with _BUILD_LOCK:
+                if self._grid is None or self._grid_source is not room_map:
+                    rows = len(room_map)
+                    cols = len(room_map[0]) if room_map else 0
+                    if rows and cols:
+                        offset_x, offset_y, cell_width, cell_height = _cell_layout(cols, rows)
+                    else:
+                        offset_x = offset_y = 0
+                        cell_width = cell_height = 1
+                    self._grid = CollisionGrid(room_map, (offset_x, offset_y), (cell_width, cell_height),
+                                               walls=self.walls(), solid_symbols=(WALL_SYMBOL,))
+                    self._grid_source = room_map
+        return self._grid
+
+    def flow_field(self) -> FlowField:
+        """Campo de flujo de la sala para enemigos de tamaño ENEMY_SIZE (se rehace con la rejilla)."""
+        grid = self.collision_grid()
+        if self._flow is None or self._flow.grid is not grid:
+            with _BUILD_LOCK:
+                if self._flow is None or self._flow.grid is not grid:
+                    self._flow = FlowField(grid, (ENEMY_SIZE, ENEMY_SIZE))
+        return self._flow
 
     def door_rect(self, direction: str) -> pygame.Rect:
         p = ROOM_PADDING
@@ -513,4 +606,4 @@ class Room:
             return len(room_map[0]) // 2, len(room_map) // 2
             
         # Devolver una posición aleatoria de las válidas
-        return random.choice(floor_positions)
\ No newline at end of file
+        return room_random(self.seed, 'spawn_point', self.pos).choice(floor_positions)
\ No newline at end of file
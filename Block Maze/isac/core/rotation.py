@@ -0,0 +1,50 @@
+"""
+Caché de sprites pre-rotados.
+
+``pygame.transform.rotate`` es de los blits más caros que hacemos y flechas y
+proyectiles lo llamaban cada frame. Aquí cada sprite se rota una sola vez a
+N ángulos fijos (buckets) y al dibujar solo se busca el más cercano.
+"""
+from __future__ import annotations
+from typing import Dict, List, Tuple
+
+import pygame
+
+
+class RotationSet:
+    """Rotaciones precalculadas de un sprite en ``steps`` ángulos equiespaciados."""
+
+    def __init__(self, sprite: pygame.Surface, steps: int) -> None:
+        self.sprite = sprite
+        self.steps = max(1, int(steps))
+        self.step_deg = 360.0 / self.steps
+        self.frames: List[pygame.Surface] = [
+            pygame.transform.rotate(sprite, i * self.step_deg) for i in range(self.steps)
+        ]
+
+    def index(self, angle: float) -> int:
+        """Bucket más cercano a ``angle`` (grados, mismo sentido que transform.rotate)."""
+        return int(round((angle % 360.0) / self.step_deg)) % self.steps
+
+    def at(self, angle: float) -> pygame.Surface:
+        """Equivale a ``pygame.transform.rotate(sprite, angle)`` redondeado al bucket."""
+        return self.frames[self.index(angle)]
+
+
+# (id del sprite, steps) -> RotationSet. El RotationSet guarda el sprite, así
+# que su id no se reutiliza mientras la entrada exista.
+_sets: Dict[Tuple[int, int], RotationSet] = {}
+
+
+def get_rotations(sprite: pygame.Surface, steps: int) -> RotationSet:
+    """Devuelve (creándolo la primera vez) el juego de rotaciones de ``sprite``."""
+    key = (id(sprite), int(steps))
+    rotations = _sets.get(key)
+    if rotations is None or rotations.sprite is not sprite:
+        rotations = RotationSet(sprite, steps)
+        _sets[key] = rotations
+    return rotations
+
+
+def clear() -> None:
+    _sets.clear()
@@ -1,5 +1,5 @@
 import pygame
-from typing import Optional
+from typing import List, Optional
 
 
 class Scene:
@@ -8,6 +8,12 @@ class Scene:
     Debe implementar handle_event, update y draw.
     """
 
+    # True si draw() pinta la pantalla entera (Game no la limpia antes)
+    clears_screen = False
+    # Fracción [0, 1) del paso de simulación transcurrida desde el último update;
+    # Game la fija antes de cada draw para interpolar posiciones
+    interpolation = 1.0
+
     def __init__(self, game: "Game") -> None:
         self.game = game
         self.next_scene: Optional[Scene] = None
@@ -28,3 +34,11 @@ class Scene:
 
     def draw(self, surface: pygame.Surface) -> None:
         pass
+
+    def dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """Rects que cambiaron en el último draw, o None para volcar la pantalla entera."""
+        return None
+
+    def invalidate_screen(self) -> None:
+        """Algo pintó encima de la escena: el próximo draw debe repintar la pantalla entera."""
+        pass
@@ -0,0 +1,123 @@
+"""
+Fase ancha (broad phase) para entidades dinámicas.
+
+``SpatialHash`` reparte objetos en una rejilla uniforme según su rect. Las
+consultas solo devuelven los objetos de las celdas que toca el rect buscado,
+así que comprobar N proyectiles contra M enemigos cuesta ~O(N + M) en lugar
+de O(N * M). Las actualizaciones son incrementales: un objeto solo cambia de
+celdas cuando su rect cruza el borde de una celda.
+"""
+from __future__ import annotations
+from typing import Callable, Dict, Iterable, List, Tuple
+
+import pygame
+
+Span = Tuple[int, int, int, int]
+
+
+class SpatialHash:
+    """Rejilla uniforme de objetos indexados por su rect."""
+
+    def __init__(self, cell_size: int = 128) -> None:
+        self.cell_size = max(1, int(cell_size))
+        self._cells: Dict[Tuple[int, int], List[object]] = {}
+        # id(obj) -> (obj, span actual, orden de inserción)
+        self._entries: Dict[int, Tuple[object, Span, int]] = {}
+        self._seq = 0
+
+    def _span(self, rect: pygame.Rect) -> Span:
+        cs = self.cell_size
+        return (rect.left // cs, (rect.right - 1) // cs,
+                rect.top // cs, (rect.bottom - 1) // cs)
+
+    def _add_to_cells(self, obj: object, span: Span) -> None:
+        c0, c1, r0, r1 = span
+        cells = self._cells
+        for cy in range(r0, r1 + 1):
+            for cx in range(c0, c1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [obj]
+                else:
+                    bucket.append(obj)
+
+    def _remove_from_cells(self, obj: object, span: Span) -> None:
+        c0, c1, r0, r1 = span
+        cells = self._cells
+        for cy in range(r0, r1 + 1):
+            for cx in range(c0, c1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    continue
+                bucket.remove(obj)
+                if not bucket:
+                    del cells[(cx, cy)]
+
+    def update(self, obj: object, rect: pygame.Rect) -> None:
+        """Inserta el objeto o lo mueve si su rect cambió de celdas."""
+        span = self._span(rect)
+        entry = self._entries.get(id(obj))
+        if entry is None:
+            self._add_to_cells(obj, span)
+            self._entries[id(obj)] = (obj, span, self._seq)
+            self._seq += 1
+            return
+        old_span = entry[1]
+        if old_span != span:
+            self._remove_from_cells(obj, old_span)
+            self._add_to_cells(obj, span)
+            self._entries[id(obj)] = (obj, span, entry[2])
+
+    def remove(self, obj: object) -> None:
+        entry = self._entries.pop(id(obj), None)
+        if entry is not None:
+            self._remove_from_cells(obj, entry[1])
+
+    def sync(self, objs: Iterable[object],
+             rect_of: Callable[[object], pygame.Rect] = lambda o: o.rect) -> None:
+        """
+        Deja el índice igual a ``objs``: mueve los que cambiaron de celda,
+        añade los nuevos y quita los que ya no están.
+        """
+        present = set()
+        for obj in objs:
+            present.add(id(obj))
+            self.update(obj, rect_of(obj))
+        if len(present) != len(self._entries):
+            for key in [k for k in self._entries if k not in present]:
+                obj, span, _ = self._entries.pop(key)
+                self._remove_from_cells(obj, span)
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._entries.clear()
+        self._seq = 0
+
+    def query(self, rect: pygame.Rect) -> List[object]:
+        """
+        Candidatos cuyas celdas solapan ``rect``, sin duplicados y en orden de
+        inserción. Es una prueba gruesa: hay que confirmar con colliderect.
+        """
+        c0, c1, r0, r1 = self._span(rect)
+        cells = self._cells
+        found: Dict[int, object] = {}
+        if c0 == c1 and r0 == r1:
+            bucket = cells.get((c0, r0))
+            if not bucket:
+                return []
+            if len(bucket) == 1:
+                return list(bucket)
+            for o in bucket:
+                found[id(o)] = o
+        else:
+            for cy in range(r0, r1 + 1):
+                for cx in range(c0, c1 + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket:
+                        for o in bucket:
+                            found[id(o)] = o
+        entries = self._entries
+        return sorted(found.values(), key=lambda o: entries[id(o)][2])
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,105 @@
+"""
+Perfil de arranque (``python juego.py --profile-startup``).
+
+Relanza el juego en un subproceso con ``python -X importtime`` y el modo
+``--startup-probe``. El subproceso crea ``Game(LoadingScene)``, avanza hasta
+que el menú dibuja su primer frame e imprime cuánto tardó cada etapa. Este
+proceso combina esas etapas con el tiempo de importación de cada módulo.
+"""
+from __future__ import annotations
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+# Objetivo de tiempo hasta el menú desde `python juego.py`
+TIME_TO_MENU_TARGET_MS = 300.0
+PROBE_MARKER = 'STARTUP-PROBE '
+PROBE_TIMEOUT_S = 30.0
+
+
+def run_probe(t0: float) -> None:
+    """Arranca el juego hasta el primer frame del menú e imprime las etapas (en el subproceso)."""
+    stages: List[Tuple[str, float]] = []
+
+    def mark(name: str) -> None:
+        stages.append((name, (time.perf_counter() - t0) * 1000.0))
+
+    import pygame
+    mark('import pygame')
+    from isac.core.game import Game
+    from isac.scenes.loading import LoadingScene
+    mark('import isac')
+    game = Game(LoadingScene)
+    mark('Game() + LoadingScene')
+    game.scene.draw(game.screen)
+    pygame.display.flip()
+    mark('primer frame')
+
+    from isac.scenes.menu import MenuScene
+    deadline = time.perf_counter() + PROBE_TIMEOUT_S
+    while not isinstance(game.scene, MenuScene) and time.perf_counter() < deadline:
+        pygame.event.pump()
+        game.scene.update(game.sim_dt)
+        game.screen.fill((0, 0, 0))
+        game.scene.draw(game.screen)
+        pygame.display.flip()
+    mark('precarga de assets')
+    game.screen.fill((0, 0, 0))
+    game.scene.draw(game.screen)
+    pygame.display.flip()
+    mark('menú visible')
+    print(PROBE_MARKER + json.dumps(stages), flush=True)
+    pygame.quit()
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """(módulo, self µs, acumulado µs) de cada línea de ``-X importtime``."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        try:
+            parts = line[len('import time:'):].split('|')
+            self_us, cumulative, name = int(parts[0]), int(parts[1]), parts[2].strip()
+        except (ValueError, IndexError):
+            continue
+        rows.append((name, self_us, cumulative))
+    return rows
+
+
+def profile_startup(script: str, top: int = 15) -> int:
+    """Ejecuta la sonda en un subproceso y muestra el informe. Devuelve el código de salida."""
+    cmd = [sys.executable, '-X', 'importtime', script, '--startup-probe']
+    proc = subprocess.run(cmd, capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(script)))
+    stages = None
+    for line in proc.stdout.splitlines():
+        if line.startswith(PROBE_MARKER):
+            stages = json.loads(line[len(PROBE_MARKER):])
+    if stages is None:
+        print("La sonda de arranque falló:")
+        print(proc.stdout)
+        print(proc.stderr)
+        return 1
+
+    print("Etapas (ms desde el inicio de juego.py):")
+    previous = 0.0
+    for name, at in stages:
+        print(f"  {name:<24} {at:8.1f}  (+{at - previous:.1f})")
+        previous = at
+    time_to_menu = stages[-1][1]
+    verdict = "OK" if time_to_menu <= TIME_TO_MENU_TARGET_MS else "por encima del objetivo"
+    print(f"Tiempo hasta el menú: {time_to_menu:.1f} ms (objetivo {TIME_TO_MENU_TARGET_MS:.0f} ms: {verdict})")
+
+    imports = parse_importtime(proc.stderr)
+    totals: Dict[str, int] = {}
+    for name, self_us, _ in imports:
+        totals[name] = totals.get(name, 0) + self_us
+    print(f"\nMódulos más lentos de importar (tiempo propio, {len(totals)} módulos):")
+    for name, self_us in sorted(totals.items(), key=lambda kv: kv[1], reverse=True)[:top]:
+        print(f"  {self_us / 1000.0:8.1f} ms  {name}")
+    isac_total = sum(us for name, us in totals.items() if name == 'isac' or name.startswith('isac.'))
+    print(f"  {'':8}     (isac.*: {isac_total / 1000.0:.1f} ms en total)")
+    return 0
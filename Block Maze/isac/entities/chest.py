@@ -3,6 +3,7 @@ import pygame
 import random
 import math
 from isac.settings import TILE
+from isac.core.assets import load_image
 
 class Chest:
     def __init__(self, x: int, y: int):
@@ -10,13 +11,9 @@ class Chest:
         self.opened = False
         self.item_dropped = None
         
-        # Cargar sprites
-        self.closed_sprite = pygame.image.load(os.path.join('assets', 'structure', 'cofre2.png'))
-        self.open_sprite = pygame.image.load(os.path.join('assets', 'structure', 'cofre2b.png'))
-        
-        # Escalar los sprites al tamaño del tile
-        self.closed_sprite = pygame.transform.scale(self.closed_sprite, (TILE, TILE))
-        self.open_sprite = pygame.transform.scale(self.open_sprite, (TILE, TILE))
+        # Sprites escalados al tamaño del tile (compartidos vía caché)
+        self.closed_sprite = load_image(os.path.join('assets', 'structure', 'cofre2.png'), (TILE, TILE))
+        self.open_sprite = load_image(os.path.join('assets', 'structure', 'cofre2b.png'), (TILE, TILE))
         
         # Animación de apertura
         self.opening_timer = 0.0
@@ -26,8 +23,11 @@ class Chest:
         """Verifica si el jugador tiene una llave para abrir el cofre"""
         return inventory.keys > 0
         
-    def open(self, inventory) -> str:
-        """Intenta abrir el cofre y devuelve el tipo de item que contiene si se pudo abrir"""
+    def open(self, inventory, rng=None) -> str:
+        """
+        Intenta abrir el cofre y devuelve el tipo de item que contiene si se pudo abrir.
+        ``rng`` es el generador de botín de la partida (``random`` si no se indica).
+        """
         if self.opened:
             return None
             
@@ -42,7 +42,7 @@ class Chest:
         
         # Seleccionar item aleatorio con probabilidades ajustadas
         # 20% de probabilidad para cada uno de los 5 objetos
-        rand_num = random.random()
+        rand_num = (rng or random).random()
         if rand_num < 0.20:
             self.item_dropped = 'speed_boots'
         elif rand_num < 0.40:
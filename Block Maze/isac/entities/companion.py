@@ -2,9 +2,18 @@ import os
 import pygame
 import math
 from isac.settings import TILE
+from isac.core.assets import load_image
+from isac.core.motion import subpixel_step
 
 class Spike:
+    """Pincho del compañero. Se recicla con ``ObjectPool`` mediante ``reset``."""
+
+    __slots__ = ('x', 'y', 'speed', 'alive', 'damage', 'vx', 'vy')
+
     def __init__(self, x: int, y: int, target_x: int, target_y: int):
+        self.reset(x, y, target_x, target_y)
+
+    def reset(self, x: int, y: int, target_x: int, target_y: int) -> None:
         self.x = float(x)
         self.y = float(y)
         self.speed = 200.0  # píxeles por segundo
@@ -37,6 +46,10 @@ class Spike:
     def rect(self) -> pygame.Rect:
         """Devuelve el rectángulo de colisión del pincho"""
         return pygame.Rect(int(self.x) - 3, int(self.y) - 3, 6, 6)
+
+    def bounds(self) -> pygame.Rect:
+        """Zona de pantalla que pinta draw() (la punta mide 8 px)"""
+        return pygame.Rect(int(self.x) - 10, int(self.y) - 10, 20, 20)
     
     def draw(self, surface: pygame.Surface):
         """Dibuja el pincho"""
@@ -74,13 +87,10 @@ class Spike:
 
 class Companion:
     def __init__(self, x: int, y: int):
-        # Cargar el sprite de la estatua
+        # Cargar el sprite de la estatua escalado a 32x32 píxeles
         sprite_path = os.path.join('assets', 'player', 'statue.png')
-        self.sprite = pygame.image.load(sprite_path).convert_alpha()
-        
-        # Escalar el sprite a 32x32 píxeles
         sprite_size = (32, 32)  # Tamaño fijo de 32x32 píxeles
-        self.sprite = pygame.transform.scale(self.sprite, sprite_size)
+        self.sprite = load_image(sprite_path, sprite_size)
         
         # Crear el rectángulo de colisión
         self.rect = self.sprite.get_rect()
@@ -100,6 +110,9 @@ class Companion:
         # Animación
         self.bob_timer = 0.0
         self.original_y = y
+        # Resto sub-píxel del seguimiento al jugador
+        self._carry_x = 0.0
+        self._carry_y = 0.0
         
     def update(self, dt: float, player_rect: pygame.Rect = None):
         """Actualiza el compañero"""
@@ -128,9 +141,11 @@ class Companion:
             
             move_speed = 100.0
             if abs(dx) > 5:
-                self.rect.centerx += int(dx * move_speed * dt / 100)
+                step_x, self._carry_x = subpixel_step(dx * move_speed * dt / 100, self._carry_x)
+                self.rect.centerx += step_x
             if abs(dy) > 5:
-                self.rect.centery += int(dy * move_speed * dt / 100)
+                step_y, self._carry_y = subpixel_step(dy * move_speed * dt / 100, self._carry_y)
+                self.rect.centery += step_y
         else:
             # Flotación en el lugar
             self.rect.centery = int(self.original_y + bob_offset)
@@ -151,8 +166,8 @@ class Companion:
         """Verifica si puede disparar"""
         return self.active and self.shoot_timer <= 0
     
-    def shoot_at_enemy(self, enemy_rect: pygame.Rect) -> list[Spike]:
-        """Dispara tres pinchos hacia un enemigo en diferentes direcciones"""
+    def shoot_at_enemy(self, enemy_rect: pygame.Rect, pool=None) -> list[Spike]:
+        """Dispara tres pinchos hacia un enemigo en diferentes direcciones (reciclados de ``pool`` si se pasa)"""
         if not self.can_shoot():
             return []
             
@@ -181,7 +196,10 @@ class Companion:
                 target_x = self.rect.centerx + math.cos(angle) * target_distance
                 target_y = self.rect.centery + math.sin(angle) * target_distance
                 
-                spike = Spike(self.rect.centerx, self.rect.centery, target_x, target_y)
+                if pool is not None:
+                    spike = pool.acquire(self.rect.centerx, self.rect.centery, target_x, target_y)
+                else:
+                    spike = Spike(self.rect.centerx, self.rect.centery, target_x, target_y)
                 spikes.append(spike)
             
             return spikes
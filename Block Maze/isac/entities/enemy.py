@@ -1,7 +1,15 @@
 import pygame
 import math
-import os
 from isac.settings import RED, ENEMY_SPEED, ENEMY_SIZE, ENEMY_DEFAULT_HP
+from isac.core.assets import load_image, tinted, with_alpha
+from isac.core.motion import subpixel_step
+
+# Efectos de color al dibujar: (color sumado, intensidad). Las variantes de cada
+# sprite se crean una vez (isac.core.assets.tinted) y se reutilizan.
+HURT_TINT = ((255, 255, 255), 180)
+CHARGE_TINT = ((255, 200, 80), 100)  # brute cargando
+AIM_TINT = ((255, 100, 100), 100)  # sniper a punto de disparar
+GHOST_ALPHA = 180
 
 
 class Enemy:
@@ -15,6 +23,9 @@ class Enemy:
         self.hurt_timer: float = 0.0  # segundos de flash si fue golpeado
         self.invuln_timer: float = 0.0  # evitar múltiples golpes en el mismo frame
         self.speed_scale: float = max(0.1, speed_scale)
+        # Resto sub-píxel del movimiento (ver isac.core.motion)
+        self._carry_x: float = 0.0
+        self._carry_y: float = 0.0
         self.color: tuple[int, int, int] = color if color is not None else RED
         self.kind: str = kind
         # Estado para comportamientos
@@ -24,32 +35,9 @@ class Enemy:
         self.charge_just_started: bool = False  # para telegráfico/sonido
         # Estado para sniper
         self._shoot_timer: float = 0.5  # temporizador para disparos
-        self._projectiles: list[dict] = []  # lista de proyectiles activos
         # Estado para monster
         self._monster_shoot_timer: float = 0.0  # temporizador para disparos del monster
         
-        # Cargar sprites de proyectiles
-        self.projectile_sprite = None
-        self.monster_projectile_sprite = None
-        
-        try:
-            # Sprite para sniper
-            projectile_path = 'C:\\Users\\herna\\OneDrive\\Documentos\\GitHub\\Juego\\VERSIONWALTHER\\assets\\bullet\\Estrellacaida1.png'
-            if os.path.exists(projectile_path):
-                self.projectile_sprite = pygame.image.load(projectile_path).convert_alpha()
-                # Escalar el sprite al tamaño adecuado (32x32 píxeles)
-                self.projectile_sprite = pygame.transform.scale(self.projectile_sprite, (32, 32))
-                
-            # Sprite para monster
-            monster_projectile_path = os.path.join('assets', 'bullet', 'monstershoot.png')
-            if os.path.exists(monster_projectile_path):
-                self.monster_projectile_sprite = pygame.image.load(monster_projectile_path).convert_alpha()
-                # Escalar el sprite a un tamaño apropiado (ajustar según sea necesario)
-                self.monster_projectile_sprite = pygame.transform.scale(self.monster_projectile_sprite, (32, 32))
-                
-        except Exception as e:
-            print(f"Error loading projectile sprites: {e}")
-        
         # Inicializar diccionario de sprites y cargarlos
         self.sprites = {}
         self.current_sprite = None
@@ -61,21 +49,12 @@ class Enemy:
         """Carga los sprites de los enemigos."""
         try:
             # Cargar sprites básicos
-            self.sprites['grunt'] = pygame.transform.scale(
-                pygame.image.load('assets/enemies/pale_oni.png').convert_alpha(), 
-                (ENEMY_SIZE, ENEMY_SIZE)
-            )
-            self.sprites['runner'] = pygame.transform.scale(
-                pygame.image.load('assets/enemies/golden_oni.png').convert_alpha(), 
-                (ENEMY_SIZE, ENEMY_SIZE)
-            )
+            self.sprites['grunt'] = load_image('assets/enemies/pale_oni.png', (ENEMY_SIZE, ENEMY_SIZE))
+            self.sprites['runner'] = load_image('assets/enemies/golden_oni.png', (ENEMY_SIZE, ENEMY_SIZE))
             
             # Cargar sprite para sniper
             try:
-                self.sprites['sniper'] = pygame.transform.scale(
-                    pygame.image.load('C:\\Users\\herna\\OneDrive\\Documentos\\GitHub\\Juego\\Block Maze\\assets\\enemies\\snipper.png').convert_alpha(),
-                    (ENEMY_SIZE, ENEMY_SIZE)
-                )
+                self.sprites['sniper'] = load_image('C:\\Users\\herna\\OneDrive\\Documentos\\GitHub\\Juego\\Block Maze\\assets\\enemies\\snipper.png', (ENEMY_SIZE, ENEMY_SIZE))
             except Exception as e:
                 print(f"Error al cargar el sprite del sniper: {e}")
                 # Si falla la carga, usar un sprite existente
@@ -83,67 +62,28 @@ class Enemy:
                 
             # Cargar sprite para monster
             try:
-                self.sprites['monster'] = pygame.transform.scale(
-                    pygame.image.load('assets/enemies/Copper_abomination.png').convert_alpha(),
-                    (ENEMY_SIZE, ENEMY_SIZE)
-                )
+                self.sprites['monster'] = load_image('assets/enemies/Copper_abomination.png', (ENEMY_SIZE, ENEMY_SIZE))
             except Exception as e:
                 print(f"Error loading monster sprite: {e}")
                 self.sprites['monster'] = self.sprites['grunt'].copy()
 
             # Cargar sprites de enemigos de tipo brute con direcciones
-            self.sprites['brute_right'] = pygame.transform.scale(
-                pygame.image.load('assets/enemies/clay_mask/clay_mask3.png').convert_alpha(), 
-                (ENEMY_SIZE, ENEMY_SIZE)
-            )
-            self.sprites['brute_left'] = pygame.transform.scale(
-                pygame.image.load('assets/enemies/clay_mask/clay_mask1.png').convert_alpha(), 
-                (ENEMY_SIZE, ENEMY_SIZE)
-            )
-            self.sprites['brute_down'] = pygame.transform.scale(
-                pygame.image.load('assets/enemies/clay_mask/clay_mask4.png').convert_alpha(), 
-                (ENEMY_SIZE, ENEMY_SIZE)
-            )
-            self.sprites['brute_up'] = pygame.transform.scale(
-                pygame.image.load('assets/enemies/clay_mask/clay_mask2.png').convert_alpha(), 
-                (ENEMY_SIZE, ENEMY_SIZE)
-            )
+            self.sprites['brute_right'] = load_image('assets/enemies/clay_mask/clay_mask3.png', (ENEMY_SIZE, ENEMY_SIZE))
+            self.sprites['brute_left'] = load_image('assets/enemies/clay_mask/clay_mask1.png', (ENEMY_SIZE, ENEMY_SIZE))
+            self.sprites['brute_down'] = load_image('assets/enemies/clay_mask/clay_mask4.png', (ENEMY_SIZE, ENEMY_SIZE))
+            self.sprites['brute_up'] = load_image('assets/enemies/clay_mask/clay_mask2.png', (ENEMY_SIZE, ENEMY_SIZE))
             
             # Cargar sprites de la Estatua con direcciones
-            self.sprites['statue_right'] = pygame.transform.scale(
-                pygame.image.load('assets/enemies/ciclope/statue3.png').convert_alpha(), 
-                (ENEMY_SIZE, ENEMY_SIZE)
-            )
-            self.sprites['statue_left'] = pygame.transform.scale(
-                pygame.image.load('assets/enemies/ciclope/statue4.png').convert_alpha(), 
-                (ENEMY_SIZE, ENEMY_SIZE)
-            )
-            self.sprites['statue_down'] = pygame.transform.scale(
-                pygame.image.load('assets/enemies/ciclope/statue1.png').convert_alpha(), 
-                (ENEMY_SIZE, ENEMY_SIZE)
-            )
-            self.sprites['statue_up'] = pygame.transform.scale(
-                pygame.image.load('assets/enemies/ciclope/statue2.png').convert_alpha(), 
-                (ENEMY_SIZE, ENEMY_SIZE)
-            )
+            self.sprites['statue_right'] = load_image('assets/enemies/ciclope/statue3.png', (ENEMY_SIZE, ENEMY_SIZE))
+            self.sprites['statue_left'] = load_image('assets/enemies/ciclope/statue4.png', (ENEMY_SIZE, ENEMY_SIZE))
+            self.sprites['statue_down'] = load_image('assets/enemies/ciclope/statue1.png', (ENEMY_SIZE, ENEMY_SIZE))
+            self.sprites['statue_up'] = load_image('assets/enemies/ciclope/statue2.png', (ENEMY_SIZE, ENEMY_SIZE))
             
             # Cargar sprites del fantasma con direcciones
-            self.sprites['ghost_right'] = pygame.transform.scale(
-                pygame.image.load('assets/enemies/pale mask/pale_mask3.png').convert_alpha(), 
-                (ENEMY_SIZE, ENEMY_SIZE)
-            )
-            self.sprites['ghost_left'] = pygame.transform.scale(
-                pygame.image.load('assets/enemies/pale mask/pale_mask1.png').convert_alpha(), 
-                (ENEMY_SIZE, ENEMY_SIZE)
-            )
-            self.sprites['ghost_down'] = pygame.transform.scale(
-                pygame.image.load('assets/enemies/pale mask/pale_mask4.png').convert_alpha(), 
-                (ENEMY_SIZE, ENEMY_SIZE)
-            )
-            self.sprites['ghost_up'] = pygame.transform.scale(
-                pygame.image.load('assets/enemies/pale mask/pale_mask2.png').convert_alpha(), 
-                (ENEMY_SIZE, ENEMY_SIZE)
-            )
+            self.sprites['ghost_right'] = load_image('assets/enemies/pale mask/pale_mask3.png', (ENEMY_SIZE, ENEMY_SIZE))
+            self.sprites['ghost_left'] = load_image('assets/enemies/pale mask/pale_mask1.png', (ENEMY_SIZE, ENEMY_SIZE))
+            self.sprites['ghost_down'] = load_image('assets/enemies/pale mask/pale_mask4.png', (ENEMY_SIZE, ENEMY_SIZE))
+            self.sprites['ghost_up'] = load_image('assets/enemies/pale mask/pale_mask2.png', (ENEMY_SIZE, ENEMY_SIZE))
             
             # Establecer sprite inicial
             if self.kind == 'brute':
@@ -155,11 +95,8 @@ class Enemy:
             elif self.kind == 'ghost':
                 self.current_sprite = self.sprites['ghost_down']
                 self.direction = 'down'
-                # Hacer el sprite semi-transparente
-                for key in ['ghost_right', 'ghost_left', 'ghost_down', 'ghost_up']:
-                    if key in self.sprites:
-                        s = self.sprites[key]
-                        s.set_alpha(180)  # Hacerlo semi-transparente
+                # La transparencia se aplica al dibujar (variante de with_alpha):
+                # las superficies de la caché son compartidas y no se tocan
             else:
                 self.current_sprite = self.sprites.get(self.kind, self.sprites['grunt'])
 
@@ -189,51 +126,21 @@ class Enemy:
             
         return False, 0
 
-    def update_projectiles(self, dt: float, player_rect: pygame.Rect) -> bool:
-        """Actualiza los proyectiles y devuelve True si el jugador fue golpeado"""
-        player_hit = False
-        for proj in self._projectiles[:]:
-            # Mover proyectil
-            proj['x'] += proj['dx'] * dt * 300  # Velocidad del proyectil
-            proj['y'] += proj['dy'] * dt * 300
-            proj['lifetime'] -= dt
-            
-            # Verificar colisión con el jugador (área de colisión al doble del tamaño)
-            proj_rect = pygame.Rect(proj['x'] - 8, proj['y'] - 8, 16, 16)
-            if proj_rect.colliderect(player_rect):
-                player_hit = True
-                self._projectiles.remove(proj)
-            # Eliminar proyectiles viejos
-            elif proj['lifetime'] <= 0 or proj['x'] < 0 or proj['x'] > 1280 or proj['y'] < 0 or proj['y'] > 720:
-                self._projectiles.remove(proj)
-        return player_hit
-
-    def draw_projectiles(self, surface: pygame.Surface):
-        """Dibuja los proyectiles del enemigo"""
-        for proj in self._projectiles:
-            if self.kind == 'sniper' and self.projectile_sprite:
-                # Dibujar el sprite del proyectil rotado en la dirección del movimiento
-                angle = math.degrees(math.atan2(proj['dy'], proj['dx'])) - 90
-                rotated_sprite = pygame.transform.rotate(self.projectile_sprite, -angle)
-                sprite_rect = rotated_sprite.get_rect(center=(int(proj['x']), int(proj['y'])))
-                surface.blit(rotated_sprite, sprite_rect)
-            elif self.kind == 'monster' and self.monster_projectile_sprite:
-                # Calcular el ángulo de rotación basado en la dirección del movimiento
-                angle = math.degrees(math.atan2(proj['dy'], proj['dx']))
-                # Ajustar el ángulo para que el sprite apunte en la dirección correcta
-                # (sumar 90 grados para que la punta del sprite apunte hacia adelante)
-                angle += 90
-                # Rotar el sprite
-                rotated_sprite = pygame.transform.rotate(self.monster_projectile_sprite, -angle)
-                # Obtener el rectángulo del sprite rotado y centrarlo en la posición del proyectil
-                sprite_rect = rotated_sprite.get_rect(center=(int(proj['x']), int(proj['y'])))
-                # Dibujar el sprite rotado
-                surface.blit(rotated_sprite, sprite_rect)
-            else:
-                # Dibujar círculo como respaldo si no hay sprite
-                pygame.draw.circle(surface, (255, 100, 100), (int(proj['x']), int(proj['y'])), 4)
+    @staticmethod
+    def _blocked(rect: pygame.Rect, walls, obstacles, grid) -> bool:
+        """Colisión estática: usa la rejilla de la sala si está disponible, si no las listas."""
+        if grid is not None:
+            return grid.collides(rect)
+        if walls and rect.collidelist(walls) != -1:
+            return True
+        return bool(obstacles) and rect.collidelist(obstacles) != -1
 
-    def update(self, player_rect: pygame.Rect, dt: float, walls: list = None, obstacles: list = None):
+    def update(self, player_rect: pygame.Rect, dt: float, walls: list = None, obstacles: list = None, grid=None, projectiles=None, flow=None):
+        """
+        Mueve al enemigo; los tiradores emiten sus disparos en ``projectiles`` (ProjectilePool de la sala).
+        Con ``flow`` (FlowField de la sala) camina hacia la siguiente celda del camino en lugar
+        de ir en línea recta; el fantasma lo ignora porque atraviesa paredes.
+        """
         if not self.alive:
             return
             
@@ -243,14 +150,6 @@ class Enemy:
         if self.invuln_timer > 0:
             self.invuln_timer = max(0.0, self.invuln_timer - dt)
             
-        # Actualizar proyectiles
-        player_hit = self.update_projectiles(dt, player_rect)
-        if player_hit:
-            # Si es un sniper, causar 2 de daño
-            if self.kind in ['sniper', 'monster']:  # Monster también causa 2 de daño
-                return 2  # Causar 2 de daño
-            return True  # Para otros enemigos, causar 1 de daño
-            
         # Comportamiento específico del tipo de enemigo
         if self.kind == 'ghost':
             # Comportamiento similar al brute pero puede atravesar paredes
@@ -275,8 +174,10 @@ class Enemy:
                 
             # Mover al fantasma (puede atravesar paredes)
             speed = ENEMY_SPEED * self.speed_scale * dt
-            self.rect.x += dx * speed
-            self.rect.y += dy * speed
+            step_x, self._carry_x = subpixel_step(dx * speed, self._carry_x)
+            step_y, self._carry_y = subpixel_step(dy * speed, self._carry_y)
+            self.rect.x += step_x
+            self.rect.y += step_y
             
         elif self.kind == 'sniper':
             # Disparar al jugador periódicamente
@@ -289,14 +190,9 @@ class Enemy:
                 dist = max(1, math.sqrt(dx*dx + dy*dy))
                 dx, dy = dx/dist, dy/dist
                 
-                # Añadir nuevo proyectil
-                self._projectiles.append({
-                    'x': float(self.rect.centerx),
-                    'y': float(self.rect.centery),
-                    'dx': dx,
-                    'dy': dy,
-                    'lifetime': 5.0  # 5 segundos de vida máxima
-                })
+                # Añadir nuevo proyectil (5 segundos de vida máxima)
+                if projectiles is not None:
+                    projectiles.emit(float(self.rect.centerx), float(self.rect.centery), dx, dy, 5.0, 'sniper')
                 
         elif self.kind == 'monster':
             # Disparar en 8 direcciones periódicamente
@@ -321,13 +217,8 @@ class Enemy:
                     length = max(1, math.sqrt(dx*dx + dy*dy))
                     ndx, ndy = dx/length, dy/length
                     
-                    self._projectiles.append({
-                        'x': float(self.rect.centerx),
-                        'y': float(self.rect.centery),
-                        'dx': ndx,
-                        'dy': ndy,
-                        'lifetime': 3.0  # 3 segundos de vida
-                    })
+                    if projectiles is not None:
+                        projectiles.emit(float(self.rect.centerx), float(self.rect.centery), ndx, ndy, 3.0, 'monster')  # 3 segundos de vida
             return False
             
         # Comportamiento para otros tipos de enemigos
@@ -341,8 +232,13 @@ class Enemy:
         to_player = pygame.Vector2(player_rect.centerx - self.rect.centerx,
                                    player_rect.centery - self.rect.centery)
         base_speed = ENEMY_SPEED * self.speed_scale
-        if to_player.length_squared() > 0:
-            dir_vec = to_player.normalize()
+        heading = to_player
+        if flow is not None and self.kind != 'ghost':
+            waypoint = flow.waypoint(self.rect.centerx, self.rect.centery)
+            if waypoint is not None:
+                heading = pygame.Vector2(waypoint[0] - self.rect.centerx, waypoint[1] - self.rect.centery)
+        if heading.length_squared() > 0:
+            dir_vec = heading.normalize()
         else:
             dir_vec = pygame.Vector2(0, 0)
 
@@ -405,34 +301,22 @@ class Enemy:
                         self.direction = 'up'
 
         # Aplicar movimiento
-        self.rect.x += int(vx * dt)
-        self.rect.y += int(vy * dt)
-        
-        # Verificar colisiones y aplicar navegación inteligente
-        collision_detected = False
-        
-        # Verificar colisiones con paredes
-        if walls:
-            for wall in walls:
-                if self.rect.colliderect(wall):
-                    collision_detected = True
-                    break
+        prev_carry = (self._carry_x, self._carry_y)
+        step_x, self._carry_x = subpixel_step(vx * dt, self._carry_x)
+        step_y, self._carry_y = subpixel_step(vy * dt, self._carry_y)
+        self.rect.x += step_x
+        self.rect.y += step_y
         
-        # Verificar colisiones con obstáculos
-        if not collision_detected and obstacles:
-            for obstacle in obstacles:
-                if self.rect.colliderect(obstacle):
-                    collision_detected = True
-                    break
-        
-        if collision_detected:
-            # Revertir posición
+        # Verificar colisiones (paredes y obstáculos) y aplicar navegación inteligente
+        if self._blocked(self.rect, walls, obstacles, grid):
+            # Revertir posición (y el resto sub-píxel de ese paso, que no se dio)
             self.rect.x, self.rect.y = prev_x, prev_y
+            self._carry_x, self._carry_y = prev_carry
             
             # Intentar navegación alternativa
-            self._navigate_around_obstacle(prev_x, prev_y, vx, vy, dt, walls, obstacles)
+            self._navigate_around_obstacle(prev_x, prev_y, vx, vy, dt, walls, obstacles, grid)
 
-    def _navigate_around_obstacle(self, prev_x: int, prev_y: int, vx: float, vy: float, dt: float, walls: list, obstacles: list):
+    def _navigate_around_obstacle(self, prev_x: int, prev_y: int, vx: float, vy: float, dt: float, walls: list, obstacles: list, grid=None):
         """Intenta encontrar una ruta alternativa alrededor del obstáculo"""
         # Direcciones alternativas para probar (perpendiculares y diagonales)
         alternative_dirs = [
@@ -443,6 +327,10 @@ class Enemy:
             (-vx * 0.5, -vy * 0.5),  # Retroceso parcial
         ]
         
+        # Los pasos alternativos también arrastran el resto sub-píxel: a 120 Hz
+        # el 80 % de la velocidad no llega a 1 px por paso
+        carry_x = self._carry_x
+        
         # Probar cada dirección alternativa
         for alt_vx, alt_vy in alternative_dirs:
             # Normalizar velocidad alternativa
@@ -454,30 +342,18 @@ class Enemy:
                     alt_vy = (alt_vy / alt_length) * speed * 0.8
             
             # Probar movimiento alternativo
-            test_x = prev_x + int(alt_vx * dt)
-            test_y = prev_y + int(alt_vy * dt)
+            step_x, rest_x = subpixel_step(alt_vx * dt, carry_x)
+            step_y, _ = subpixel_step(alt_vy * dt, self._carry_y)
+            test_x = prev_x + step_x
+            test_y = prev_y + step_y
             
             # Crear rect temporal para probar colisión
             test_rect = pygame.Rect(test_x, test_y, self.rect.width, self.rect.height)
             
-            # Verificar si esta posición es válida
-            collision_found = False
-            
-            if walls:
-                for wall in walls:
-                    if test_rect.colliderect(wall):
-                        collision_found = True
-                        break
-            
-            if not collision_found and obstacles:
-                for obstacle in obstacles:
-                    if test_rect.colliderect(obstacle):
-                        collision_found = True
-                        break
-            
             # Si no hay colisión, usar esta dirección
-            if not collision_found:
+            if not self._blocked(test_rect, walls, obstacles, grid):
                 self.rect.x = test_x
+                self._carry_x = rest_x
 
         # Si ninguna dirección funciona, quedarse quieto (pero esto es raro)
         pass
@@ -486,48 +362,25 @@ class Enemy:
         if not self.alive:
             return
 
+        pos = (self.rect.x + camera_offset[0], self.rect.y + camera_offset[1])
         # Si es un fantasma, dibujar con transparencia
         if self.kind == 'ghost' and self.current_sprite:
-            # Guardar el estado de la superficie
-            old_alpha = self.current_sprite.get_alpha()
-            # Aplicar transparencia
-            self.current_sprite.set_alpha(180)
-            # Dibujar
-            surface.blit(self.current_sprite, 
-                        (self.rect.x + camera_offset[0], self.rect.y + camera_offset[1]))
-            # Restaurar la transparencia original
-            self.current_sprite.set_alpha(old_alpha)
-            # Dibujar proyectiles para fantasmas
-            self.draw_projectiles(surface)
+            surface.blit(with_alpha(self.current_sprite, GHOST_ALPHA), pos)
             return
 
         # Si tenemos sprite, usarlo
         if self.current_sprite:
-            sprite_to_draw = self.current_sprite.copy()
-
-            # Aplicar efectos de color
+            sprite_to_draw = self.current_sprite
             # Parpadeo blanco cuando está herido (prioridad máxima)
             if self.hurt_timer > 0 and int(self.hurt_timer * 15) % 2 == 0:
-                # Crear superficie blanca del mismo tamaño
-                white_surface = pygame.Surface(sprite_to_draw.get_size())
-                white_surface.fill((255, 255, 255))
-                white_surface.set_alpha(180)  # Semi-transparente para mezclar
-                sprite_to_draw.blit(white_surface, (0, 0), special_flags=pygame.BLEND_ADD)
+                sprite_to_draw = tinted(sprite_to_draw, *HURT_TINT)
             # Efecto para brute en carga
             elif self.kind == 'brute' and self._charge_time > 0:
-                orange_surface = pygame.Surface(sprite_to_draw.get_size())
-                orange_surface.fill((255, 200, 80))
-                orange_surface.set_alpha(100)
-                sprite_to_draw.blit(orange_surface, (0, 0), special_flags=pygame.BLEND_ADD)
+                sprite_to_draw = tinted(sprite_to_draw, *CHARGE_TINT)
             # Efecto para sniper al disparar
             elif self.kind == 'sniper' and self._shoot_timer > 1.8:
-                red_surface = pygame.Surface(sprite_to_draw.get_size())
-                red_surface.fill((255, 100, 100))
-                red_surface.set_alpha(100)
-                sprite_to_draw.blit(red_surface, (0, 0), special_flags=pygame.BLEND_ADD)
-
-            # Dibujar el sprite con efectos aplicados
-            surface.blit(sprite_to_draw, (self.rect.x + camera_offset[0], self.rect.y + camera_offset[1]))
+                sprite_to_draw = tinted(sprite_to_draw, *AIM_TINT)
+            surface.blit(sprite_to_draw, pos)
         else:
             # Fallback: dibujar rectángulo si no hay sprite
             color = self.color
@@ -542,6 +395,3 @@ class Enemy:
                             self.rect.y + camera_offset[1], 
                             self.rect.width, 
                             self.rect.height))
-        
-        # Dibujar proyectiles
-        self.draw_projectiles(surface)
@@ -1,6 +1,8 @@
 import pygame
 from typing import Optional
 
+from isac.core.assets import load_image
+
 class InfiniteShotPickup:
     """
     A power-up that grants the player infinite arrows for a limited time.
@@ -16,8 +18,7 @@ class InfiniteShotPickup:
         # Load sprite if available
         self.image = None
         try:
-            self.image = pygame.image.load('assets/player/infinite_shot.png').convert_alpha()
-            self.image = pygame.transform.scale(self.image, (24, 24))
+            self.image = load_image('assets/player/infinite_shot.png', (24, 24))
         except:
             # Fallback to a colored rectangle if image not found
             self.image = None
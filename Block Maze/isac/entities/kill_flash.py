@@ -0,0 +1,23 @@
+import pygame
+
+KILL_FLASH_TIME = 0.15  # segundos
+
+
+class KillFlash:
+    """Destello blanco breve sobre un enemigo que acaba de morir (reciclable con ObjectPool)."""
+
+    __slots__ = ('rect', 'time', 'alive')
+
+    def __init__(self, rect: pygame.Rect, time: float = KILL_FLASH_TIME) -> None:
+        self.rect = pygame.Rect(rect)
+        self.time = time
+        self.alive = time > 0
+
+    def reset(self, rect: pygame.Rect, time: float = KILL_FLASH_TIME) -> None:
+        self.rect.update(rect)
+        self.time = time
+        self.alive = time > 0
+
+    def update(self, dt: float) -> None:
+        self.time = max(0.0, self.time - dt)
+        self.alive = self.time > 0
@@ -3,6 +3,7 @@ import pygame
 from dataclasses import dataclass, field
 from typing import Dict, Optional, Tuple
 from isac.settings import CYAN, WHITE, TILE, RED
+from isac.core.assets import load_image
 
 
 @dataclass
@@ -13,20 +14,17 @@ class Pickup:
     _images: Dict[str, pygame.Surface] = field(default_factory=dict, init=False)
     
     def __post_init__(self):
-        # Cargar imágenes solo una vez
+        # Las imágenes se decodifican una sola vez gracias a la caché de assets
         if not self._images:
             try:
-                # Cargar imagen de bomba (tamaño duplicado)
-                bomb_img = pygame.image.load(os.path.join('assets', 'player', 'bomba.png')).convert_alpha()
-                self._images['bomb'] = pygame.transform.scale(bomb_img, (40, 40))
+                # Imagen de bomba (tamaño duplicado)
+                self._images['bomb'] = load_image(os.path.join('assets', 'player', 'bomba.png'), (40, 40))
                 
-                # Cargar imagen de llave (tamaño duplicado)
-                key_img = pygame.image.load(os.path.join('assets', 'player', 'llave.png')).convert_alpha()
-                self._images['key'] = pygame.transform.scale(key_img, (40, 40))
+                # Imagen de llave (tamaño duplicado)
+                self._images['key'] = load_image(os.path.join('assets', 'player', 'llave.png'), (40, 40))
                 
-                    # Cargar imagen de BIG SHOT (ojo)
-                eyeball_img = pygame.image.load(os.path.join('assets', 'player', 'eyeball.png')).convert_alpha()
-                self._images['big_shot'] = pygame.transform.scale(eyeball_img, (40, 40))
+                # Imagen de BIG SHOT (ojo)
+                self._images['big_shot'] = load_image(os.path.join('assets', 'player', 'eyeball.png'), (40, 40))
                 
                 # Para otros tipos, mantener el comportamiento original con colores
                 self._images['magic'] = None
@@ -11,8 +11,13 @@ from isac.settings import (
     MELEE_COOLDOWN,
     MELEE_RANGE,
 )
+from isac.core.assets import tinted
+from isac.core.motion import subpixel_step
 from isac.characters import get_character, load_character_sprites
 
+# Destello de daño: (color sumado, intensidad)
+INVULN_TINT = ((255, 255, 255), 150)
+
 
 class Player:
     def __init__(self, x: int, y: int, speed: int = PLAYER_SPEED, character_type: str = "crystal") -> None:
@@ -42,6 +47,9 @@ class Player:
         self.melee_active_time = 0.0  # duración breve del golpe visible
         self.shield = False
         self._prev_center = self.rect.center
+        # Resto sub-píxel del movimiento (ver isac.core.motion)
+        self._carry_x = 0.0
+        self._carry_y = 0.0
         
         # Inicializar sistema de sprites
         self.sprites = load_character_sprites(self.character_data, (PLAYER_SIZE, PLAYER_SIZE))
@@ -141,8 +149,10 @@ class Player:
 
         # Movimiento con colisiones
         self._prev_center = self.rect.center
-        self.rect.x += int(vx * dt)
-        self.rect.y += int(vy * dt)
+        step_x, self._carry_x = subpixel_step(vx * dt, self._carry_x)
+        step_y, self._carry_y = subpixel_step(vy * dt, self._carry_y)
+        self.rect.x += step_x
+        self.rect.y += step_y
 
         # Escudo: mantener consume magia por segundo
         if self.shield and self.magic > 0:
@@ -265,16 +275,10 @@ class Player:
         
         # Dibujar jugador con sprite o fallback
         if self.current_sprite:
-            sprite_to_draw = self.current_sprite.copy()
-            
-            # Aplicar efecto de parpadeo si está en invulnerabilidad
+            sprite_to_draw = self.current_sprite
+            # Parpadeo blanco durante la invulnerabilidad (variante precalculada del sprite)
             if self.invuln > 0 and int(self.invuln * 10) % 2 == 0:
-                # Crear superficie blanca semi-transparente para efecto de daño
-                white_surface = pygame.Surface(sprite_to_draw.get_size())
-                white_surface.fill((255, 255, 255))
-                white_surface.set_alpha(150)
-                sprite_to_draw.blit(white_surface, (0, 0), special_flags=pygame.BLEND_ADD)
-            
+                sprite_to_draw = tinted(sprite_to_draw, *INVULN_TINT)
             surface.blit(sprite_to_draw, self.rect)
         else:
             # Fallback: dibujar rectángulo azul si no hay sprite
@@ -320,6 +324,7 @@ class Player:
 
     def revert_position(self) -> None:
         self.rect.center = self._prev_center
+        self._carry_x = self._carry_y = 0.0
         
     def set_infinite_shots(self, enabled: bool) -> None:
         """Activa o desactiva el disparo infinito."""
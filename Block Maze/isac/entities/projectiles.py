@@ -0,0 +1,200 @@
+"""
+Proyectiles enemigos de una sala, guardados en arrays contiguos.
+
+Todos los tiradores (sniper, monster y el futuro jefe) emiten en un único
+``ProjectilePool`` por sala. Cada frame se actualizan todos de una pasada:
+con NumPy si está instalado y, si no, con ``array`` de la biblioteca estándar.
+Los proyectiles muertos se eliminan intercambiándolos con el último (swap-remove),
+sin desplazar el resto ni crear objetos por proyectil.
+"""
+from __future__ import annotations
+import math
+import os
+from array import array
+from typing import Dict, List, Optional
+
+import pygame
+
+from isac.settings import (WIDTH, HEIGHT, ENEMY_PROJECTILE_SPEED, ENEMY_PROJECTILE_DAMAGE,
+                           PROJECTILE_ROTATION_STEPS)
+from isac.core.assets import load_image
+from isac.core.rotation import RotationSet, get_rotations
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+# Tipos de tirador (columna "owner" de los arrays)
+OWNER_KINDS = ('sniper', 'monster', 'boss')
+OWNER_INDEX = {kind: i for i, kind in enumerate(OWNER_KINDS)}
+
+# Sprite y giro extra (grados) para que la punta apunte hacia donde avanza
+PROJECTILE_SPRITES = {
+    'sniper': (os.path.join('assets', 'bullet', 'Estrellacaida1.png'), -90),
+    'monster': (os.path.join('assets', 'bullet', 'monstershoot.png'), 90),
+}
+PROJECTILE_SPRITE_SIZE = (32, 32)
+# Mitad del lado de la caja de colisión (16x16)
+PROJECTILE_HALF = 8
+
+
+class ProjectilePool:
+    """Pool de proyectiles enemigos en estructura de arrays (x, y, dx, dy, vida, dueño)."""
+
+    def __init__(self, capacity: int = 256, use_numpy: Optional[bool] = None) -> None:
+        self.use_numpy = (np is not None) if use_numpy is None else (use_numpy and np is not None)
+        self.count = 0
+        self._alloc(max(8, capacity))
+        self._sprites: Dict[int, Optional[RotationSet]] = {}
+        self._sprite_angle: Dict[int, float] = {}
+
+    # ---- Almacenamiento ----
+    def _alloc(self, capacity: int) -> None:
+        old = None
+        if self.count:
+            old = (self.x, self.y, self.dx, self.dy, self.life, self.owner)
+        self.capacity = capacity
+        if self.use_numpy:
+            self.x = np.zeros(capacity, dtype=np.float64)
+            self.y = np.zeros(capacity, dtype=np.float64)
+            self.dx = np.zeros(capacity, dtype=np.float64)
+            self.dy = np.zeros(capacity, dtype=np.float64)
+            self.life = np.zeros(capacity, dtype=np.float64)
+            self.owner = np.zeros(capacity, dtype=np.int8)
+        else:
+            self.x = array('d', bytes(8 * capacity))
+            self.y = array('d', bytes(8 * capacity))
+            self.dx = array('d', bytes(8 * capacity))
+            self.dy = array('d', bytes(8 * capacity))
+            self.life = array('d', bytes(8 * capacity))
+            self.owner = array('b', bytes(capacity))
+        if old is not None:
+            n = self.count
+            for dst, src in zip((self.x, self.y, self.dx, self.dy, self.life, self.owner), old):
+                dst[:n] = src[:n]
+
+    def emit(self, x: float, y: float, dx: float, dy: float, lifetime: float, owner: str) -> None:
+        """Añade un proyectil. (dx, dy) debe venir normalizado."""
+        if self.count >= self.capacity:
+            self._alloc(self.capacity * 2)
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.dx[i] = dx
+        self.dy[i] = dy
+        self.life[i] = lifetime
+        self.owner[i] = OWNER_INDEX.get(owner, 0)
+        self.count = i + 1
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    # ---- Simulación ----
+    def update(self, dt: float, player_rect: pygame.Rect) -> int:
+        """
+        Mueve todos los proyectiles, elimina los que chocan o caducan y
+        devuelve el daño a aplicar al jugador este frame (0 si nadie le dio).
+        """
+        if self.count == 0:
+            return 0
+        if self.use_numpy:
+            return self._update_numpy(dt, player_rect)
+        return self._update_array(dt, player_rect)
+
+    def _update_numpy(self, dt: float, pr: pygame.Rect) -> int:
+        n = self.count
+        x, y, life = self.x[:n], self.y[:n], self.life[:n]
+        step = dt * ENEMY_PROJECTILE_SPEED
+        x += self.dx[:n] * step
+        y += self.dy[:n] * step
+        life -= dt
+        # Misma caja que pygame.Rect(x - 8, y - 8, 16, 16) (trunca hacia cero)
+        left = np.trunc(x - PROJECTILE_HALF)
+        top = np.trunc(y - PROJECTILE_HALF)
+        size = 2 * PROJECTILE_HALF
+        hit = (left < pr.right) & (left + size > pr.left) & (top < pr.bottom) & (top + size > pr.top)
+        dead = hit | (life <= 0) | (x < 0) | (x > WIDTH) | (y < 0) | (y > HEIGHT)
+        if not dead.any():
+            return 0
+        damage = ENEMY_PROJECTILE_DAMAGE if hit.any() else 0
+        # Compactación en bloque: equivale a muchos swap-remove de una vez
+        keep = ~dead
+        m = int(keep.sum())
+        for col in (self.x, self.y, self.dx, self.dy, self.life, self.owner):
+            col[:m] = col[:n][keep]
+        self.count = m
+        return damage
+
+    def _update_array(self, dt: float, pr: pygame.Rect) -> int:
+        x, y, dx, dy, life, owner = self.x, self.y, self.dx, self.dy, self.life, self.owner
+        step = dt * ENEMY_PROJECTILE_SPEED
+        left_b, right_b, top_b, bottom_b = pr.left, pr.right, pr.top, pr.bottom
+        size = 2 * PROJECTILE_HALF
+        damage = 0
+        n = self.count
+        i = 0
+        while i < n:
+            px = x[i] + dx[i] * step
+            py = y[i] + dy[i] * step
+            t = life[i] - dt
+            left = int(px - PROJECTILE_HALF)
+            top = int(py - PROJECTILE_HALF)
+            if left < right_b and left + size > left_b and top < bottom_b and top + size > top_b:
+                damage = ENEMY_PROJECTILE_DAMAGE
+                dead = True
+            else:
+                dead = t <= 0 or px < 0 or px > WIDTH or py < 0 or py > HEIGHT
+            if dead:
+                # swap-remove: el último ocupa el hueco y se procesa en esta misma i
+                n -= 1
+                if i != n:
+                    x[i], y[i], dx[i], dy[i], life[i], owner[i] = x[n], y[n], dx[n], dy[n], life[n], owner[n]
+                continue
+            x[i] = px
+            y[i] = py
+            life[i] = t
+            i += 1
+        self.count = n
+        return damage
+
+    # ---- Dibujo ----
+    def _sprite_for(self, owner: int) -> Optional[RotationSet]:
+        if owner not in self._sprites:
+            rotations = None
+            entry = PROJECTILE_SPRITES.get(OWNER_KINDS[owner])
+            if entry is not None:
+                try:
+                    sprite = load_image(entry[0], PROJECTILE_SPRITE_SIZE)
+                    rotations = get_rotations(sprite, PROJECTILE_ROTATION_STEPS)
+                except pygame.error as e:
+                    print(f"Error loading projectile sprite: {e}")
+                self._sprite_angle[owner] = entry[1]
+            self._sprites[owner] = rotations
+        return self._sprites[owner]
+
+    def bounds(self) -> List[pygame.Rect]:
+        """Zonas de pantalla que pinta draw(), una por proyectil."""
+        rects = []
+        for i in range(self.count):
+            rotations = self._sprite_for(int(self.owner[i]))
+            half = (max(rotations.sprite.get_size()) * 3) // 4 + 1 if rotations is not None else 5
+            rects.append(pygame.Rect(int(self.x[i]) - half, int(self.y[i]) - half, 2 * half, 2 * half))
+        return rects
+
+    def draw(self, surface: pygame.Surface) -> None:
+        for i in range(self.count):
+            px, py = int(self.x[i]), int(self.y[i])
+            owner = int(self.owner[i])
+            rotations = self._sprite_for(owner)
+            if rotations is not None:
+                # Sprite pre-rotado más cercano a la dirección del movimiento
+                angle = math.degrees(math.atan2(self.dy[i], self.dx[i])) + self._sprite_angle[owner]
+                rotated_sprite = rotations.at(-angle)
+                surface.blit(rotated_sprite, rotated_sprite.get_rect(center=(px, py)))
+            else:
+                # Círculo como respaldo si no hay sprite
+                pygame.draw.circle(surface, (255, 100, 100), (px, py), 4)
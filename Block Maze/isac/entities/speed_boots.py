@@ -1,6 +1,7 @@
 import pygame
 import math
 from isac.settings import TILE
+from isac.core.assets import load_image
 
 class SpeedBoots:
     def __init__(self, x: int, y: int):
@@ -13,9 +14,8 @@ class SpeedBoots:
         
         # Cargar el sprite de las botas
         try:
-            self.sprite = pygame.image.load('assets/player/speedboots.png').convert_alpha()
-            # Escalar el sprite al tamaño del objeto
-            self.sprite = pygame.transform.scale(self.sprite, (self.rect.width, self.rect.height))
+            # Sprite escalado al tamaño del objeto
+            self.sprite = load_image('assets/player/speedboots.png', (self.rect.width, self.rect.height))
         except pygame.error as e:
             print(f"Error al cargar el sprite de las botas: {e}")
             self.sprite = None
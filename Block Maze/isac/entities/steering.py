@@ -0,0 +1,269 @@
+"""
+Persecución en lote para los enemigos que caminan hacia el jugador.
+
+``Enemy.update`` resuelve cada enemigo por separado (vectores de pygame,
+normalización y su propia prueba de colisión). En salas con muchos enemigos
+``SteeringBatch`` copia el estado de los perseguidores (grunt, runner,
+brute, statue y ghost) a arrays de NumPy —posiciones, restos sub-píxel,
+escala de velocidad, fase del zig-zag y temporizadores de carga—, calcula la
+dirección de todos de una pasada, resuelve las colisiones con
+``CollisionGrid.collides_many`` y vuelve a escribir el resultado en cada
+``Enemy``. Reproduce paso a paso la versión escalar, incluido el rodeo de
+obstáculos de ``_navigate_around_obstacle`` y el seguimiento del campo de
+flujo de la sala (``FlowField.waypoints_many``).
+
+Sin NumPy, o con pocos enemigos, ``PlayScene`` sigue usando ``Enemy.update``.
+"""
+from __future__ import annotations
+import math
+from typing import List, Optional, Sequence
+
+import pygame
+
+from isac.settings import ENEMY_SPEED, STEERING_BATCH_ENABLED, STEERING_BATCH_MIN
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+# Tipos que persiguen al jugador (sniper y monster disparan y siguen en Enemy.update)
+CHASER_KINDS = ('grunt', 'runner', 'brute', 'statue', 'ghost')
+# Direcciones de sprite por código (0..3)
+DIRECTIONS = ('right', 'left', 'down', 'up')
+# Umbral de distancia (px) para que el brute inicie una embestida
+BRUTE_CHARGE_RANGE = 180
+
+
+def _facing(dx, dy):
+    """Código de DIRECTIONS igual que el if/else de brute y statue en Enemy.update."""
+    horizontal = np.abs(dx) > np.abs(dy)
+    return np.where(horizontal, np.where(dx > 0, 0, 1), np.where(dy > 0, 2, 3))
+
+
+def _subpixel(amount, carry):
+    """Versión en arrays de isac.core.motion.subpixel_step."""
+    total = amount + carry
+    step = np.trunc(total)
+    return step.astype(np.int64), total - step
+
+
+class SteeringBatch:
+    """Actualiza de una vez a los perseguidores vivos de una sala."""
+
+    def __init__(self, use_numpy: Optional[bool] = None, min_batch: int = STEERING_BATCH_MIN) -> None:
+        wanted = STEERING_BATCH_ENABLED if use_numpy is None else use_numpy
+        self.enabled = bool(wanted) and np is not None
+        self.min_batch = min_batch
+
+    @staticmethod
+    def handles(enemy) -> bool:
+        return enemy.alive and enemy.kind in CHASER_KINDS
+
+    def select(self, enemies: Sequence) -> List:
+        """Perseguidores de ``enemies`` a actualizar en lote, o [] si no compensa."""
+        if not self.enabled:
+            return []
+        chasers = [e for e in enemies if e.alive and e.kind in CHASER_KINDS]
+        if len(chasers) < self.min_batch:
+            return []
+        # collides_many trabaja con un único tamaño de rect
+        size = chasers[0].rect.size
+        if any(e.rect.size != size for e in chasers):
+            return []
+        return chasers
+
+    def update(self, chasers: Sequence, player_rect: pygame.Rect, dt: float, grid, flow=None) -> List:
+        """
+        Mueve ``chasers`` un paso de ``dt`` (siguiendo ``flow`` si se pasa, como
+        ``Enemy.update``). Devuelve los brutes que empezaron a cargar en este
+        paso (para el sonido de embestida).
+        """
+        n = len(chasers)
+        if n == 0:
+            return []
+        f64 = np.float64
+        x = np.fromiter((e.rect.x for e in chasers), np.int64, n)
+        y = np.fromiter((e.rect.y for e in chasers), np.int64, n)
+        width = chasers[0].rect.width
+        height = chasers[0].rect.height
+        carry_x = np.fromiter((e._carry_x for e in chasers), f64, n)
+        carry_y = np.fromiter((e._carry_y for e in chasers), f64, n)
+        speed_scale = np.fromiter((e.speed_scale for e in chasers), f64, n)
+        hurt = np.fromiter((e.hurt_timer for e in chasers), f64, n)
+        invuln = np.fromiter((e.invuln_timer for e in chasers), f64, n)
+        kinds = [e.kind for e in chasers]
+        kind = np.fromiter((CHASER_KINDS.index(k) for k in kinds), np.int8, n)
+        is_runner = kind == CHASER_KINDS.index('runner')
+        is_brute = kind == CHASER_KINDS.index('brute')
+        is_statue = kind == CHASER_KINDS.index('statue')
+        is_ghost = kind == CHASER_KINDS.index('ghost')
+        pcx, pcy = player_rect.centerx, player_rect.centery
+
+        # Temporizadores de daño
+        hurt = np.where(hurt > 0, np.maximum(0.0, hurt - dt), hurt)
+        invuln = np.where(invuln > 0, np.maximum(0.0, invuln - dt), invuln)
+
+        facing = np.full(n, -1, dtype=np.int8)
+
+        # Fantasma: primer movimiento sin colisiones
+        if is_ghost.any():
+            g = np.nonzero(is_ghost)[0]
+            gdx = (pcx - (x[g] + width // 2)).astype(f64)
+            gdy = (pcy - (y[g] + height // 2)).astype(f64)
+            dist = np.sqrt(gdx * gdx + gdy * gdy)
+            moving = dist > 0
+            safe = np.where(moving, dist, 1.0)
+            gdx = np.where(moving, gdx / safe, gdx)
+            gdy = np.where(moving, gdy / safe, gdy)
+            horizontal = np.abs(gdx) > np.abs(gdy)
+            ghost_facing = np.where(horizontal, np.where(gdx > 0, 0, 1),
+                                    np.where(gdy != 0, np.where(gdy > 0, 2, 3), -1))
+            facing[g] = ghost_facing
+            speed = ENEMY_SPEED * speed_scale[g] * dt
+            step_x, carry_x[g] = _subpixel(gdx * speed, carry_x[g])
+            step_y, carry_y[g] = _subpixel(gdy * speed, carry_y[g])
+            x[g] += step_x
+            y[g] += step_y
+
+        prev_x = x.copy()
+        prev_y = y.copy()
+
+        # Dirección hacia el jugador (o hacia la siguiente celda del campo de flujo)
+        cx = x + width // 2
+        cy = y + height // 2
+        tx = (pcx - cx).astype(f64)
+        ty = (pcy - cy).astype(f64)
+        length = np.sqrt(tx * tx + ty * ty)
+        if flow is not None:
+            wx, wy, follow = flow.waypoints_many(cx, cy)
+            follow &= ~is_ghost
+            tx = np.where(follow, (wx - cx).astype(f64), tx)
+            ty = np.where(follow, (wy - cy).astype(f64), ty)
+        heading = np.sqrt(tx * tx + ty * ty)
+        has_dir = (tx * tx + ty * ty) > 0
+        safe = np.where(has_dir, heading, 1.0)
+        dir_x = np.where(has_dir, tx / safe, 0.0)
+        dir_y = np.where(has_dir, ty / safe, 0.0)
+        base_speed = ENEMY_SPEED * speed_scale
+        vx = dir_x * base_speed
+        vy = dir_y * base_speed
+
+        # Runner: zig-zag perpendicular (math.sin para coincidir bit a bit con la versión escalar)
+        phase = None
+        if is_runner.any():
+            r = np.nonzero(is_runner)[0]
+            phase = np.fromiter((chasers[i]._zigzag_phase for i in r), f64, len(r)) + dt * 6.0
+            sin = np.fromiter((math.sin(p) for p in phase), f64, len(r))
+            rdx, rdy = dir_x[r], dir_y[r]
+            mx = rdx + (-rdy * 0.6) * sin
+            my = rdy + (rdx * 0.6) * sin
+            mlen2 = mx * mx + my * my
+            ok = mlen2 > 0
+            mlen = np.where(ok, np.sqrt(mlen2), 1.0)
+            mx = np.where(ok, mx / mlen, rdx)
+            my = np.where(ok, my / mlen, rdy)
+            vx[r] = mx * base_speed[r]
+            vy[r] = my * base_speed[r]
+
+        # Brute: embestida con cooldown
+        started = np.zeros(n, dtype=bool)
+        charge_cd = charge_time = None
+        if is_brute.any():
+            b = np.nonzero(is_brute)[0]
+            charge_cd = np.fromiter((chasers[i]._charge_cd for i in b), f64, len(b))
+            charge_time = np.fromiter((chasers[i]._charge_time for i in b), f64, len(b))
+            charge_cd = np.where(charge_cd > 0, np.maximum(0.0, charge_cd - dt), charge_cd)
+            charge_time = np.where(charge_time > 0, np.maximum(0.0, charge_time - dt), charge_time)
+            start = (charge_time == 0) & (charge_cd == 0) & (length[b] < BRUTE_CHARGE_RANGE)
+            charge_time = np.where(start, 0.6, charge_time)
+            charge_cd = np.where(start, 2.0, charge_cd)
+            started[b] = start
+            mul = np.where(charge_time > 0, 2.0, 1.0)
+            vx[b] = dir_x[b] * base_speed[b] * mul
+            vy[b] = dir_y[b] * base_speed[b] * mul
+
+        turns = is_brute | is_statue
+        facing = np.where(turns, _facing(dir_x, dir_y), facing)
+
+        # Movimiento y colisión contra la rejilla estática
+        prev_carry_x, prev_carry_y = carry_x, carry_y
+        step_x, carry_x = _subpixel(vx * dt, carry_x)
+        step_y, carry_y = _subpixel(vy * dt, carry_y)
+        x = x + step_x
+        y = y + step_y
+        blocked = grid.collides_many(x, y, width, height)
+        if blocked.any():
+            k = np.nonzero(blocked)[0]
+            x[k] = prev_x[k]
+            y[k] = prev_y[k]
+            carry_x[k] = prev_carry_x[k]
+            carry_y[k] = prev_carry_y[k]
+            x[k], carry_x[k] = self._navigate(prev_x[k], prev_y[k], vx[k], vy[k], dt, width, height, grid,
+                                              carry_x[k], carry_y[k])
+
+        # Escribir el resultado en cada Enemy
+        xs, ys = x.tolist(), y.tolist()
+        cxs, cys = carry_x.tolist(), carry_y.tolist()
+        hurts, invulns = hurt.tolist(), invuln.tolist()
+        faces = facing.tolist()
+        was_charging = [e.charge_just_started for e in chasers]
+        for i, e in enumerate(chasers):
+            e.rect.x = xs[i]
+            e.rect.y = ys[i]
+            e._carry_x = cxs[i]
+            e._carry_y = cys[i]
+            e.hurt_timer = hurts[i]
+            e.invuln_timer = invulns[i]
+            e.charge_just_started = False
+            face = faces[i]
+            if face >= 0:
+                e.direction = DIRECTIONS[face]
+                e.current_sprite = e.sprites.get(f'{kinds[i]}_{e.direction}', e.current_sprite)
+        if phase is not None:
+            for i, value in zip(np.nonzero(is_runner)[0].tolist(), phase.tolist()):
+                chasers[i]._zigzag_phase = value
+        charged = []
+        if charge_cd is not None:
+            b = np.nonzero(is_brute)[0].tolist()
+            for i, cd, ct, st in zip(b, charge_cd.tolist(), charge_time.tolist(), started[is_brute].tolist()):
+                e = chasers[i]
+                e._charge_cd = cd
+                e._charge_time = ct
+                if st:
+                    e.charge_just_started = True
+                    if not was_charging[i]:
+                        charged.append(e)
+        return charged
+
+    @staticmethod
+    def _navigate(prev_x, prev_y, vx, vy, dt: float, width: int, height: int, grid, carry_x, carry_y):
+        """
+        ``Enemy._navigate_around_obstacle`` en arrays: prueba las cinco
+        direcciones alternativas y se queda con la x (y su resto sub-píxel)
+        de la última que esté libre.
+        """
+        speed = np.sqrt(vx * vx + vy * vy)
+        alternatives = (
+            (vy, -vx),
+            (-vy, vx),
+            (vx * 0.7 + vy * 0.7, vy * 0.7 - vx * 0.7),
+            (vx * 0.7 - vy * 0.7, vy * 0.7 + vx * 0.7),
+            (-vx * 0.5, -vy * 0.5),
+        )
+        result = prev_x.copy()
+        result_carry = carry_x.copy()
+        for alt_vx, alt_vy in alternatives:
+            alt_length = np.sqrt(alt_vx * alt_vx + alt_vy * alt_vy)
+            scale = (speed > 0) & (alt_length > 0)
+            safe = np.where(scale, alt_length, 1.0)
+            alt_vx = np.where(scale, (alt_vx / safe) * speed * 0.8, alt_vx)
+            alt_vy = np.where(scale, (alt_vy / safe) * speed * 0.8, alt_vy)
+            step_x, rest_x = _subpixel(alt_vx * dt, carry_x)
+            step_y, _ = _subpixel(alt_vy * dt, carry_y)
+            test_x = prev_x + step_x
+            test_y = prev_y + step_y
+            free = ~grid.collides_many(test_x, test_y, width, height)
+            result = np.where(free, test_x, result)
+            result_carry = np.where(free, rest_x, result_carry)
+        return result, result_carry
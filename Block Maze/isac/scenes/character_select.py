@@ -1,14 +1,16 @@
 import pygame
 from isac.core.scene import Scene
+from isac.core.fonts import get_font
 from isac.settings import WIDTH, HEIGHT, WHITE, BLUE, GREEN, RED
 from isac.characters import get_character, GLASS, CRYSTAL
+from isac.core.assets import load_image
 
 class CharacterSelectScene(Scene):
     def __init__(self, game: "Game") -> None:
         super().__init__(game)
-        self.font = pygame.font.SysFont(None, 48)
-        self.small = pygame.font.SysFont(None, 28)
-        self.title_font = pygame.font.SysFont(None, 64)
+        self.font = get_font(48)
+        self.small = get_font(28)
+        self.title_font = get_font(64)
         self.selected_character = 0  # 0, 1, 2, or 3
         # Calculate box dimensions and positions
         self.box_width = 140  # Slightly smaller to fit 4 characters
@@ -40,12 +42,12 @@ class CharacterSelectScene(Scene):
                 # Load and scale the character image
                 img_path = char_data.sprite_paths.get('default', '')
                 if img_path:
-                    char_img = pygame.image.load(img_path).convert_alpha()
+                    char_img = load_image(img_path)
                     # Scale the image while maintaining aspect ratio
                     img_width = self.box_width - 60
                     aspect_ratio = char_img.get_height() / char_img.get_width()
                     img_height = int(img_width * aspect_ratio)
-                    char_img = pygame.transform.scale(char_img, (img_width, img_height))
+                    char_img = load_image(img_path, (img_width, img_height))
                 else:
                     char_img = None
                 
@@ -76,10 +78,10 @@ class CharacterSelectScene(Scene):
             elif event.key == pygame.K_RIGHT:
                 self.selected_character = (self.selected_character + 1) % 3
             if event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                from .play import PlayScene
+                from .loading import start_play
                 # Get the selected character's type
                 char_type = self.characters[self.selected_character]['type']
-                self.game.change_scene(PlayScene, character_type=char_type)
+                start_play(self.game, character_type=char_type)
                 return
             elif event.key == pygame.K_ESCAPE:
                 from .menu import MenuScene
@@ -98,10 +100,10 @@ class CharacterSelectScene(Scene):
                 box_x = start_x + i * (self.box_width + self.box_padding)
                 box_rect = pygame.Rect(box_x, self.box_y, self.box_width, self.box_height)
                 if box_rect.collidepoint(mouse_x, mouse_y):
-                    from .play import PlayScene
+                    from .loading import start_play
                     # Get the selected character's type
                     char_type = self.characters[i]['type']
-                    self.game.change_scene(PlayScene, character_type=char_type)
+                    start_play(self.game, character_type=char_type)
                     return
     
     def update(self, dt: float) -> None:
@@ -1,14 +1,15 @@
 import pygame
 
 from isac.core.scene import Scene
+from isac.core.fonts import get_font
 from isac.settings import WIDTH, HEIGHT, WHITE, RED, BLUE
 
 
 class GameOverScene(Scene):
     def __init__(self, game: "Game") -> None:
         super().__init__(game)
-        self.title_font = pygame.font.SysFont(None, 72)
-        self.small_font = pygame.font.SysFont(None, 28)
+        self.title_font = get_font(72)
+        self.small_font = get_font(28)
         self.blink_time = 0.0
 
         # Fade state
@@ -43,9 +44,9 @@ class GameOverScene(Scene):
                 if self._fade_dir == 0:
                     self._start_fade(out=True, duration=0.2, on_complete=lambda: self.game.change_scene(MenuScene))
             elif event.key == pygame.K_r:
-                from .play import PlayScene
+                from .loading import start_play
                 if self._fade_dir == 0:
-                    self._start_fade(out=True, duration=0.2, on_complete=lambda: self.game.change_scene(PlayScene))
+                    self._start_fade(out=True, duration=0.2, on_complete=lambda: start_play(self.game))
             elif event.key == pygame.K_ESCAPE:
                 # Fade-out antes de salir
                 if self._fade_dir == 0:
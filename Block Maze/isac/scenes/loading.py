@@ -0,0 +1,98 @@
+import time
+import pygame
+from typing import Type
+
+from isac.core.scene import Scene
+from isac.core.fonts import get_font
+from isac.core.preload import AssetPreloader, build_manifest
+from isac.core.rng import RNGService
+from isac.settings import WIDTH, HEIGHT, WHITE, BLUE, CYAN, HUGE_DUNGEON_ROOMS, RUN_SEED
+
+
+class LoadingScene(Scene):
+    """Precarga los assets del manifiesto y luego pasa a la escena indicada."""
+
+    def __init__(self, game: "Game", next_scene: Type[Scene] | None = None, **next_kwargs) -> None:
+        super().__init__(game)
+        if next_scene is None:
+            from .menu import MenuScene
+            next_scene = MenuScene
+        self.next_scene_type = next_scene
+        self.next_kwargs = next_kwargs
+        self.font = get_font(48)
+        self.small = get_font(28)
+        self.preloader = AssetPreloader(build_manifest())
+
+    def start(self) -> None:
+        self.preloader.start()
+
+    def update(self, dt: float) -> None:
+        # Convertir en el hilo principal lo que los hilos ya decodificaron
+        self.game.adopt_assets(self.preloader.drain())
+        if self.preloader.done:
+            if self.preloader.failed:
+                print(f"Assets no encontrados: {len(self.preloader.failed)}")
+            self.game.change_scene(self.next_scene_type, **self.next_kwargs)
+
+    def draw(self, surface: pygame.Surface) -> None:
+        title = self.font.render("Cargando...", True, WHITE)
+        surface.blit(title, (WIDTH // 2 - title.get_width() // 2, HEIGHT // 3))
+
+        # Barra de progreso
+        bar_w = min(480, WIDTH - 80)
+        bar_h = 18
+        x = WIDTH // 2 - bar_w // 2
+        y = HEIGHT // 2
+        pygame.draw.rect(surface, (60, 60, 60), (x, y, bar_w, bar_h), border_radius=4)
+        fill_w = int(bar_w * self.preloader.progress)
+        if fill_w > 0:
+            pygame.draw.rect(surface, CYAN, (x, y, fill_w, bar_h), border_radius=4)
+
+        count = self.small.render(f"{self.preloader.loaded}/{self.preloader.total}", True, BLUE)
+        surface.blit(count, (WIDTH // 2 - count.get_width() // 2, y + bar_h + 12))
+
+
+class DungeonLoadingScene(Scene):
+    """
+    Genera en un hilo el primer piso del calabozo enorme (HUGE_DUNGEON_ROOMS)
+    mientras muestra la pantalla de carga, y luego empieza la partida con él.
+    """
+
+    def __init__(self, game: "Game", seed: int | None = None, **play_kwargs) -> None:
+        super().__init__(game)
+        from isac.core.dungeon import Dungeon
+        # Misma semilla que calcularía PlayScene, para que la partida sea la misma
+        self.seed = RNGService(seed if seed is not None else RUN_SEED).seed
+        self.play_kwargs = play_kwargs
+        self.font = get_font(48)
+        self.small = get_font(28)
+        self.started = time.perf_counter()
+        self.build = Dungeon.build_huge(HUGE_DUNGEON_ROOMS, self.seed)
+
+    def update(self, dt: float) -> None:
+        if not self.build.done.is_set():
+            return
+        from .play import PlayScene
+        if self.build.error is not None or self.build.result is None:
+            # PlayScene lo genera de nuevo en el hilo principal
+            print(f"WARNING: no se pudo generar el calabozo en segundo plano ({self.build.error!r})")
+            self.game.change_scene(PlayScene, seed=self.seed, **self.play_kwargs)
+            return
+        self.game.change_scene(PlayScene, seed=self.seed, dungeon=self.build.result.activate(),
+                               **self.play_kwargs)
+
+    def draw(self, surface: pygame.Surface) -> None:
+        title = self.font.render("Generando calabozo...", True, WHITE)
+        surface.blit(title, (WIDTH // 2 - title.get_width() // 2, HEIGHT // 3))
+        info = self.small.render(f"{HUGE_DUNGEON_ROOMS} salas - {time.perf_counter() - self.started:.1f} s",
+                                 True, BLUE)
+        surface.blit(info, (WIDTH // 2 - info.get_width() // 2, HEIGHT // 2))
+
+
+def start_play(game: "Game", **play_kwargs) -> None:
+    """Empieza una partida; con calabozo enorme, pasando antes por DungeonLoadingScene."""
+    if HUGE_DUNGEON_ROOMS > 0:
+        game.change_scene(DungeonLoadingScene, **play_kwargs)
+    else:
+        from .play import PlayScene
+        game.change_scene(PlayScene, **play_kwargs)
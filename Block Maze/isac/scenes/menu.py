@@ -1,15 +1,16 @@
 import pygame
 
 from isac.core.scene import Scene
+from isac.core.fonts import get_font
 from isac.settings import WIDTH, HEIGHT, WHITE, BLUE
 
 
 class MenuScene(Scene):
     def __init__(self, game: "Game") -> None:
         super().__init__(game)
-        self.font = pygame.font.SysFont(None, 48)
-        self.small = pygame.font.SysFont(None, 28)
-        self.title_font = pygame.font.SysFont(None, 64)
+        self.font = get_font(48)
+        self.small = get_font(28)
+        self.title_font = get_font(64)
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
@@ -1,10 +1,18 @@
 import os
-import random
 import math
 import time
 import pygame
 
 from isac.core.scene import Scene
+from isac.core.assets import load_image
+from isac.core.audio import ensure_mixer
+from isac.core.fonts import get_font, render_text
+from isac.core.spatial import SpatialHash
+from isac.core.pool import ObjectPool
+from isac.core.render import StaticLayer, DirtyRectTracker
+from isac.core.rng import RNGService, room_random
+from isac.entities.projectiles import ProjectilePool
+from isac.entities.steering import SteeringBatch
 from isac.settings import (
     WIDTH,
     HEIGHT,
@@ -38,6 +46,14 @@ from isac.settings import (
     DIFFICULTY_PRESETS,
     DEFAULT_DIFFICULTY,
     BRUTE_CHARGE_SOUND,
+    BROADPHASE_CELL_SIZE,
+    GRAY,
+    DIRTY_RECTS_ENABLED,
+    DIRTY_RECT_PAD,
+    RUN_SEED,
+    FLOW_FIELD_ENABLED,
+    HUGE_DUNGEON_ROOMS,
+    HEADLESS,
 )
 from isac.entities.player import Player
 from isac.entities.enemy import Enemy
@@ -46,19 +62,41 @@ from isac.core.inventory import Inventory
 from isac.core.dungeon import Dungeon
 from isac.core.persistence import save_game, load_game, save_options, load_options
 from isac.core.map import MapViewer
+from isac.core.hud import Hud
 from isac.entities.arrow import Arrow
 from isac.entities.chest import Chest
 from isac.entities.speed_boots import SpeedBoots
 from isac.entities.infinite_shot import InfiniteShotPickup
 from isac.entities.companion import Companion, Spike
+from isac.entities.kill_flash import KillFlash
 from isac.entities.health_doubler import HealthDoubler
 
 
+# Saltos mayores (px por paso) se consideran teletransportes y no se interpolan
+INTERP_MAX_JUMP = 64
+
+
 class PlayScene(Scene):
-    def __init__(self, game: "Game", character_type: str = "crystal") -> None:
+    # draw() repinta toda la pantalla (o solo los rects sucios) a partir de la capa de la sala
+    clears_screen = True
+
+    def __init__(self, game: "Game", character_type: str = "crystal", seed: int | None = None,
+                 dungeon: Dungeon | None = None) -> None:
         super().__init__(game)
-        # Initialize dungeon first
-        self.dungeon = Dungeon()
+        # Semilla de la partida (None: RUN_SEED o una nueva al azar)
+        self.rng = RNGService(seed if seed is not None else RUN_SEED)
+        # Initialize dungeon first (HUGE_DUNGEON_ROOMS > 0: calabozo enorme para partidas largas;
+        # DungeonLoadingScene lo genera antes y lo pasa en ``dungeon``)
+        if dungeon is not None:
+            self.dungeon = dungeon
+        elif HUGE_DUNGEON_ROOMS > 0:
+            self.dungeon = Dungeon.huge_dungeon(HUGE_DUNGEON_ROOMS, seed=self.rng.seed)
+        else:
+            self.dungeon = Dungeon(seed=self.rng.seed)
+        # Si el piso siguiente no está listo al visitar la última sala, se espera sin
+        # bloquear (aviso en pantalla). En headless se espera en el acto: la simulación
+        # no puede depender de cuánto tarda el hilo.
+        self.dungeon.defer_floor_change = not HEADLESS
         
         # Initialize map viewer
         self.map_viewer = MapViewer(self.dungeon, cell_size=20, margin=3)
@@ -88,9 +126,15 @@ class PlayScene(Scene):
                     self.player.sprites[direction] = self.player.sprites[direction].copy()
                     self.player.sprites[direction].set_alpha(180)  # Semi-transparent
         self.enemies: list[Enemy] = []
+        # Fase ancha: índice espacial de enemigos para flechas, pinchos, bombas y melee
+        self.enemy_hash = SpatialHash(BROADPHASE_CELL_SIZE)
+        # Perseguidores en lote (solo con NumPy y salas con muchos enemigos)
+        self.steering = SteeringBatch()
+        # Proyectiles enemigos de la sala actual (un único pool para todos los tiradores)
+        self.projectiles = ProjectilePool()
         self.score = 0  # Initialize score counter
-        self.font = pygame.font.SysFont(None, 24)
-        self.big_font = pygame.font.SysFont(None, 32)
+        self.font = get_font(24)
+        self.big_font = get_font(32)
         self.inventory = Inventory(bombs=1, keys=0, arrows=0)  # Set initial arrows to 0
         self.pickups: list[Pickup] = [
             Pickup('bomb', WIDTH // 3, HEIGHT // 3),
@@ -103,6 +147,10 @@ class PlayScene(Scene):
         self._save_path = 'savegame.json'
         self._options_path = 'options.json'
         self.arrows: list[Arrow] = []
+        # Flechas, pinchos y flashes se reciclan en lugar de crearse en cada disparo
+        self.arrow_pool: ObjectPool[Arrow] = ObjectPool(Arrow)
+        self.spike_pool: ObjectPool[Spike] = ObjectPool(Spike)
+        self.kill_flash_pool: ObjectPool[KillFlash] = ObjectPool(KillFlash)
         self.door_feedback_timer: float = 0.0  # feedback visual al abrir puertas
         
         # Sistema de cofres y objetos especiales
@@ -114,22 +162,23 @@ class PlayScene(Scene):
         # Cargar sprites
         try:
             # Cargar sprite del corazón
-            self.heart_img = pygame.image.load('assets/player/corazon.png').convert_alpha()
-            self.heart_img = pygame.transform.scale(self.heart_img, (HUD_HEART_SIZE, HUD_HEART_SIZE))
+            self.heart_img = load_image('assets/player/corazon.png', (HUD_HEART_SIZE, HUD_HEART_SIZE))
+            # Copia: la superficie de la caché es compartida y aquí la oscurecemos
             self.heart_empty_img = self.heart_img.copy()
             # Hacer la imagen de corazón vacío más oscura
             self.heart_empty_img.fill((100, 100, 100, 128), special_flags=pygame.BLEND_RGBA_MULT)
             
             # Cargar sprite de la llave
-            self.key_img = pygame.image.load('assets/player/llave.png').convert_alpha()
-            # Escalar la llave para que quepa en el inventario (ajustar tamaño según sea necesario)
-            self.key_img = pygame.transform.scale(self.key_img, (24, 24))
+            # Escalada para que quepa en el inventario (ajustar tamaño según sea necesario)
+            self.key_img = load_image('assets/player/llave.png', (24, 24))
         except Exception as e:
             print(f"Error cargando sprites: {e}")
             print("Usando gráficos por defecto como respaldo.")
             self.heart_img = None
             self.heart_empty_img = None
             self.key_img = None
+        # HUD con sus widgets cacheados (solo se redibujan al cambiar vida, magia, puntos o inventario)
+        self.hud = Hud(self.font, self.heart_img, self.heart_empty_img, self.key_img)
         
         # Tracking de items obtenidos
         self.has_speed_boots = False
@@ -145,35 +194,37 @@ class PlayScene(Scene):
         self.snd_pause_open = None
         self.snd_pause_close = None
         self.snd_brute_charge = None
-        try:
-            if DOOR_OPEN_SOUND and os.path.exists(DOOR_OPEN_SOUND):
-                self.snd_door_open = pygame.mixer.Sound(DOOR_OPEN_SOUND)
-            if ARROW_HIT_SOUND and os.path.exists(ARROW_HIT_SOUND):
-                self.snd_arrow_hit = pygame.mixer.Sound(ARROW_HIT_SOUND)
-            if ENEMY_DIE_SOUND and os.path.exists(ENEMY_DIE_SOUND):
-                self.snd_enemy_die = pygame.mixer.Sound(ENEMY_DIE_SOUND)
-            if PLAYER_HURT_SOUND and os.path.exists(PLAYER_HURT_SOUND):
-                self.snd_player_hurt = pygame.mixer.Sound(PLAYER_HURT_SOUND)
-            if ARROW_SHOOT_SOUND and os.path.exists(ARROW_SHOOT_SOUND):
-                self.snd_arrow_shoot = pygame.mixer.Sound(ARROW_SHOOT_SOUND)
-            if PICKUP_SOUND and os.path.exists(PICKUP_SOUND):
-                self.snd_pickup = pygame.mixer.Sound(PICKUP_SOUND)
-            if PAUSE_OPEN_SOUND and os.path.exists(PAUSE_OPEN_SOUND):
-                self.snd_pause_open = pygame.mixer.Sound(PAUSE_OPEN_SOUND)
-            if PAUSE_CLOSE_SOUND and os.path.exists(PAUSE_CLOSE_SOUND):
-                self.snd_pause_close = pygame.mixer.Sound(PAUSE_CLOSE_SOUND)
-            if BRUTE_CHARGE_SOUND and os.path.exists(BRUTE_CHARGE_SOUND):
-                self.snd_brute_charge = pygame.mixer.Sound(BRUTE_CHARGE_SOUND)
-        except Exception:
-            self.snd_door_open = None
-            self.snd_arrow_hit = None
-            self.snd_enemy_die = None
-            self.snd_player_hurt = None
-            self.snd_arrow_shoot = None
-            self.snd_pickup = None
-            self.snd_pause_open = None
-            self.snd_pause_close = None
-            self.snd_brute_charge = None
+        # Sin mixer (modo headless o sin dispositivo de audio) el juego sigue en silencio
+        if ensure_mixer():
+            try:
+                if DOOR_OPEN_SOUND and os.path.exists(DOOR_OPEN_SOUND):
+                    self.snd_door_open = pygame.mixer.Sound(DOOR_OPEN_SOUND)
+                if ARROW_HIT_SOUND and os.path.exists(ARROW_HIT_SOUND):
+                    self.snd_arrow_hit = pygame.mixer.Sound(ARROW_HIT_SOUND)
+                if ENEMY_DIE_SOUND and os.path.exists(ENEMY_DIE_SOUND):
+                    self.snd_enemy_die = pygame.mixer.Sound(ENEMY_DIE_SOUND)
+                if PLAYER_HURT_SOUND and os.path.exists(PLAYER_HURT_SOUND):
+                    self.snd_player_hurt = pygame.mixer.Sound(PLAYER_HURT_SOUND)
+                if ARROW_SHOOT_SOUND and os.path.exists(ARROW_SHOOT_SOUND):
+                    self.snd_arrow_shoot = pygame.mixer.Sound(ARROW_SHOOT_SOUND)
+                if PICKUP_SOUND and os.path.exists(PICKUP_SOUND):
+                    self.snd_pickup = pygame.mixer.Sound(PICKUP_SOUND)
+                if PAUSE_OPEN_SOUND and os.path.exists(PAUSE_OPEN_SOUND):
+                    self.snd_pause_open = pygame.mixer.Sound(PAUSE_OPEN_SOUND)
+                if PAUSE_CLOSE_SOUND and os.path.exists(PAUSE_CLOSE_SOUND):
+                    self.snd_pause_close = pygame.mixer.Sound(PAUSE_CLOSE_SOUND)
+                if BRUTE_CHARGE_SOUND and os.path.exists(BRUTE_CHARGE_SOUND):
+                    self.snd_brute_charge = pygame.mixer.Sound(BRUTE_CHARGE_SOUND)
+            except Exception:
+                self.snd_door_open = None
+                self.snd_arrow_hit = None
+                self.snd_enemy_die = None
+                self.snd_player_hurt = None
+                self.snd_arrow_shoot = None
+                self.snd_pickup = None
+                self.snd_pause_open = None
+                self.snd_pause_close = None
+                self.snd_brute_charge = None
         # ----- Opciones (menú de pausa) -----
         self.in_options: bool = False
         self.options_items = ["Sonido", "Volumen", "Dificultad"]
@@ -216,11 +267,22 @@ class PlayScene(Scene):
         self.active_bombs = []  # Lista de bombas activas: (x, y, timer, exploded)
 
         # Flashes de muerte de enemigos (lista de tuplas: (rect, tiempo_restante))
-        self.kill_flashes: list[tuple[pygame.Rect, float]] = []
-
-    def _spawn_enemy(self, x: int, y: int) -> Enemy:
+        self.kill_flashes: list[KillFlash] = []
+
+        # Renderizado por capas: sala pre-renderizada + entidades + rects sucios
+        self.room_layer = StaticLayer((WIDTH, HEIGHT), GRAY)
+        self._room_layer_refs = None
+        self._door_sprites_missing = False
+        self.dirty = DirtyRectTracker(pygame.Rect(0, 0, WIDTH, HEIGHT))
+        self._world: pygame.Surface | None = None
+        # (rect, posición al empezar el último paso de simulación)
+        self._prev_positions: list[tuple[pygame.Rect, tuple[int, int]]] = []
+
+    def _spawn_enemy(self, x: int, y: int, rng=None) -> Enemy:
         # Elegir tipo de enemigo al azar con igual probabilidad
-        choice_key = random.choice(list(ENEMY_TYPES.keys()))
+        if rng is None:
+            rng = self.rng.stream('spawn')
+        choice_key = rng.choice(list(ENEMY_TYPES.keys()))
         cfg = ENEMY_TYPES[choice_key]
         # Aplicar escala de dificultad a HP y velocidad
         hp = int(max(1, round(cfg.get('hp', 2) * self._diff_preset.get('enemy_hp_scale', 1.0))))
@@ -240,15 +302,9 @@ class PlayScene(Scene):
         obj_rect = pygame.Rect(0, 0, width, height)
         obj_rect.center = (x, y)
         
-        # Verificar colisión con paredes
-        for wall in room.walls():
-            if obj_rect.colliderect(wall):
-                return False
-                
-        # Verificar colisión con obstáculos
-        for obstacle in room.obstacles():
-            if obj_rect.colliderect(obstacle):
-                return False
+        # Verificar colisión con paredes y obstáculos
+        if room.collision_grid().collides(obj_rect):
+            return False
         
         # Verificar colisión con puertas (solo si door es un objeto con atributo rect)
         for door in room.doors:
@@ -317,12 +373,14 @@ class PlayScene(Scene):
         if room.cleared:
             return
             
+        # Mismos items en cada visita a la sala: salen de (seed, pos)
+        rng = room_random(room.seed, 'items', room.pos)
         # Number of items to spawn (1-3)
-        num_items = random.randint(1, 3)
+        num_items = rng.randint(1, 3)
         
         for _ in range(num_items):
             # Choose item type (key: 40%, bomb: 40%, shield: 20%)
-            item_type = random.choices(
+            item_type = rng.choices(
                 ['key', 'bomb', 'magic'],
                 weights=[0.4, 0.4, 0.2],
                 k=1
@@ -331,8 +389,8 @@ class PlayScene(Scene):
             # Find a valid position for the item
             for _ in range(10):  # Try up to 10 times to find a valid position
                 # Generate random position in the room
-                x = random.randint(ROOM_PADDING + 50, WIDTH - ROOM_PADDING - 50)
-                y = random.randint(ROOM_PADDING + 50, HEIGHT - ROOM_PADDING - 50)
+                x = rng.randint(ROOM_PADDING + 50, WIDTH - ROOM_PADDING - 50)
+                y = rng.randint(ROOM_PADDING + 50, HEIGHT - ROOM_PADDING - 50)
                 
                 # Check if position is valid (not on walls, obstacles, or too close to doors)
                 if self._is_valid_pickup_position(x, y):
@@ -377,14 +435,16 @@ class PlayScene(Scene):
             gx, gy = room.pos
             rnd = (gx * 31 + gy * 17) & 3
             positions: list[tuple[int, int]] = []
+            # Cofre y enemigos dependen solo de (seed, pos), no del orden de visita
+            rng = room_random(room.seed, 'spawn', room.pos)
             
             # Generar cofre con alta probabilidad (85% de probabilidad)
-            if random.random() < 0.85:
+            if rng.random() < 0.85:
                 # Intentar varias posiciones aleatorias hasta encontrar una válida
                 max_attempts = 10
                 for _ in range(max_attempts):
-                    chest_x = WIDTH // 2 + random.randint(-120, 120)
-                    chest_y = HEIGHT // 2 + random.randint(-100, 100)
+                    chest_x = WIDTH // 2 + rng.randint(-120, 120)
+                    chest_y = HEIGHT // 2 + rng.randint(-100, 100)
                     if self._is_position_valid(chest_x, chest_y, TILE, TILE):
                         chest = Chest(chest_x, chest_y)
                         room.chests.append(chest)
@@ -402,7 +462,7 @@ class PlayScene(Scene):
                 max_enemies = 4
             
             # Ajustar el número de enemigos con un poco de aleatoriedad
-            num_enemies = random.randint(base_enemies, max_enemies)
+            num_enemies = rng.randint(base_enemies, max_enemies)
             
             # Generar posiciones distribuidas en la habitación
             positions = []
@@ -425,8 +485,8 @@ class PlayScene(Scene):
                     else: x, y = WIDTH * 2 // 3, HEIGHT * 2 // 3
                 
                 # Añadir un poco de aleatoriedad a la posición
-                x += random.randint(-50, 50)
-                y += random.randint(-50, 50)
+                x += rng.randint(-50, 50)
+                y += rng.randint(-50, 50)
                 
                 # Asegurar que esté dentro de los límites
                 x = max(100, min(WIDTH - 100, x))
@@ -437,17 +497,20 @@ class PlayScene(Scene):
                 positions.append(valid_pos)
             
             # Crear los enemigos
-            enemies = [self._spawn_enemy(px, py) for (px, py) in positions]
+            enemies = [self._spawn_enemy(px, py, rng) for (px, py) in positions]
             room.enemies = enemies
             room.spawned = True
         
         # Cargar estado persistente de la sala
         self.enemies = room.enemies.copy() if not room.cleared else []
+        self.enemy_hash.clear()
+        self.enemy_hash.sync(self.enemies)
+        self.projectiles.clear()
         self.chests = room.chests.copy()
         
         # Solo limpiar items temporales
         self.special_items.clear()
-        self.companion_spikes.clear()
+        self.spike_pool.release_all(self.companion_spikes)
         
         # Spawn random items in the room
         self._spawn_random_items(room)
@@ -616,7 +679,7 @@ class PlayScene(Scene):
             return  # No hay dirección válida para disparar
         
         # Crear la flecha
-        arrow = Arrow(
+        arrow = self.arrow_pool.acquire(
             self.player.rect.centerx, 
             self.player.rect.centery, 
             dx, 
@@ -663,128 +726,138 @@ class PlayScene(Scene):
             self.snd_pickup.play()
 
     def update(self, dt: float) -> None:
+        # Posiciones al inicio del paso, para interpolar el dibujado entre pasos fijos
+        self._prev_positions = [(self.player.rect, self.player.rect.topleft)]
+        self._prev_positions.extend((e.rect, e.rect.topleft) for e in self.enemies)
+        if self.dungeon.floor_pending:
+            # El piso siguiente aún se está generando: la partida espera con el aviso en pantalla
+            if not self.dungeon.poll_floor_change():
+                return
+            self._enter_room()
         if self.paused:
             return
-        keys = pygame.key.get_pressed()
-        self.player.update(dt, [], [])
-
-        # Reducir cooldown de puerta
-        if self._door_cooldown > 0:
-            self._door_cooldown = max(0.0, self._door_cooldown - dt)
-
-        # Escudo con K (mantener). Consume magia mientras esté activo
-        if keys[pygame.K_k] and self.player.magic > 0:
-            self.player.shield = True
-            self.player.magic = max(0.0, self.player.magic - SHIELD_MAGIC_COST_PER_SEC * dt)
-        else:
-            self.player.shield = False
+        prof = self.game.profiler
+        with prof.phase('player'):
+            keys = pygame.key.get_pressed()
+            self.player.update(dt, [], [])
+
+            # Reducir cooldown de puerta
+            if self._door_cooldown > 0:
+                self._door_cooldown = max(0.0, self._door_cooldown - dt)
+
+            # Escudo con K (mantener). Consume magia mientras esté activo
+            if keys[pygame.K_k] and self.player.magic > 0:
+                self.player.shield = True
+                self.player.magic = max(0.0, self.player.magic - SHIELD_MAGIC_COST_PER_SEC * dt)
+            else:
+                self.player.shield = False
 
-        # Colisiones con paredes de la sala
-        room = self.dungeon.get_room()
-        for wall in room.walls():
-            if self.player.rect.colliderect(wall):
-                self.player.revert_position()
-                break
-        # Colisiones con obstáculos internos
-        for obs in room.obstacles():
-            if self.player.rect.colliderect(obs):
+            # Colisiones con paredes y obstáculos de la sala (rejilla de colisión)
+            room = self.dungeon.get_room()
+            grid = room.collision_grid()
+            if grid.collides(self.player.rect):
                 self.player.revert_position()
-                break
 
-        # Recoger objetos automáticamente al pasar encima
-        self.try_pickup()
+        with prof.phase('pickups'):
+            # Recoger objetos automáticamente al pasar encima
+            self.try_pickup()
         
-        # Intentar abrir cofres automáticamente al acercarse
-        self.try_open_chest()
+            # Intentar abrir cofres automáticamente al acercarse
+            self.try_open_chest()
 
-        # Intentar disparar si el jugador está manteniendo el botón
-        if self.player.wants_to_shoot:
-            self._try_shoot()
+        with prof.phase('arrows'):
+            # Intentar disparar si el jugador está manteniendo el botón
+            if self.player.wants_to_shoot:
+                self._try_shoot()
+
+            # Fase ancha: índice de enemigos al día (incremental, solo re-indexa los que cambian de celda)
+            enemy_hash = self.enemy_hash
+            enemy_hash.sync(self.enemies)
             
-        # Actualizar flechas y colisiones
-        for a in self.arrows:
-            a.update(dt)
-            # Colisión con paredes
-            for wall in room.walls():
-                if a.rect().colliderect(wall):
+            # Actualizar flechas y colisiones
+            for a in self.arrows:
+                a.update(dt)
+                arrow_rect = a.rect()
+                # Colisión con paredes
+                if grid.hits_wall(arrow_rect):
                     a.alive = False
-                    break
-            if not a.alive:
-                continue
-            # Colisión con obstáculos internos
-            for obs in room.obstacles():
-                if a.rect().colliderect(obs):
+                    continue
+                # Colisión con obstáculos internos
+                if grid.hits_obstacle(arrow_rect):
                     a.alive = False
                     if self.snd_arrow_hit:
                         self.snd_arrow_hit.play()
-                    break
-            if not a.alive:
-                continue
-            # Colisión con enemigos
-            for e in self.enemies[:]:
-                if e.alive and e.rect.colliderect(a.rect()):
-                    # Si es un BIG SHOT, matar al enemigo instantáneamente
-                    if hasattr(a, 'arrow_type') and a.arrow_type == 'big_shot':
-                        e.hp = 0  # Matar al instante
-                        e.alive = False
-                        print("¡BIG SHOT eliminó al enemigo al instante!")
-                    else:
-                        # Daño normal para flechas estándar, aplicando el multiplicador
-                        died, points = e.take_damage(a.get_damage())
-                        if died:
-                            self.score += points
-                    if self.snd_arrow_hit:
-                        self.snd_arrow_hit.play()
-                    a.alive = False
-                    break
-            # Fuera de pantalla
-            if a.alive and (a.x < 0 or a.x > WIDTH or a.y < 0 or a.y > HEIGHT):
-                a.alive = False
-        self.arrows = [a for a in self.arrows if a.alive]
-
-        # Actualizar bombas
-        for bomb in self.active_bombs[:]:
-            if not bomb['exploded']:
-                # Contar hacia atrás el temporizador
-                bomb['timer'] -= dt
-                if bomb['timer'] <= 0:
-                    # La bomba explota
-                    bomb['exploded'] = True
-                    bomb['timer'] = 0.3  # Tiempo que dura la explosión
-                    
-                    # Dañar enemigos en el radio de la explosión
-                    boom_rect = pygame.Rect(
-                        bomb['x'] - 80,  # Radio de 80 píxeles
-                        bomb['y'] - 80,
-                        160,
-                        160
-                    )
-                    for e in self.enemies:
-                        if e.alive and boom_rect.colliderect(e.rect):
-                            died, points = e.take_damage(BOMB_DAMAGE)
+                    continue
+                # Colisión con enemigos (solo los candidatos de la fase ancha)
+                for e in enemy_hash.query(arrow_rect):
+                    if e.alive and e.rect.colliderect(arrow_rect):
+                        # Si es un BIG SHOT, matar al enemigo instantáneamente
+                        if hasattr(a, 'arrow_type') and a.arrow_type == 'big_shot':
+                            e.hp = 0  # Matar al instante
+                            e.alive = False
+                        else:
+                            # Daño normal para flechas estándar, aplicando el multiplicador
+                            died, points = e.take_damage(a.get_damage())
                             if died:
                                 self.score += points
-                                if self.snd_enemy_die:
-                                    self.snd_enemy_die.play()
-                                self.shake_time = max(self.shake_time, 0.15)
-                                self.shake_intensity = max(self.shake_intensity, 4)
-                                self._on_enemy_killed(e)
-            else:
-                # La explosión está activa, contar hacia atrás
-                bomb['timer'] -= dt
-                if bomb['timer'] <= 0:
-                    self.active_bombs.remove(bomb)
-
-        # Transición por puertas abiertas
-        self.handle_doors_transition()
-
-        # Actualizar enemigos
-        room = self.dungeon.get_room()
-        for e in self.enemies:
-            prev_charge_flag = getattr(e, 'charge_just_started', False)
-            # Actualizar enemigo y verificar si sus proyectiles golpearon al jugador
-            damage = e.update(self.player.rect, dt, room.walls(), room.obstacles())
-            # Si el enemigo es un sniper y su proyectil golpeó al jugador
+                        if self.snd_arrow_hit:
+                            self.snd_arrow_hit.play()
+                        a.alive = False
+                        break
+                # Fuera de pantalla
+                if a.alive and (a.x < 0 or a.x > WIDTH or a.y < 0 or a.y > HEIGHT):
+                    a.alive = False
+            self.arrow_pool.collect(self.arrows)
+
+        with prof.phase('bombs'):
+            # Actualizar bombas
+            for bomb in self.active_bombs[:]:
+                if not bomb['exploded']:
+                    # Contar hacia atrás el temporizador
+                    bomb['timer'] -= dt
+                    if bomb['timer'] <= 0:
+                        # La bomba explota
+                        bomb['exploded'] = True
+                        bomb['timer'] = 0.3  # Tiempo que dura la explosión
+                    
+                        # Dañar enemigos en el radio de la explosión
+                        boom_rect = pygame.Rect(
+                            bomb['x'] - 80,  # Radio de 80 píxeles
+                            bomb['y'] - 80,
+                            160,
+                            160
+                        )
+                        for e in enemy_hash.query(boom_rect):
+                            if e.alive and boom_rect.colliderect(e.rect):
+                                died, points = e.take_damage(BOMB_DAMAGE)
+                                if died:
+                                    self.score += points
+                                    if self.snd_enemy_die:
+                                        self.snd_enemy_die.play()
+                                    self.shake_time = max(self.shake_time, 0.15)
+                                    self.shake_intensity = max(self.shake_intensity, 4)
+                                    self._on_enemy_killed(e)
+                else:
+                    # La explosión está activa, contar hacia atrás
+                    bomb['timer'] -= dt
+                    if bomb['timer'] <= 0:
+                        self.active_bombs.remove(bomb)
+
+        with prof.phase('doors'):
+            # Transición por puertas abiertas
+            self.handle_doors_transition()
+
+        with prof.phase('enemies'):
+            # Actualizar enemigos
+            room = self.dungeon.get_room()
+            grid = room.collision_grid()
+            # Campo de flujo hacia el jugador: solo se recalcula cuando cambia de celda
+            flow = None
+            if FLOW_FIELD_ENABLED and self.enemies:
+                flow = room.flow_field()
+                flow.update(self.player.rect.centerx, self.player.rect.centery)
+            # Proyectiles de sniper/monster: una sola pasada para toda la sala
+            damage = self.projectiles.update(dt, self.player.rect)
             if damage and self.player.invuln <= 0 and not self.player.shield:
                 self.player.take_damage(damage)
                 if self.snd_player_hurt:
@@ -792,41 +865,55 @@ class PlayScene(Scene):
                 # temblor más fuerte al recibir daño
                 self.shake_time = max(self.shake_time, 0.25)
                 self.shake_intensity = max(self.shake_intensity, 6)
+            charged = []
+            batch = self.steering.select(self.enemies)
+            if batch:
+                charged = self.steering.update(batch, self.player.rect, dt, grid, flow)
+            for e in self.enemies:
+                if batch and self.steering.handles(e):
+                    continue
+                prev_charge_flag = getattr(e, 'charge_just_started', False)
+                e.update(self.player.rect, dt, grid=grid, projectiles=self.projectiles, flow=flow)
+                if e.kind == 'brute' and not prev_charge_flag and getattr(e, 'charge_just_started', False):
+                    charged.append(e)
             # SFX: inicio de carga del brute
-            elif e.kind == 'brute' and not prev_charge_flag and getattr(e, 'charge_just_started', False):
+            for _ in charged:
                 try:
                     if self.snd_brute_charge:
                         self.snd_brute_charge.play()
                 except Exception:
                     pass
-
-        # Daño a enemigos con melee
-        hit = self.player.melee_hitbox()
-        if hit:
-            for e in self.enemies:
-                if e.alive and hit.colliderect(e.rect):
-                    died, points = e.take_damage(MELEE_DAMAGE)
-                    if died:
-                        self.score += points
-                        if self.snd_enemy_die:
-                            self.snd_enemy_die.play()
-                        self.shake_time = max(self.shake_time, 0.15)
-                        self.shake_intensity = max(self.shake_intensity, 4)
-                        self._on_enemy_killed(e)
-
-        self.enemies = [e for e in self.enemies if e.alive]
-
-        # Daño al jugador por contacto con enemigos (si no hay escudo e invuln == 0)
-        if self.player.invuln <= 0 and not self.player.shield:
-            for e in self.enemies:
-                if e.alive and self.player.rect.colliderect(e.rect):
-                    self.player.take_damage(1)
-                    if self.snd_player_hurt:
-                        self.snd_player_hurt.play()
-                    # temblor más fuerte al recibir daño
-                    self.shake_time = max(self.shake_time, 0.25)
-                    self.shake_intensity = max(self.shake_intensity, 6)
-                    break
+            # Los enemigos se movieron: re-indexar los que cambiaron de celda
+            enemy_hash.sync(self.enemies)
+
+        with prof.phase('melee'):
+            # Daño a enemigos con melee
+            hit = self.player.melee_hitbox()
+            if hit:
+                for e in enemy_hash.query(hit):
+                    if e.alive and hit.colliderect(e.rect):
+                        died, points = e.take_damage(MELEE_DAMAGE)
+                        if died:
+                            self.score += points
+                            if self.snd_enemy_die:
+                                self.snd_enemy_die.play()
+                            self.shake_time = max(self.shake_time, 0.15)
+                            self.shake_intensity = max(self.shake_intensity, 4)
+                            self._on_enemy_killed(e)
+
+            self.enemies = [e for e in self.enemies if e.alive]
+
+            # Daño al jugador por contacto con enemigos (si no hay escudo e invuln == 0)
+            if self.player.invuln <= 0 and not self.player.shield:
+                for e in enemy_hash.query(self.player.rect):
+                    if e.alive and self.player.rect.colliderect(e.rect):
+                        self.player.take_damage(1)
+                        if self.snd_player_hurt:
+                            self.snd_player_hurt.play()
+                        # temblor más fuerte al recibir daño
+                        self.shake_time = max(self.shake_time, 0.25)
+                        self.shake_intensity = max(self.shake_intensity, 6)
+                        break
 
         # Muerte del jugador -> Game Over
         if self.player.hp <= 0:
@@ -874,57 +961,60 @@ class PlayScene(Scene):
 
         # Actualizar flashes
         if self.kill_flashes:
-            updated: list[tuple[pygame.Rect, float]] = []
-            for r, t in self.kill_flashes:
-                nt = max(0.0, t - dt)
-                if nt > 0:
-                    updated.append((r, nt))
-            self.kill_flashes = updated
+            for flash in self.kill_flashes:
+                flash.update(dt)
+            self.kill_flash_pool.collect(self.kill_flashes)
 
         # Actualizar cofres
         for chest in self.chests:
             chest.update(dt)
 
-        # Actualizar items especiales
-        for item in self.special_items:
-            if hasattr(item, 'update'):
-                if isinstance(item, Companion):
-                    item.update(dt, self.player.rect)
-                else:
-                    item.update(dt)
-
-        # Actualizar compañero y sus pinchos
-        if self.active_companion and self.active_companion.active:
-            # El compañero busca enemigos y dispara desde su posición junto al jugador
-            target_enemy = self.active_companion.find_nearest_enemy(self.enemies)
-            if target_enemy:
-                spikes = self.active_companion.shoot_at_enemy(target_enemy.rect)
-                if spikes:
-                    self.companion_spikes.extend(spikes)
-        elif self.active_companion and not self.active_companion.active:
-            # Remover compañero cuando se acaba el tiempo
-            if self.active_companion in self.special_items:
-                self.special_items.remove(self.active_companion)
-            self.active_companion = None
-            self.has_companion = False
-
-        # Actualizar pinchos del compañero
-        for spike in self.companion_spikes:
-            spike.update(dt)
-            # Colisión con enemigos
-            for enemy in self.enemies:
-                if enemy.alive and spike.alive and spike.rect().colliderect(enemy.rect):
-                    died, points = enemy.take_damage(spike.damage)
-                    if died:
-                        self.score += points
-                        if self.snd_enemy_die:
-                            self.snd_enemy_die.play()
-                        self._on_enemy_killed(enemy)
-                    spike.alive = False
-                    break
-
-        # Limpiar pinchos muertos
-        self.companion_spikes = [s for s in self.companion_spikes if s.alive]
+        with prof.phase('companion'):
+            # Actualizar items especiales
+            for item in self.special_items:
+                if hasattr(item, 'update'):
+                    if isinstance(item, Companion):
+                        item.update(dt, self.player.rect)
+                    else:
+                        item.update(dt)
+
+            # Actualizar compañero y sus pinchos
+            if self.active_companion and self.active_companion.active:
+                # El compañero busca enemigos y dispara desde su posición junto al jugador
+                companion = self.active_companion
+                detection = companion.rect.inflate(companion.detection_range * 2, companion.detection_range * 2)
+                target_enemy = companion.find_nearest_enemy(enemy_hash.query(detection))
+                if target_enemy:
+                    spikes = self.active_companion.shoot_at_enemy(target_enemy.rect, self.spike_pool)
+                    if spikes:
+                        self.companion_spikes.extend(spikes)
+            elif self.active_companion and not self.active_companion.active:
+                # Remover compañero cuando se acaba el tiempo
+                if self.active_companion in self.special_items:
+                    self.special_items.remove(self.active_companion)
+                self.active_companion = None
+                self.has_companion = False
+
+            # Actualizar pinchos del compañero
+            for spike in self.companion_spikes:
+                spike.update(dt)
+                if not spike.alive:
+                    continue
+                # Colisión con enemigos (candidatos de la fase ancha)
+                spike_rect = spike.rect()
+                for enemy in enemy_hash.query(spike_rect):
+                    if enemy.alive and spike.alive and spike_rect.colliderect(enemy.rect):
+                        died, points = enemy.take_damage(spike.damage)
+                        if died:
+                            self.score += points
+                            if self.snd_enemy_die:
+                                self.snd_enemy_die.play()
+                            self._on_enemy_killed(enemy)
+                        spike.alive = False
+                        break
+
+            # Limpiar pinchos muertos
+            self.spike_pool.collect(self.companion_spikes)
 
     def _activate_pause_option(self) -> None:
         if not self.in_options:
@@ -975,123 +1065,224 @@ class PlayScene(Scene):
                     pass
 
     def draw(self, surface: pygame.Surface) -> None:
+        # Dibujar jugador y enemigos entre su posición anterior y la actual
+        restore = self._apply_interpolation(self.interpolation)
+        try:
+            self._draw_frame(surface)
+        finally:
+            for rect, pos in restore:
+                rect.topleft = pos
+
+    def _apply_interpolation(self, alpha: float) -> list[tuple[pygame.Rect, tuple[int, int]]]:
+        """Mueve los rects a la posición interpolada y devuelve sus posiciones reales."""
+        restore = []
+        if alpha >= 1.0:
+            return restore
+        for rect, (px, py) in self._prev_positions:
+            x, y = rect.topleft
+            if (x, y) == (px, py) or abs(x - px) > INTERP_MAX_JUMP or abs(y - py) > INTERP_MAX_JUMP:
+                # Quieto o teletransportado (cambio de sala): no interpolar
+                continue
+            restore.append((rect, (x, y)))
+            rect.topleft = (round(px + (x - px) * alpha), round(py + (y - py) * alpha))
+        return restore
+
+    def _draw_frame(self, surface: pygame.Surface) -> None:
         # Calcular offset de shake
         ox = oy = 0
-        if self.shake_time > 0 and self.shake_intensity > 0:
-            ox = random.randint(-self.shake_intensity, self.shake_intensity)
-            oy = random.randint(-self.shake_intensity, self.shake_intensity)
+        shaking = self.shake_time > 0 and self.shake_intensity > 0
+        if shaking:
+            fx = self.rng.stream('fx')
+            ox = fx.randint(-self.shake_intensity, self.shake_intensity)
+            oy = fx.randint(-self.shake_intensity, self.shake_intensity)
+        overlay = self.paused or self._fade_dir != 0 or self._fade_alpha > 0 or self.dungeon.floor_pending
+
+        # Fondo, paredes, obstáculos y puertas: pre-renderizados hasta que cambie la sala o sus puertas
+        layer, rebuilt = self.room_layer.get(self._room_layer_key(), self.draw_room)
+        # El mapa no se restaura entre frames: si aparece, desaparece o se mueve, frame completo
+        map_moved = self.map_viewer.placement(surface) != self.map_viewer.rect
+        full = shaking or rebuilt or map_moved or not DIRTY_RECTS_ENABLED or not self.dirty.can_skip_full()
+        # Lo restaurado desde la capa este frame (puede tapar parte del mapa)
+        restored = [] if full else list(self.dirty.previous)
+
+        if shaking:
+            # Con shake el mundo entero se desplaza: componer aparte y volcar con offset
+            if self._world is None:
+                self._world = pygame.Surface((WIDTH, HEIGHT)).convert()
+            world = self._world
+            world.blit(layer, (0, 0))
+        else:
+            world = surface
+            if full:
+                surface.blit(layer, (0, 0))
+            else:
+                # Solo restaurar lo que se pintó encima en el frame anterior
+                self.dirty.restore(surface, layer)
 
-        # Dibujar mundo en superficie temporal y aplicar offset
-        world = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        # Fondo de sala simple y paredes/puertas
-        self.draw_room(world)
+        drawn = self._draw_entities(world)
+
+        if shaking:
+            surface.fill(GRAY)
+            surface.blit(world, (ox, oy))
+
+        # HUD de corazones y magia; ui junta los rects que se dibujan encima del mundo
+        ui = self.draw_hud(surface)
+        
+        # Draw map (on top of everything). Si no cambió, solo se vuelve a volcar
+        # donde se restauró o se pintó algo encima; esos rects no se restauran luego.
+        map_rects = self.map_viewer.draw(surface, None if full else restored + drawn + ui)
+
+        # Slots de inventario (sin shake)
+        ui.append(self.draw_inventory_slots(surface))
+
+        # El texto del inventario ha sido eliminado para una interfaz más limpia
+
+        # Indicador de escudo
+        if self.player.shield:
+            txt = render_text(self.font, "[ESCUDO]", CYAN)
+            ui.append(surface.blit(txt, (WIDTH - 120, 10)))
+
+        # Indicador visual de puertas abiertas
+        if self.door_feedback_timer > 0:
+            alpha = int(200 * self.door_feedback_timer)
+            msg = render_text(self.big_font, "¡Puertas abiertas!", GREEN)
+            # Crear una superficie con alpha para desvanecer
+            surf = pygame.Surface(msg.get_size(), pygame.SRCALPHA)
+            surf.fill((0, 0, 0, 0))
+            # Pintar el texto en la superficie con alpha manual aplicando multiplicación
+            surf.blit(msg, (0, 0))
+            # Dibujar una banda translúcida detrás
+            band_w = msg.get_width() + 24
+            band_h = msg.get_height() + 10
+            band = pygame.Surface((band_w, band_h), pygame.SRCALPHA)
+            band.fill((30, 120, 60, max(0, alpha // 2)))
+            bx = WIDTH // 2 - band_w // 2
+            by = 80
+            ui.append(surface.blit(band, (bx, by)))
+            ui.append(surface.blit(surf, (WIDTH // 2 - msg.get_width() // 2, by + (band_h - msg.get_height()) // 2)))
+
+        # Piso siguiente generándose
+        if self.dungeon.floor_pending:
+            msg = render_text(self.big_font, f"Generando el piso {self.dungeon.floor + 2}...", WHITE)
+            ui.append(surface.blit(msg, (WIDTH // 2 - msg.get_width() // 2, HEIGHT // 2 - msg.get_height() // 2)))
+
+        # Indicador de pausa
+        if self.paused:
+            self.draw_pause_menu(surface)
+
+        # Overlay de fade
+        if self._fade_dir != 0 or self._fade_alpha > 0:
+            alpha = int(self._fade_alpha)
+            if alpha > 0:
+                overlay = pygame.Surface((WIDTH, HEIGHT))
+                overlay.set_alpha(alpha)
+                overlay.fill((0, 0, 0))
+                surface.blit(overlay, (0, 0))
+
+        drawn.extend(ui)
+        self.dirty.end_frame(drawn, full=full or overlay, clean=not (shaking or overlay), kept=map_rects)
+
+    def dirty_rects(self) -> list[pygame.Rect] | None:
+        if not DIRTY_RECTS_ENABLED:
+            return None
+        return self.dirty.update_rects()
+
+    def invalidate_screen(self) -> None:
+        self.dirty.invalidate()
+
+    def _room_layer_key(self) -> tuple:
+        """Todo lo que cambia el aspecto de la capa estática de la sala."""
+        room = self.dungeon.get_room()
+        doors = tuple((room.doors[d].exists, room.doors[d].open, room.doors[d].locked)
+                      for d in ('up', 'down', 'left', 'right'))
+        # Solo el dibujo de respaldo de las puertas parpadea con door_feedback_timer
+        feedback = round(self.door_feedback_timer, 1) if self._door_sprites_missing else 0
+        # Mantener vivos sala y obstáculos para que sus id() no se reutilicen
+        self._room_layer_refs = (room, room.obstacles())
+        return (id(room), id(self._room_layer_refs[1]), doors, feedback)
+
+    @staticmethod
+    def _padded(rect: pygame.Rect) -> pygame.Rect:
+        """Rect de una entidad más margen para sprites, brillos y animaciones."""
+        return rect.inflate(rect.width + 2 * DIRTY_RECT_PAD, rect.height + 2 * DIRTY_RECT_PAD)
+
+    def _draw_entities(self, world: pygame.Surface) -> list[pygame.Rect]:
+        """Dibuja todo lo dinámico sobre la capa de la sala y devuelve las zonas pintadas."""
+        drawn: list[pygame.Rect] = []
+
+        # Dibujar enemigos y sus proyectiles
+        for e in self.enemies:
+            e.draw(world)
+            drawn.append(e.rect.inflate(DIRTY_RECT_PAD, DIRTY_RECT_PAD))
+        self.projectiles.draw(world)
+        drawn.extend(self.projectiles.bounds())
 
         # Dibujar bombas
         for bomb in self.active_bombs:
             if not bomb['exploded']:
                 # Dibujar sprite de la bomba
                 try:
-                    bomb_img = pygame.image.load('assets/player/bomba.png').convert_alpha()
+                    bomb_img = load_image('assets/player/bomba.png')
                     bomb_rect = bomb_img.get_rect(center=(int(bomb['x']), int(bomb['y'])))
-                    world.blit(bomb_img, bomb_rect)
+                    drawn.append(world.blit(bomb_img, bomb_rect))
                 except:
                     # Fallback: dibujar un círculo rojo si no se puede cargar la imagen
-                    pygame.draw.circle(world, (255, 0, 0), (int(bomb['x']), int(bomb['y'])), 10)
+                    drawn.append(pygame.draw.circle(world, (255, 0, 0), (int(bomb['x']), int(bomb['y'])), 10))
             else:
                 # Dibujar explosión
                 radius = int(80 * (1 + (0.3 - bomb['timer']) * 2))  # La explosión crece con el tiempo
                 s = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
                 pygame.draw.circle(s, (255, 200, 0, 128), (radius, radius), radius)
-                world.blit(s, (int(bomb['x']) - radius, int(bomb['y']) - radius))
+                drawn.append(world.blit(s, (int(bomb['x']) - radius, int(bomb['y']) - radius)))
         
         # Dibujar flechas
         for a in self.arrows:
             a.draw(world)
-
-        # Dibujar enemigos
-        for e in self.enemies:
-            e.draw(surface)  
-            e.draw(surface)  # Changed from world to surface to match the method signature
+            drawn.append(a.bounds())
 
         # Dibujar flashes de muerte sobre el mundo
-        for r, t in self.kill_flashes:
+        for kf in self.kill_flashes:
+            r, t = kf.rect, kf.time
             alpha = int(220 * (t / 0.15))
             flash = pygame.Surface((r.width, r.height), pygame.SRCALPHA)
             flash.fill((255, 255, 255, max(0, alpha)))
-            world.blit(flash, (r.x, r.y))
+            drawn.append(world.blit(flash, (r.x, r.y)))
 
         # Dibujar jugador (parpadeo si invulnerable)
         if int(self.player.invuln * 10) % 2 == 0:
             self.player.draw(world)
+        player_bounds = self._padded(self.player.rect)
+        if self.player.current_sprite is not None:
+            player_bounds.union_ip(pygame.Rect(self.player.rect.topleft, self.player.current_sprite.get_size()))
+        drawn.append(player_bounds)
 
         # Dibujar pickups
         for p in self.pickups:
             p.draw(world)
+            drawn.append(self._padded(p.rect()))
 
         # Dibujar cofres
         for chest in self.chests:
             chest.draw(world)
+            drawn.append(self._padded(chest.rect))
 
         # Dibujar items especiales
         for item in self.special_items:
             if hasattr(item, 'draw'):
                 item.draw(world)
+                bounds = self._padded(item.rect)
+                if isinstance(item, Companion):
+                    # Círculo de rango de detección
+                    bounds.union_ip(item.rect.inflate(item.detection_range * 2, item.detection_range * 2))
+                drawn.append(bounds)
 
         # Dibujar pinchos del compañero
         for spike in self.companion_spikes:
             if hasattr(spike, 'draw'):
                 spike.draw(world)
+                drawn.append(spike.bounds())
 
-        # Blit del mundo con shake
-        surface.blit(world, (ox, oy))
-
-        # HUD de corazones y magia        # Draw HUD
-        self.draw_hud(surface)
-        
-        # Draw map (on top of everything)
-        self.map_viewer.draw(surface)
-
-        # Slots de inventario (sin shake)
-        self.draw_inventory_slots(surface)
-
-        # El texto del inventario ha sido eliminado para una interfaz más limpia
-
-        # Indicador de escudo
-        if self.player.shield:
-            txt = self.font.render("[ESCUDO]", True, CYAN)
-            surface.blit(txt, (WIDTH - 120, 10))
-
-        # Indicador visual de puertas abiertas
-        if self.door_feedback_timer > 0:
-            alpha = int(200 * self.door_feedback_timer)
-            msg = self.big_font.render("¡Puertas abiertas!", True, GREEN)
-            # Crear una superficie con alpha para desvanecer
-            surf = pygame.Surface(msg.get_size(), pygame.SRCALPHA)
-            surf.fill((0, 0, 0, 0))
-            # Pintar el texto en la superficie con alpha manual aplicando multiplicación
-            surf.blit(msg, (0, 0))
-            # Dibujar una banda translúcida detrás
-            band_w = msg.get_width() + 24
-            band_h = msg.get_height() + 10
-            band = pygame.Surface((band_w, band_h), pygame.SRCALPHA)
-            band.fill((30, 120, 60, max(0, alpha // 2)))
-            bx = WIDTH // 2 - band_w // 2
-            by = 80
-            surface.blit(band, (bx, by))
-            surface.blit(surf, (WIDTH // 2 - msg.get_width() // 2, by + (band_h - msg.get_height()) // 2))
-
-        # Indicador de pausa
-        if self.paused:
-            self.draw_pause_menu(surface)
-
-        # Overlay de fade
-        if self._fade_dir != 0 or self._fade_alpha > 0:
-            alpha = int(self._fade_alpha)
-            if alpha > 0:
-                overlay = pygame.Surface((WIDTH, HEIGHT))
-                overlay.set_alpha(alpha)
-                overlay.fill((0, 0, 0))
-                surface.blit(overlay, (0, 0))
+        return drawn
 
     # ---- Fade helpers ----
     def _start_fade(self, out: bool, duration: float, on_complete=None) -> None:
@@ -1144,36 +1335,9 @@ class PlayScene(Scene):
             # Establecer un cooldown breve para no reactivar puerta de inmediato
             self._door_cooldown = 0.25
 
-    def draw_hud(self, surface: pygame.Surface) -> None:
-        # Corazones (enteros)
-        for i in range(self.player.max_hp):
-            x = 10 + i * (HUD_HEART_SIZE + 4)
-            y = 10
-            if self.heart_img is not None:
-                # Usar sprite de corazón si está disponible
-                if i < self.player.hp:
-                    surface.blit(self.heart_img, (x, y))
-                else:
-                    surface.blit(self.heart_empty_img, (x, y))
-            else:
-                # Fallback a rectángulos si no hay sprite
-                color = RED if i < self.player.hp else (60, 60, 60)
-                pygame.draw.rect(surface, color, (x, y, HUD_HEART_SIZE, HUD_HEART_SIZE), border_radius=4)
-        # Barra de magia
-        bar_w = 160
-        bar_h = 10
-        x = 10
-        y = 10 + HUD_HEART_SIZE + 6
-        pygame.draw.rect(surface, (60, 60, 60), (x, y, bar_w, bar_h), border_radius=3)
-        fill_w = int(bar_w * (self.player.magic / MAGIC_MAX))
-        pygame.draw.rect(surface, CYAN, (x, y, fill_w, bar_h), border_radius=3)
-        # Valor numérico de magia
-        mp_text = self.font.render(f"MP {int(self.player.magic)}/{int(MAGIC_MAX)}", True, WHITE)
-        surface.blit(mp_text, (x + bar_w + 8, y - 2))
-        
-        # Mostrar puntuación
-        score_text = self.font.render(f"Puntos: {self.score}", True, WHITE)
-        surface.blit(score_text, (WIDTH - score_text.get_width() - 10, 10))
+    def draw_hud(self, surface: pygame.Surface) -> list[pygame.Rect]:
+        # Corazones (o barra de vida), magia y puntuación; devuelve los rects dibujados
+        return self.hud.draw_status(surface, self.player, self.score)
 
     def draw_pause_menu(self, surface: pygame.Surface) -> None:
         # Fondo translúcido
@@ -1181,22 +1345,22 @@ class PlayScene(Scene):
         overlay.fill((0, 0, 0, 140))
         surface.blit(overlay, (0, 0))
         if not self.in_options:
-            title = self.big_font.render("PAUSA", True, YELLOW)
+            title = render_text(self.big_font, "PAUSA", YELLOW)
             surface.blit(title, (WIDTH // 2 - title.get_width() // 2, 120))
             # Menú principal
             base_y = 170
             # Mostramos también hint para abrir opciones con "O"
-            hint = self.font.render("O: Opciones  |  Enter: Seleccionar", True, WHITE)
+            hint = render_text(self.font, "O: Opciones  |  Enter: Seleccionar", WHITE)
             surface.blit(hint, (WIDTH // 2 - hint.get_width() // 2, 150))
             for i, opt in enumerate(self.pause_options):
                 color = WHITE if i != self.pause_index else GREEN
-                txt = self.big_font.render(opt, True, color)
+                txt = render_text(self.big_font, opt, color)
                 surface.blit(txt, (WIDTH // 2 - txt.get_width() // 2, base_y + i * 36))
             # Botón ficticio Opciones al final
-            opt_label = self.big_font.render("Opciones (O)", True, WHITE)
+            opt_label = render_text(self.big_font, "Opciones (O)", WHITE)
             surface.blit(opt_label, (WIDTH // 2 - opt_label.get_width() // 2, base_y + len(self.pause_options) * 36 + 12))
         else:
-            title = self.big_font.render("OPCIONES", True, YELLOW)
+            title = render_text(self.big_font, "OPCIONES", YELLOW)
             surface.blit(title, (WIDTH // 2 - title.get_width() // 2, 120))
             base_y = 170
             # Elementos de opciones
@@ -1210,9 +1374,9 @@ class PlayScene(Scene):
                     val = self.difficulty
                 else:
                     val = ""
-                label = self.big_font.render(f"{opt}: {val}", True, color)
+                label = render_text(self.big_font, f"{opt}: {val}", color)
                 surface.blit(label, (WIDTH // 2 - label.get_width() // 2, base_y + i * 36))
-            hint = self.font.render("Esc: Volver | ←/→: Ajustar | Enter: Alternar", True, WHITE)
+            hint = render_text(self.font, "Esc: Volver | ←/→: Ajustar | Enter: Alternar", WHITE)
             surface.blit(hint, (WIDTH // 2 - hint.get_width() // 2, base_y + len(self.options_items) * 36 + 12))
 
     def _options_adjust(self, direction: int) -> None:
@@ -1287,15 +1451,9 @@ class PlayScene(Scene):
         # Obtener la sala actual
         room = self.dungeon.get_room()
         
-        # Verificar colisión con paredes
-        for wall in room.walls():
-            if pickup_rect.colliderect(wall):
-                return False
-                
-        # Verificar colisión con obstáculos
-        for obstacle in room.obstacles():
-            if pickup_rect.colliderect(obstacle):
-                return False
+        # Verificar colisión con paredes y obstáculos
+        if room.collision_grid().collides(pickup_rect):
+            return False
                 
         # Verificar colisión con otros pickups
         for pickup in self.pickups:
@@ -1327,11 +1485,12 @@ class PlayScene(Scene):
         # Aumentar puntuación por matar enemigo
         self.score += 100
         # Probabilidad configurada de botín
-        if random.random() < self._loot_chance:
+        loot = self.rng.stream('loot')
+        if loot.random() < self._loot_chance:
             # 75% de probabilidad de soltar un ítem
-            if random.random() < 0.75:
+            if loot.random() < 0.75:
                 # Distribución de probabilidad: 50% bombas, 50% llaves
-                rand_val = random.random()
+                rand_val = loot.random()
                 if rand_val < 0.5:
                     kind = 'bomb'
                 else:
@@ -1342,7 +1501,7 @@ class PlayScene(Scene):
                 if valid_pos:
                     self.pickups.append(Pickup(kind, valid_pos[0], valid_pos[1]))
         # Agregar flash breve (0.15s)
-        self.kill_flashes.append((enemy.rect.copy(), 0.15))
+        self.kill_flashes.append(self.kill_flash_pool.acquire(enemy.rect, 0.15))
 
     def try_pickup(self) -> None:
         remaining: list[Pickup] = []
@@ -1379,7 +1538,7 @@ class PlayScene(Scene):
             # Área de detección más grande
             detection_area = chest.rect.inflate(60, 60)
             if not chest.opened and detection_area.colliderect(self.player.rect):
-                item_type = chest.open(self.inventory)
+                item_type = chest.open(self.inventory, self.rng.stream('chests'))
                 if item_type:
                     # Crear el item correspondiente y aplicar efecto según el tipo
                     if item_type == 'speed_boots':
@@ -1440,54 +1599,10 @@ class PlayScene(Scene):
                 break
 
     # ---------- Dungeon helpers ----------
-    def draw_inventory_slots(self, surface: pygame.Surface) -> None:
-        # Tres slots: Bombas, Llaves y Flechas
-        base_x = WIDTH - 240
-        base_y = HEIGHT - 58
-        slot_w = 64
-        slot_h = 40
-        gap = 12
-
-        # Slot Bombas
-        rect_b = pygame.Rect(base_x, base_y, slot_w, slot_h)
-        pygame.draw.rect(surface, (40, 40, 40), rect_b, border_radius=6)
-        pygame.draw.rect(surface, (120, 120, 120), rect_b, 2, border_radius=6)
-        # Ícono simple de bomba (círculo y mecha)
-        pygame.draw.circle(surface, (200, 200, 200), (rect_b.x + 14, rect_b.y + 20), 8)
-        pygame.draw.line(surface, (220, 180, 80), (rect_b.x + 20, rect_b.y + 12), (rect_b.x + 28, rect_b.y + 8), 2)
-        txt_b = self.font.render(f"x{self.inventory.bombs}", True, WHITE)
-        surface.blit(txt_b, (rect_b.x + 34, rect_b.y + 10))
-
-        # Slot Llaves
-        rect_k = pygame.Rect(base_x + slot_w + gap, base_y, slot_w, slot_h)
-        pygame.draw.rect(surface, (40, 40, 40), rect_k, border_radius=6)
-        pygame.draw.rect(surface, (120, 120, 120), rect_k, 2, border_radius=6)
-        
-        # Dibujar sprite de llave o ícono simple como respaldo
-        if hasattr(self, 'key_img') and self.key_img is not None:
-            # Calcular posición centrada verticalmente en el slot
-            key_x = rect_k.x + 12
-            key_y = rect_k.y + (slot_h - self.key_img.get_height()) // 2
-            surface.blit(self.key_img, (key_x, key_y))
-        else:
-            # Respaldo: ícono simple de llave
-            pygame.draw.circle(surface, (255, 215, 0), (rect_k.x + 14, rect_k.y + 20), 6)
-            pygame.draw.rect(surface, (255, 215, 0), (rect_k.x + 20, rect_k.y + 18, 14, 4))
-            pygame.draw.rect(surface, (255, 215, 0), (rect_k.x + 30, rect_k.y + 16, 3, 8))
-            
-        # Mostrar cantidad de llaves
-        txt_k = self.font.render(f"x{self.inventory.keys}", True, WHITE)
-        surface.blit(txt_k, (rect_k.x + 40, rect_k.y + 10))
-
-        # Slot Flechas (invisible)
-        # rect_a = pygame.Rect(base_x + (slot_w + gap) * 2, base_y, slot_w, slot_h)
-        # pygame.draw.rect(surface, (40, 40, 40), rect_a, border_radius=6)
-        # pygame.draw.rect(surface, (120, 120, 120), rect_a, 2, border_radius=6)
-        # # Ícono simple de flecha
-        # pygame.draw.line(surface, (200, 200, 200), (rect_a.x + 10, rect_a.y + 28), (rect_a.x + 28, rect_a.y + 12), 2)
-        # pygame.draw.polygon(surface, (200, 200, 200), [(rect_a.x + 30, rect_a.y + 10), (rect_a.x + 22, rect_a.y + 14), (rect_a.x + 26, rect_a.y + 6)])
-        # txt_a = self.font.render(f"x{self.inventory.arrows}", True, WHITE)
-        # surface.blit(txt_a, (rect_a.x + 40, rect_a.y + 10))
+    def draw_inventory_slots(self, surface: pygame.Surface) -> pygame.Rect:
+        # Slots de bombas y llaves; devuelve el rect dibujado
+        return self.hud.draw_inventory(surface, self.inventory)
+
     def draw_grid(self, surface: pygame.Surface) -> None:
         """Dibuja una cuadrícula sobre la habitación actual."""
         # Hacemos la cuadrícula invisible devolviendo temprano
@@ -1549,32 +1664,14 @@ class PlayScene(Scene):
                 
             door_rect = room.door_rect(d)
             
-            # Cargar el sprite de la puerta según la dirección y estado (abierta/cerrada)
+            # Sprite de la puerta según la dirección y estado (abierta/cerrada),
+            # ya escalado al tamaño del rectángulo de la puerta
             try:
                 base_path = 'assets/structure/'
-                if door.open:
-                    # Usar sprites door1 cuando está abierta
-                    if d == 'up':
-                        door_img = pygame.image.load(f'{base_path}door1.png').convert_alpha()
-                    elif d == 'down':
-                        door_img = pygame.image.load(f'{base_path}door1down.png').convert_alpha()
-                    elif d == 'left':
-                        door_img = pygame.image.load(f'{base_path}door1left.png').convert_alpha()
-                    else:  # right
-                        door_img = pygame.image.load(f'{base_path}door1right.png').convert_alpha()
-                else:
-                    # Usar sprites door2 cuando está cerrada
-                    if d == 'up':
-                        door_img = pygame.image.load(f'{base_path}door2.png').convert_alpha()
-                    elif d == 'down':
-                        door_img = pygame.image.load(f'{base_path}door2down.png').convert_alpha()
-                    elif d == 'left':
-                        door_img = pygame.image.load(f'{base_path}door2left.png').convert_alpha()
-                    else:  # right
-                        door_img = pygame.image.load(f'{base_path}door2right.png').convert_alpha()
-                
-                # Escalar la imagen al tamaño del rectángulo de la puerta
-                door_img = pygame.transform.scale(door_img, (door_rect.width, door_rect.height))
+                # door1 cuando está abierta, door2 cuando está cerrada
+                prefix = 'door1' if door.open else 'door2'
+                suffix = '' if d == 'up' else d
+                door_img = load_image(f'{base_path}{prefix}{suffix}.png', door_rect.size)
                 
                 # Dibujar la puerta
                 surface.blit(door_img, door_rect)
@@ -1582,6 +1679,7 @@ class PlayScene(Scene):
             except Exception as e:
                 # En caso de error, volver al método de dibujo original
                 print(f"Error cargando sprite de puerta: {e}")
+                self._door_sprites_missing = True
                 base_color = (80, 200, 120) if door.open else ((200, 160, 40) if door.locked else (160, 160, 160))
                 color = base_color
                 if door.open and self.door_feedback_timer > 0:
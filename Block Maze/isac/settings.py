@@ -79,24 +79,64 @@ DIFFICULTY_PRESETS = {
     },
 }
 
-# Get the screen dimensions
+# Pantalla: se resuelve la primera vez que alguien pide WIDTH/HEIGHT (ver __getattr__ al final),
+# así importar la configuración no inicializa pygame ni consulta el monitor
+import os
 import pygame
-pygame.init()
-info = pygame.display.Info()
-SCREEN_WIDTH = info.current_w
-SCREEN_HEIGHT = info.current_h
+# Modo sin ventana ni audio (ver isac.core.headless)
+HEADLESS = os.environ.get('ISAC_HEADLESS') == '1'
+# Semilla fija de la partida (isac.core.rng); None = una nueva en cada partida.
+# Se fija con la variable de entorno ISAC_SEED o con `python juego.py --seed N`
+RUN_SEED = int(os.environ['ISAC_SEED']) if os.environ.get('ISAC_SEED', '').lstrip('-').isdigit() else None
 
-# Set game dimensions to 80% of screen size for better visibility
-WIDTH = int(SCREEN_WIDTH * 0.9)
-HEIGHT = int(SCREEN_HEIGHT * 0.9)
 
-# Ensure minimum size for playability
-WIDTH = max(WIDTH, 800)
-HEIGHT = max(HEIGHT, 600)
+class ScreenConfig:
+    """Tamaño de pantalla y de ventana, calculados en el primer uso."""
+
+    def __init__(self) -> None:
+        self._values: dict | None = None
+
+    def resolve(self) -> dict:
+        if self._values is None:
+            # ISAC_WINDOW_SIZE=1920x1080 fija el tamaño de la ventana (benchmarks, capturas)
+            forced = os.environ.get('ISAC_WINDOW_SIZE', '').lower().split('x')
+            if len(forced) == 2 and all(v.isdigit() for v in forced):
+                width, height = int(forced[0]), int(forced[1])
+                self._values = {
+                    'SCREEN_WIDTH': width,
+                    'SCREEN_HEIGHT': height,
+                    'WIDTH': width,
+                    'HEIGHT': height,
+                }
+                return self._values
+            if not pygame.display.get_init():
+                pygame.display.init()
+            info = pygame.display.Info()
+            screen_width = info.current_w
+            screen_height = info.current_h
+            # Set game dimensions to 90% of screen size for better visibility,
+            # ensuring a minimum size for playability
+            self._values = {
+                'SCREEN_WIDTH': screen_width,
+                'SCREEN_HEIGHT': screen_height,
+                'WIDTH': max(int(screen_width * 0.9), 800),
+                'HEIGHT': max(int(screen_height * 0.9), 600),
+            }
+        return self._values
+
+
+screen_config = ScreenConfig()
 
 FPS = 60
+# Bucle de paso fijo (isac.core.game): la simulación avanza siempre en pasos de 1/SIM_HZ
+SIM_HZ = 120
+MAX_SIM_STEPS = 8  # pasos máximos por frame antes de descartar tiempo atrasado
+RENDER_FPS = FPS  # límite de frames dibujados por segundo; 0 = sin límite
 TITLE = "Isac"
 
+# Presupuesto de memoria de la caché de texturas (isac.core.assets)
+ASSET_CACHE_BUDGET_MB = 64
+
 # Colores (R, G, B)
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -111,6 +151,8 @@ CYAN = (70, 200, 220)
 PLAYER_SPEED = 250
 BULLET_SPEED = 500
 ENEMY_SPEED = 140
+ENEMY_PROJECTILE_SPEED = 300
+ENEMY_PROJECTILE_DAMAGE = 2  # sniper y monster quitan 2 de vida
 
 PLAYER_SIZE = 40  # Player size remains the same
 ENEMY_SIZE = 72  # Doubled from 36
@@ -118,6 +160,9 @@ BULLET_RADIUS = 6  # Original size (was 12, which was double the original)
 ARROW_SPEED = 520
 ARROW_SIZE = 32  # Doubled from 16 (originally 8)
 ARROW_DAMAGE = 1
+# Ángulos precalculados por sprite (ver isac.core.rotation)
+ARROW_ROTATION_STEPS = 8
+PROJECTILE_ROTATION_STEPS = 32
 
 PLAYER_MAX_HP = 10
 PLAYER_INVULN_TIME = 1.0  # segundos tras recibir daño
@@ -132,6 +177,52 @@ MELEE_DAMAGE = 1
 SHIELD_MAGIC_COST_PER_SEC = 25  # gastar magia por segundo al mantener escudo
 HUD_HEART_SIZE = 32  # Doubled from 16 to match other size increases
 
+# Tamaño de celda (px) de la fase ancha de colisiones entre entidades dinámicas
+BROADPHASE_CELL_SIZE = 128
+
+# Generar el piso siguiente en un hilo mientras se explora el actual (isac.core.dungeon)
+DUNGEON_PREFETCH = True
+# El piso siguiente empieza a construirse cuando quedan estas salas sin visitar
+# (antes ocuparía memoria y CPU durante todo el piso; en un calabozo enorme, el doble de memoria)
+DUNGEON_PREFETCH_REMAINING = 5
+# Calabozo enorme para partidas largas: nº de salas por piso (0 = calabozo normal).
+# Se fija con la variable de entorno ISAC_HUGE_DUNGEON o con `python juego.py --huge-dungeon N`
+HUGE_DUNGEON_ROOMS = int(os.environ['ISAC_HUGE_DUNGEON']) if os.environ.get('ISAC_HUGE_DUNGEON', '').isdigit() else 0
+# Fracción de las celdas del mapa que ocupan las salas de un calabozo enorme
+HUGE_DUNGEON_DENSITY = 0.5
+
+# Campo de flujo (isac.core.flowfield): los enemigos rodean obstáculos siguiendo una BFS desde el jugador
+FLOW_FIELD_ENABLED = True
+
+# Persecución en lote con NumPy (isac.entities.steering) a partir de este nº de perseguidores
+STEERING_BATCH_ENABLED = True
+STEERING_BATCH_MIN = 16
+
+# Renderizado por capas: volcar solo los rects que cambian cuando no hay shake ni fade
+DIRTY_RECTS_ENABLED = True
+DIRTY_RECT_PAD = 32  # margen (px) alrededor de cada entidad al marcarla como sucia
+
+# Mapa (isac.core.map): M abre el mapa grande, N muestra/oculta el minimapa de la esquina
+MAP_KEY = pygame.K_m
+MINIMAP_CORNER_KEY = pygame.K_n
+MINIMAP_CORNER_ENABLED = True
+MINIMAP_CORNER_CELLS = 9  # salas por lado que se ven en el minimapa de la esquina
+MINIMAP_CORNER_CELL_SIZE = 10
+MINIMAP_VIEW_CELLS = 25  # salas por lado del mapa grande; si el calabozo es mayor, la vista sigue al jugador
+
+# Tiempos por fase de cada frame (isac.core.profiler): F3 muestra el panel, F4 exporta a CSV
+PROFILER_ENABLED = True
+PROFILER_HISTORY = 600  # frames guardados en el buffer circular
+PROFILER_OVERLAY_REFRESH = 15  # frames entre redibujados del panel
+PROFILER_OVERLAY_KEY = pygame.K_F3
+PROFILER_EXPORT_KEY = pygame.K_F4
+
+# HUD (isac.core.hud): textos renderizados que se guardan por (fuente, texto, color)
+TEXT_CACHE_SIZE = 256
+# Usar el arte de barra de vida de HUD_HP_SPRITES en lugar de corazones (si los archivos
+# existen; si falta alguno se usan corazones sin avisar)
+HUD_HP_SPRITES_ENABLED = True
+
 # --- CONFIGURACIÓN DE SPRITES DE VIDA (NUEVO) ---
 # Diccionario que mapea la HP actual a la ruta del sprite.
 HUD_HP_SPRITES = {
@@ -183,4 +274,13 @@ LOOT_WEIGHTS = {
     'arrow': 0.5,
     'magic': 0.35,
     'key': 0.15,
-}
\ No newline at end of file
+}
+
+
+def __getattr__(name: str):
+    # Constantes de pantalla perezosas: `from isac.settings import WIDTH` llega aquí la primera vez
+    values = screen_config.resolve()
+    if name in values:
+        globals().update(values)
+        return values[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
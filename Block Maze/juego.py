@@ -1,9 +1,60 @@
-import pygame
-from isac.core.game import Game
-from isac.scenes.menu import MenuScene
+import time
+
+# Origen del perfil de arranque (--profile-startup)
+_T0 = time.perf_counter()
+
+import argparse
+import os
+import sys
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Block Maze")
+    parser.add_argument('--headless', type=int, metavar='TICKS',
+                        help='simular TICKS pasos de PlayScene sin ventana ni audio y salir')
+    parser.add_argument('--no-render', action='store_true',
+                        help='con --headless, no dibujar (solo simulación)')
+    parser.add_argument('--profile-csv', metavar='RUTA',
+                        help='con --headless, exportar los tiempos por fase a un CSV')
+    parser.add_argument('--seed', type=int,
+                        help='semilla de la partida (misma semilla, mismo calabozo)')
+    parser.add_argument('--huge-dungeon', type=int, metavar='SALAS',
+                        help='calabozo enorme de SALAS habitaciones por piso (1000-100000), para partidas largas')
+    parser.add_argument('--profile-startup', action='store_true',
+                        help='medir el tiempo de importación y arranque hasta el menú')
+    parser.add_argument('--startup-probe', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.seed is not None:
+        # Debe fijarse antes de importar isac.settings (RUN_SEED)
+        os.environ['ISAC_SEED'] = str(args.seed)
+    if args.huge_dungeon is not None:
+        # Igual que la semilla: HUGE_DUNGEON_ROOMS se lee al importar isac.settings
+        os.environ['ISAC_HUGE_DUNGEON'] = str(args.huge_dungeon)
+
+    if args.profile_startup:
+        from isac.core.startup import profile_startup
+        sys.exit(profile_startup(__file__))
+    if args.startup_probe:
+        from isac.core.startup import run_probe
+        run_probe(_T0)
+        return
+
+    if args.headless is not None:
+        # Debe activarse antes de importar isac.settings
+        from isac.core.headless import enable_headless, run_headless
+        enable_headless()
+        stats = run_headless(args.headless, render=not args.no_render)
+        print(f"{stats['ticks']} ticks ({stats['simulated_seconds']:.1f} s simulados) "
+              f"en {stats['seconds']:.2f} s: {stats['ticks_per_second']:.0f} ticks/s")
+        if args.profile_csv:
+            from isac.core.profiler import profiler
+            print(f"Tiempos por fase exportados a {profiler.export_csv(args.profile_csv)}")
+        return
+
+    from isac.core.game import Game
+    from isac.scenes.loading import LoadingScene
+    Game(LoadingScene).run()
+
 
 if __name__ == "__main__":
-    Game(MenuScene).run()
-    
-    
-    
\ No newline at end of file
+    main()